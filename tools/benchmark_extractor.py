@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de l'Extracteur de Slides
+===================================
+
+Mesure les performances de slide_extractor.py sur des présentations
+synthétiques générées à échelle paramétrable, et détecte les régressions
+par rapport à une baseline enregistrée.
+
+Workflow:
+1. Génère des decks synthétiques N slides × M shapes × K runs par paragraphe
+   à partir de configurations LayoutBasedPresentationBuilder
+2. Mesure, dans un processus isolé par deck : ouverture du PPTXPackage,
+   latence de SlideExtractor.extract_metadata par slide, débit total et RSS max
+3. Compare à une baseline JSON et échoue si une métrique régresse au-delà du seuil
+
+Usage:
+    python tools/benchmark_extractor.py --scale 57x6x3
+    python tools/benchmark_extractor.py --scale 10x4x1 --scale 60x8x4 --save-baseline baseline.json
+    python tools/benchmark_extractor.py --baseline baseline.json --max-regression 10
+    python tools/benchmark_extractor.py --deck templates/Template_PT.pptx --repeat 10
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import json_backend
+
+# Métriques comparées à la baseline : True si une valeur plus haute est meilleure
+BENCHMARK_METRICS = {
+    "open_ms": False,
+    "slide_p50_ms": False,
+    "slide_p95_ms": False,
+    "slide_max_ms": False,
+    "total_ms": False,
+    "slides_per_second": True,
+    "peak_rss_mb": False,
+}
+
+# Échelles par défaut : petit deck et deck de la taille du template Premier Tech
+DEFAULT_SCALES = ["10x4x1", "57x6x3"]
+
+# Seuil de régression par défaut (pourcentage)
+DEFAULT_MAX_REGRESSION = 10.0
+
+
+# =============================================================================
+# GÉNÉRATION DE DECKS SYNTHÉTIQUES
+# =============================================================================
+
+def parse_scale(scale: str) -> Tuple[int, int, int]:
+    """
+    Parse une échelle de type "NxMxK".
+
+    Args:
+        scale: Slides × shapes par slide × runs par paragraphe (ex: "57x6x3")
+
+    Returns:
+        Tuple (slides, shapes, runs)
+
+    Raises:
+        ValueError: Si l'échelle est invalide
+    """
+    parts = scale.lower().split("x")
+    if len(parts) != 3 or not all(part.isdigit() and int(part) > 0 for part in parts):
+        raise ValueError(f"Échelle invalide '{scale}' (attendu: NxMxK, ex: 57x6x3)")
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+def build_synthetic_config(layout_names: List[str], slides: int, shapes: int,
+                           deck_name: str) -> Dict[str, Any]:
+    """
+    Construit une configuration LayoutBasedPresentationBuilder synthétique.
+
+    Les layouts sont utilisés à tour de rôle. Chaque shape reçoit un texte de
+    trois paragraphes ; les shapes absentes du layout sont ajoutées ensuite
+    par populate_synthetic_deck.
+
+    Args:
+        layout_names: Layouts disponibles dans le builder
+        slides: Nombre de slides
+        shapes: Nombre de shapes par slide
+        deck_name: Nom de la présentation
+
+    Returns:
+        Dict: Configuration JSON du builder
+    """
+    slide_configs = []
+    for slide_index in range(slides):
+        layout_name = layout_names[slide_index % len(layout_names)]
+        slide_configs.append({
+            "layout_name": layout_name,
+            "shapes": [
+                {
+                    "shape_id": shape_id,
+                    "text": "\n".join(f"Slide {slide_index + 1} shape {shape_id} paragraphe {p}"
+                                      for p in range(1, 4))
+                }
+                for shape_id in range(1, shapes + 1)
+            ]
+        })
+
+    return {
+        "presentation_name": deck_name,
+        "subject": "benchmark",
+        "audience": deck_name,
+        "is_test": True,
+        "slides": slide_configs,
+        "output_path": f"{deck_name}.pptx"
+    }
+
+
+def populate_synthetic_deck(pptx_path: str, shapes: int, runs: int):
+    """
+    Complète un deck généré : shapes manquantes et K runs par paragraphe.
+
+    Le builder ne remplit que les placeholders existants du layout et crée un
+    seul run par paragraphe. Les shapes manquantes sont ajoutées en zones de
+    texte, puis chaque paragraphe est découpé en runs au formatage alterné
+    (pour éviter toute fusion des runs).
+
+    Args:
+        pptx_path: Deck généré par le builder (modifié sur place)
+        shapes: Nombre minimal de shapes texte par slide
+        runs: Nombre de runs par paragraphe
+    """
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    presentation = Presentation(pptx_path)
+
+    for slide_index, slide in enumerate(presentation.slides, start=1):
+        # Ajouter les shapes manquantes
+        text_shapes = [shape for shape in slide.shapes if shape.has_text_frame]
+        for extra in range(len(text_shapes), shapes):
+            textbox = slide.shapes.add_textbox(Inches(0.5 + (extra % 4) * 2.2), Inches(0.5 + (extra // 4) * 1.2),
+                                               Inches(2), Inches(1))
+            textbox.text_frame.text = "\n".join(f"Slide {slide_index} zone {extra + 1} paragraphe {p}"
+                                                for p in range(1, 4))
+
+        # Découper chaque paragraphe en K runs
+        for shape in slide.shapes:
+            if not shape.has_text_frame:
+                continue
+            for paragraph in shape.text_frame.paragraphs:
+                text = "".join(run.text for run in paragraph.runs) or "texte"
+                for run in list(paragraph.runs):
+                    paragraph._p.remove(run._r)
+
+                chunk = max(1, len(text) // runs)
+                for run_index in range(runs):
+                    start = run_index * chunk
+                    end = len(text) if run_index == runs - 1 else start + chunk
+                    run = paragraph.add_run()
+                    run.text = text[start:end] or " "
+                    run.font.bold = run_index % 2 == 1
+                    run.font.size = Pt(12 + (run_index % 3) * 2)
+
+    presentation.save(pptx_path)
+
+
+def generate_synthetic_deck(scale: str, work_dir: str) -> str:
+    """
+    Génère un deck synthétique via LayoutBasedPresentationBuilder.
+
+    Args:
+        scale: Échelle "NxMxK"
+        work_dir: Dossier de travail (la sortie du builder y est confinée)
+
+    Returns:
+        str: Chemin absolu du deck généré
+    """
+    from presentation_builder import LayoutBasedPresentationBuilder
+
+    slides, shapes, runs = parse_scale(scale)
+    deck_name = f"bench_{slides}x{shapes}x{runs}"
+    work_dir = os.path.abspath(work_dir)
+    os.makedirs(work_dir, exist_ok=True)
+
+    builder = LayoutBasedPresentationBuilder()
+    layout_names = sorted(builder.layout_mapping)
+    if not layout_names:
+        raise ValueError("Aucun layout disponible dans slide-structure")
+
+    config_path = os.path.join(work_dir, f"{deck_name}.json")
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json_backend.dump(build_synthetic_config(layout_names, slides, shapes, deck_name), f)
+
+    # Le builder normalise l'output relativement au répertoire courant
+    previous_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        output_path = os.path.abspath(builder.build_presentation(config_path))
+    finally:
+        os.chdir(previous_cwd)
+
+    populate_synthetic_deck(output_path, shapes, runs)
+    print(f"[GENERATED] {deck_name}: {output_path}")
+    return output_path
+
+
+# =============================================================================
+# MESURES
+# =============================================================================
+
+def _peak_rss_mb() -> Optional[float]:
+    """Retourne le RSS maximal du processus courant en Mo (None si indisponible)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en Ko sous Linux, en octets sous macOS
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Percentile par rang le plus proche."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure_deck(pptx_path: str, repeat: int) -> Dict[str, Any]:
+    """
+    Mesure l'extraction complète d'un deck (à exécuter dans un processus isolé).
+
+    Chaque répétition ouvre un nouveau PPTXPackage et extrait toutes les slides.
+    Les temps d'ouverture et totaux sont des médianes ; les latences par slide
+    agrègent toutes les répétitions.
+
+    Args:
+        pptx_path: Deck à mesurer
+        repeat: Nombre de passes complètes
+
+    Returns:
+        Dict: Métriques du deck
+    """
+    from slide_extractor import PPTXPackage, SlideExtractor
+
+    open_times = []
+    total_times = []
+    slide_times = []
+    slide_count = 0
+
+    for _ in range(repeat):
+        pass_start = time.perf_counter()
+        package = PPTXPackage(pptx_path)
+        slide_parts = package.get_slide_parts()
+        open_times.append(time.perf_counter() - pass_start)
+
+        try:
+            for slide_part_name in slide_parts:
+                slide_start = time.perf_counter()
+                SlideExtractor(package, slide_part_name).extract_metadata()
+                package.release_part(slide_part_name)
+                slide_times.append(time.perf_counter() - slide_start)
+        finally:
+            package.close()
+
+        total_times.append(time.perf_counter() - pass_start)
+        slide_count = len(slide_parts)
+
+    total_median = statistics.median(total_times)
+    return {
+        "slides": slide_count,
+        "repeat": repeat,
+        "open_ms": statistics.median(open_times) * 1000,
+        "slide_p50_ms": _percentile(slide_times, 50) * 1000 if slide_times else 0.0,
+        "slide_p95_ms": _percentile(slide_times, 95) * 1000 if slide_times else 0.0,
+        "slide_max_ms": max(slide_times) * 1000 if slide_times else 0.0,
+        "total_ms": total_median * 1000,
+        "slides_per_second": slide_count / total_median if total_median > 0 else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def measure_deck_isolated(pptx_path: str, repeat: int) -> Dict[str, Any]:
+    """
+    Mesure un deck dans un processus neuf (spawn) pour un RSS max non pollué.
+
+    Args:
+        pptx_path: Deck à mesurer
+        repeat: Nombre de passes complètes
+
+    Returns:
+        Dict: Métriques du deck
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure_deck, pptx_path, repeat).result()
+
+
+# =============================================================================
+# BASELINE
+# =============================================================================
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        max_regression: float) -> List[str]:
+    """
+    Compare les résultats à une baseline.
+
+    Args:
+        results: Métriques par scénario
+        baseline: Métriques de référence par scénario
+        max_regression: Régression maximale tolérée (pourcentage)
+
+    Returns:
+        List[str]: Descriptions des régressions au-delà du seuil
+    """
+    regressions = []
+
+    for scenario, metrics in results.items():
+        reference = baseline.get(scenario)
+        if reference is None:
+            print(f"[WARNING] Scénario absent de la baseline: {scenario}")
+            continue
+
+        for metric, higher_is_better in BENCHMARK_METRICS.items():
+            current = metrics.get(metric)
+            expected = reference.get(metric)
+            if current is None or not expected:
+                continue
+
+            if higher_is_better:
+                change = (expected - current) / expected * 100
+            else:
+                change = (current - expected) / expected * 100
+
+            marker = "REGRESSION" if change > max_regression else "OK"
+            print(f"[{marker}] {scenario} {metric}: {expected:.2f} -> {current:.2f} ({change:+.1f}%)")
+
+            if change > max_regression:
+                regressions.append(f"{scenario} {metric}: {change:+.1f}% (seuil {max_regression:.1f}%)")
+
+    return regressions
+
+
+def load_baseline(baseline_path: str) -> Dict[str, Dict[str, Any]]:
+    """Charge les métriques de référence d'un fichier baseline."""
+    with open(baseline_path, 'rb') as f:
+        return json_backend.load(f).get("scenarios", {})
+
+
+def save_results(results: Dict[str, Dict[str, Any]], output_path: str):
+    """Sauvegarde les résultats (réutilisables comme baseline)."""
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json_backend.dump({
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "scenarios": results
+        }, f, sort_keys=True)
+        f.write("\n")
+
+    print(f"[SUCCESS] Résultats sauvegardés dans {output_path}")
+
+
+def print_results(results: Dict[str, Dict[str, Any]]):
+    """Affiche un tableau récapitulatif des métriques."""
+    print(f"\n=== RÉSULTATS BENCHMARK ===")
+    print(f"{'Scénario':<24} {'Slides':>6} {'Open ms':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'Max ms':>8} {'Total ms':>9} {'Slides/s':>9} {'RSS Mo':>8}")
+
+    for scenario, metrics in results.items():
+        rss = metrics["peak_rss_mb"]
+        print(f"{scenario:<24} {metrics['slides']:>6} {metrics['open_ms']:>9.2f} "
+              f"{metrics['slide_p50_ms']:>8.2f} {metrics['slide_p95_ms']:>8.2f} "
+              f"{metrics['slide_max_ms']:>8.2f} {metrics['total_ms']:>9.1f} "
+              f"{metrics['slides_per_second']:>9.1f} {('-' if rss is None else f'{rss:.1f}'):>8}")
+
+
+def main():
+    """Interface en ligne de commande."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark de débit de slide_extractor.py sur decks synthétiques",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples d'utilisation:
+  # Échelles par défaut (10x4x1 et 57x6x3)
+  python tools/benchmark_extractor.py
+
+  # Échelles personnalisées, enregistrement d'une baseline
+  python tools/benchmark_extractor.py --scale 60x8x4 --save-baseline benchmark/baseline.json
+
+  # Comparaison à la baseline (code de sortie 1 si régression > 10%)
+  python tools/benchmark_extractor.py --baseline benchmark/baseline.json --max-regression 10
+
+  # Mesurer un deck existant
+  python tools/benchmark_extractor.py --deck templates/Template_PT.pptx
+        """
+    )
+
+    parser.add_argument("--scale", action="append",
+                        help="Échelle NxMxK : slides × shapes × runs par paragraphe (répétable)")
+    parser.add_argument("--deck", action="append", help="Deck existant à mesurer (répétable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes complètes par deck (défaut: 5)")
+    parser.add_argument("--work-dir", default="output/benchmark",
+                        help="Dossier des decks générés (défaut: output/benchmark)")
+    parser.add_argument("--baseline", help="Baseline JSON à comparer")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help=f"Régression maximale tolérée en %% (défaut: {DEFAULT_MAX_REGRESSION})")
+    parser.add_argument("--save-baseline", help="Enregistrer les résultats comme baseline")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+
+    args = parser.parse_args()
+
+    scales = args.scale or ([] if args.deck else DEFAULT_SCALES)
+
+    try:
+        # 1. Decks à mesurer
+        decks = []
+        for scale in scales:
+            slides, shapes, runs = parse_scale(scale)
+            decks.append((f"synthetic_{slides}x{shapes}x{runs}", generate_synthetic_deck(scale, args.work_dir)))
+        for deck_path in args.deck or []:
+            if not os.path.exists(deck_path):
+                raise FileNotFoundError(f"Deck non trouvé: {deck_path}")
+            decks.append((f"deck_{Path(deck_path).stem}", os.path.abspath(deck_path)))
+
+        # 2. Mesures, un processus isolé par deck
+        results = {}
+        for scenario, deck_path in decks:
+            print(f"[BENCHMARK] {scenario}: {args.repeat} passes")
+            results[scenario] = measure_deck_isolated(deck_path, args.repeat)
+
+        print_results(results)
+
+        if args.output:
+            save_results(results, args.output)
+        if args.save_baseline:
+            save_results(results, args.save_baseline)
+
+        # 3. Comparaison à la baseline
+        if args.baseline:
+            print(f"\n=== COMPARAISON BASELINE ({args.baseline}) ===")
+            regressions = compare_to_baseline(results, load_baseline(args.baseline), args.max_regression)
+            if regressions:
+                print(f"\n[ERROR] {len(regressions)} régression(s) au-delà de {args.max_regression:.1f}%:")
+                for regression in regressions:
+                    print(f"  - {regression}")
+                sys.exit(1)
+            print(f"\n[SUCCESS] Aucune régression au-delà de {args.max_regression:.1f}%")
+
+    except Exception as e:
+        print(f"[ERROR] Erreur benchmark: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sérialisation JSON des Outils de Présentation
+=============================================
+
+Point unique de lecture/écriture JSON pour slide_extractor.py,
+presentation_builder.py et validation_checker.py : utilise orjson lorsqu'il
+est installé et retombe sur le module json standard sinon.
+
+Deux formats de sortie :
+- indenté (défaut) : fichiers destinés à être lus (structures, rapports)
+- compact (pretty=False) : sorties consommées par des programmes
+  (flux JSONL, caches, manifestes)
+
+Les deux backends partagent la mise en forme : UTF-8 non échappé
+(équivalent de ensure_ascii=False), indentation de 2 espaces en mode indenté,
+séparateurs ',' et ':' en mode compact. Le texte n'est pas pour autant
+identique octet pour octet : orjson écrit certains flottants autrement
+(1e-05 -> 0.00001, 1e+20 -> 1e20) et sérialise NaN/Infinity en null. Tout ce
+qui est haché ou comparé d'une exécution à l'autre doit donc soit enregistrer
+BACKEND (manifeste de régénération), soit passer par le module json standard
+(empreintes de slides du builder).
+"""
+
+import json
+from typing import Any, IO, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Backend actif (affiché dans les messages de debug)
+BACKEND = 'orjson' if ORJSON_AVAILABLE else 'json'
+
+
+def dumps(obj: Any, pretty: bool = True, sort_keys: bool = False) -> str:
+    """
+    Sérialise un objet en texte JSON.
+
+    Args:
+        obj: Objet à sérialiser (dict, list, types JSON de base)
+        pretty: Indentation de 2 espaces si True, format compact sinon
+        sort_keys: Trier les clés des dictionnaires
+
+    Returns:
+        Texte JSON (sans saut de ligne final)
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode('utf-8')
+
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, separators=(',', ':'))
+
+
+def dump(obj: Any, f: IO[str], pretty: bool = True, sort_keys: bool = False):
+    """
+    Écrit un objet en JSON dans un fichier texte ouvert.
+
+    Args:
+        obj: Objet à sérialiser
+        f: Fichier ouvert en écriture texte (UTF-8)
+        pretty: Indentation de 2 espaces si True, format compact sinon
+        sort_keys: Trier les clés des dictionnaires
+    """
+    f.write(dumps(obj, pretty=pretty, sort_keys=sort_keys))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Désérialise un texte JSON.
+
+    Args:
+        data: Texte ou octets JSON (UTF-8)
+
+    Returns:
+        Objet Python
+
+    Raises:
+        ValueError: JSON invalide (json.JSONDecodeError / orjson.JSONDecodeError
+            en dérivent tous les deux)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(f: IO) -> Any:
+    """
+    Lit un fichier JSON ouvert (texte ou binaire).
+
+    Args:
+        f: Fichier ouvert en lecture
+
+    Returns:
+        Objet Python
+    """
+    return loads(f.read())
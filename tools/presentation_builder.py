@@ -25,7 +25,11 @@ import sys
 import json
 import argparse
 import glob
-import shutil
+import hashlib
+import io
+import time
+import contextlib
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -34,6 +38,332 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 
+import json_backend
+
+
+# Dossier (à côté du template) où sont conservés les squelettes dérivés
+SKELETON_CACHE_DIR_NAME = ".skeleton-cache"
+
+# Listes d'une présentation qui référencent des slides par leur sldId
+# (sections PowerPoint 2010+ et diaporamas personnalisés)
+SLIDE_REFERENCE_LIST_TAGS = (
+    '{http://schemas.microsoft.com/office/powerpoint/2010/main}sectionLst',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}custShowLst',
+)
+PRESENTATION_EXT_TAG = '{http://schemas.openxmlformats.org/presentationml/2006/main}ext'
+
+# Nom des fichiers de configuration découverts par --batch dans un dossier
+BATCH_CONFIG_NAME = "config.json"
+
+# Manifeste de build écrit à côté de chaque .pptx (empreintes des slides),
+# utilisé pour la reconstruction incrémentale. Incrémenter la version quand
+# le rendu d'une slide change à configuration égale.
+BUILD_MANIFEST_SUFFIX = ".build-manifest.json"
+BUILD_MANIFEST_VERSION = 2
+
+
+class TemplateCache:
+    """
+    Cache du template Premier Tech parsé, partagé pendant toute la vie du builder.
+
+    Le template n'est ouvert par python-pptx qu'une seule fois. L'index
+    slide source → nom de layout est construit au chargement. Le cache se
+    ré-invalide automatiquement si le fichier change sur disque (mtime/taille,
+    puis confirmation par sha256).
+
+    Le cache fournit aussi le squelette du template : le même package sans
+    aucune slide (masters, layouts, thème et médias des layouts seulement).
+    Il est généré une fois par version du template, conservé sur disque sous
+    une clé sha256 et servi depuis la mémoire à chaque construction.
+    """
+
+    def __init__(self, template_path: Path, skeleton_dir: Optional[Path] = None):
+        """
+        Initialise le cache (chargement paresseux au premier accès).
+
+        Args:
+            template_path: Chemin vers le fichier template .pptx
+            skeleton_dir: Dossier du cache de squelettes
+                (défaut: .skeleton-cache à côté du template)
+        """
+        self.template_path = Path(template_path)
+        self.skeleton_dir = (Path(skeleton_dir) if skeleton_dir
+                             else self.template_path.parent / SKELETON_CACHE_DIR_NAME)
+        self._presentation = None
+        self._slide_layout_names: Dict[int, str] = {}
+        self._stat_signature = None
+        self._sha256 = None
+        self._skeleton_bytes: Optional[bytes] = None
+        self._skeleton_sha256 = None
+
+    def _current_stat_signature(self):
+        """Signature rapide du fichier (mtime en ns + taille)."""
+        stat = self.template_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _compute_sha256(self) -> str:
+        """Calcule le sha256 du fichier template."""
+        digest = hashlib.sha256()
+        with open(self.template_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _is_stale(self) -> bool:
+        """Vérifie si le template a changé depuis le dernier chargement."""
+        if self._sha256 is None:
+            return True
+
+        stat_signature = self._current_stat_signature()
+        if stat_signature == self._stat_signature:
+            return False
+
+        # mtime modifié : confirmer par le contenu (ex: touch, checkout git)
+        sha256 = self._compute_sha256()
+        if sha256 == self._sha256:
+            self._stat_signature = stat_signature
+            return False
+
+        return True
+
+    def _cache_file(self, suffix: str) -> Path:
+        """Fichier du cache de squelettes associé à la version courante du template."""
+        return self.skeleton_dir / f"{self.template_path.stem}.{self._sha256[:16]}{suffix}"
+
+    def _load(self):
+        """
+        Reconstruit l'index slide → layout pour la version courante du template.
+
+        L'index est relu depuis le cache de squelettes s'il existe pour ce
+        sha256 ; sinon le template est parsé et l'index y est enregistré.
+        """
+        self._stat_signature = self._current_stat_signature()
+        self._sha256 = self._compute_sha256()
+        self._presentation = None
+        self._skeleton_bytes = None
+
+        index_path = self._cache_file(".layouts.json")
+        if index_path.exists():
+            try:
+                with open(index_path, 'rb') as f:
+                    cached = json_backend.load(f)
+                self._slide_layout_names = {
+                    int(slide_number): layout_name for slide_number, layout_name in cached.items()
+                }
+                print(f"[TEMPLATE] Index du template lu depuis le cache: "
+                      f"{len(self._slide_layout_names)} slides (sha256 {self._sha256[:12]})")
+                return
+            except (OSError, ValueError) as e:
+                print(f"[WARNING] Index du template en cache illisible ({e}), reconstruction")
+
+        self._presentation = Presentation(str(self.template_path))
+        self._slide_layout_names = {
+            slide_number: slide.slide_layout.name
+            for slide_number, slide in enumerate(self._presentation.slides, start=1)
+        }
+
+        try:
+            self.skeleton_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json_backend.dump(self._slide_layout_names, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            print(f"[WARNING] Impossible d'écrire l'index du template en cache: {e}")
+
+        print(f"[TEMPLATE] Template chargé en cache: {len(self._slide_layout_names)} slides "
+              f"(sha256 {self._sha256[:12]})")
+
+    @property
+    def presentation(self) -> Presentation:
+        """Présentation template parsée (rechargée si le fichier a changé)."""
+        if self._is_stale():
+            self._load()
+        if self._presentation is None:
+            self._presentation = Presentation(str(self.template_path))
+        return self._presentation
+
+    @property
+    def sha256(self) -> str:
+        """Empreinte sha256 du template actuellement en cache."""
+        if self._is_stale():
+            self._load()
+        return self._sha256
+
+    @property
+    def slide_count(self) -> int:
+        """Nombre de slides du template."""
+        if self._is_stale():
+            self._load()
+        return len(self._slide_layout_names)
+
+    def get_source_layout_name(self, slide_number: int) -> str:
+        """
+        Retourne le nom du layout utilisé par une slide du template.
+
+        Args:
+            slide_number: Numéro de slide dans le template (1-based)
+
+        Returns:
+            str: Nom du layout de la slide source
+        """
+        if self._is_stale():
+            self._load()
+
+        if slide_number not in self._slide_layout_names:
+            raise ValueError(f"Slide {slide_number} n'existe pas dans le template")
+
+        return self._slide_layout_names[slide_number]
+
+    @property
+    def skeleton_path(self) -> Path:
+        """Chemin du squelette sur disque pour la version courante du template."""
+        if self._is_stale():
+            self._load()
+        return self._cache_file(".pptx")
+
+    def _build_skeleton(self, skeleton_path: Path):
+        """
+        Génère le squelette du template (toutes les slides retirées).
+
+        Les relations vers les slides sont supprimées de presentation.xml ;
+        python-pptx n'écrit que les parts encore atteignables, donc les slides,
+        leurs notes et les médias qu'elles seules utilisent disparaissent du
+        package. Les sections et diaporamas personnalisés, qui référencent des
+        slides par sldId, sont retirés aussi.
+
+        Args:
+            skeleton_path: Fichier .pptx de destination
+        """
+        presentation = Presentation(str(self.template_path))
+        sld_id_lst = presentation.slides._sldIdLst
+
+        for sld_id in list(sld_id_lst):
+            presentation.part.drop_rel(sld_id.rId)
+            sld_id_lst.remove(sld_id)
+
+        prs_element = presentation.part._element
+        for tag in SLIDE_REFERENCE_LIST_TAGS:
+            for element in list(prs_element.iter(tag)):
+                # sectionLst est enveloppé dans un p:ext qui ne doit pas rester vide
+                parent = element.getparent()
+                if parent.tag == PRESENTATION_EXT_TAG and len(parent) == 1:
+                    element, parent = parent, parent.getparent()
+                parent.remove(element)
+
+        # Écriture atomique : un build concurrent ne lit jamais un squelette partiel
+        skeleton_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = skeleton_path.with_name(f"{skeleton_path.name}.{os.getpid()}.tmp")
+        presentation.save(str(temp_path))
+        os.replace(temp_path, skeleton_path)
+
+        # Les fichiers des anciennes versions du template ne servent plus
+        current_prefix = skeleton_path.name[:-len(".pptx")]
+        for old_path in skeleton_path.parent.glob(f"{self.template_path.stem}.*"):
+            if (old_path.name.startswith(current_prefix) or old_path.name.endswith(".tmp")
+                    or old_path.resolve() == self.template_path.resolve()):
+                continue
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+        print(f"[TEMPLATE] Squelette généré: {skeleton_path} "
+              f"({len(self._slide_layout_names)} slides retirées)")
+
+    def _ensure_skeleton(self) -> bytes:
+        """Charge le squelette en mémoire (généré sur disque au besoin) et le retourne."""
+        sha256 = self.sha256
+        if self._skeleton_bytes is None or self._skeleton_sha256 != sha256:
+            skeleton_path = self.skeleton_path
+            if not skeleton_path.exists():
+                self._build_skeleton(skeleton_path)
+            self._skeleton_bytes = skeleton_path.read_bytes()
+            self._skeleton_sha256 = sha256
+        return self._skeleton_bytes
+
+    @property
+    def skeleton_bytes(self) -> bytes:
+        """Contenu du squelette (généré sur disque au besoin, puis gardé en mémoire)."""
+        return self._ensure_skeleton()
+
+    def preload(self):
+        """
+        Charge dès maintenant l'index du template et le squelette en mémoire.
+
+        Appelé avant un fork pour que les processus enfants en héritent
+        au lieu de les relire chacun.
+        """
+        self._ensure_skeleton()
+
+    def open_skeleton(self) -> Presentation:
+        """
+        Ouvre une nouvelle présentation vide à partir du squelette.
+
+        Returns:
+            Presentation: Présentation sans slide, prête à recevoir les slides
+        """
+        return Presentation(io.BytesIO(self.skeleton_bytes))
+
+
+class SlideLayoutIndex:
+    """
+    Index nom de layout → SlideLayout d'une présentation cible.
+
+    Construit une seule fois par présentation (au lieu d'un parcours linéaire
+    de slide_layouts pour chaque slide ajoutée). Les noms de layouts en double
+    (ex: même nom sous deux masters) sont détectés et signalés à la
+    construction : le premier layout rencontré dans l'ordre des masters est
+    conservé, comme le faisait l'ancien parcours.
+    """
+
+    def __init__(self, presentation: Presentation):
+        """
+        Indexe les layouts de tous les masters de la présentation.
+
+        Args:
+            presentation: Présentation python-pptx à indexer
+        """
+        self.presentation = presentation
+        self._layouts: Dict[str, Any] = {}
+        self.duplicates: Dict[str, int] = {}
+
+        for master in presentation.slide_masters:
+            for layout in master.slide_layouts:
+                if layout.name in self._layouts:
+                    self.duplicates[layout.name] = self.duplicates.get(layout.name, 1) + 1
+                    continue
+                self._layouts[layout.name] = layout
+
+        for name, count in sorted(self.duplicates.items()):
+            print(f"[WARNING] Layout '{name}' défini {count} fois dans la présentation cible "
+                  f"(premier conservé)")
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def __contains__(self, layout_name: str) -> bool:
+        return layout_name in self._layouts
+
+    def get(self, layout_name: str) -> Any:
+        """
+        Retourne le SlideLayout portant ce nom.
+
+        Args:
+            layout_name: Nom du layout recherché
+
+        Returns:
+            SlideLayout correspondant
+
+        Raises:
+            ValueError: Aucun layout de ce nom dans la présentation
+        """
+        layout = self._layouts.get(layout_name)
+        if layout is None:
+            raise ValueError(f"Layout '{layout_name}' non trouvé dans la présentation cible "
+                             f"({len(self._layouts)} layouts disponibles)")
+        return layout
+
 
 class LayoutBasedPresentationBuilder:
     """
@@ -60,12 +390,25 @@ class LayoutBasedPresentationBuilder:
         if not self.slide_structures_path.exists():
             raise FileNotFoundError(f"Dossier slide-structure non trouvé: {self.slide_structures_path}")
 
-        # Construire le mapping layout_name → slide_number
+        # Construire le mapping layout_name → slide_number et son inverse
         self.layout_mapping = self._build_layout_mapping()
+        self.slide_number_mapping = self._build_slide_number_mapping()
 
         # Charger les enums Premier Tech pour validation
         self.premier_tech_enums = self._load_premier_tech_enums()
 
+        # Cache du template parsé (chargé une seule fois pour tout le build)
+        self.template_cache = TemplateCache(self.template_path)
+
+        # Index des layouts de la présentation en cours de construction
+        self._target_layout_index: Optional[SlideLayoutIndex] = None
+
+        # Configuration normalisée de la dernière présentation construite
+        self.last_config: Optional[Dict[str, Any]] = None
+
+        # Reconstruction incrémentale (slides inchangées réutilisées) si possible
+        self.incremental = True
+
         print(f"[INIT] Template Premier Tech: {self.template_path}")
         print(f"[INIT] Structures slides: {self.slide_structures_path}")
         print(f"[INIT] Layouts disponibles: {len(self.layout_mapping)}")
@@ -83,14 +426,15 @@ class LayoutBasedPresentationBuilder:
         """
         mapping = {}
 
-        # Chercher tous les fichiers slide_*.json (anciens et nouveaux)
+        # Chercher tous les fichiers slide_*.json (anciens et nouveaux),
+        # triés pour que le choix entre doublons soit déterministe
         pattern = str(self.slide_structures_path / "slide_*.json")
-        structure_files = glob.glob(pattern)
+        structure_files = sorted(glob.glob(pattern))
 
         for file_path in structure_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = json_backend.load(f)
 
                 layout_name = data.get("layout_name")
                 slide_number = data.get("slide_number")
@@ -99,6 +443,9 @@ class LayoutBasedPresentationBuilder:
                     # Si le layout existe déjà, garder le premier trouvé
                     if layout_name not in mapping:
                         mapping[layout_name] = slide_number
+                    elif mapping[layout_name] != slide_number:
+                        print(f"[WARNING] Layout '{layout_name}' en double: slide {slide_number} "
+                              f"({os.path.basename(file_path)}) ignorée, slide {mapping[layout_name]} conservée")
 
             except Exception as e:
                 print(f"[WARNING] Erreur lecture structure {file_path}: {e}")
@@ -109,6 +456,47 @@ class LayoutBasedPresentationBuilder:
 
         return mapping
 
+    def _build_slide_number_mapping(self) -> Dict[int, str]:
+        """
+        Construit l'index inverse slide_number → layout_name.
+
+        Utilisé pour convertir les configurations legacy (slide_number) sans
+        parcourir layout_mapping. Si plusieurs layouts pointent vers la même
+        slide du template, le premier par ordre alphabétique est conservé.
+
+        Returns:
+            Dict[int, str]: Mapping slide_number → layout_name
+        """
+        reverse = {}
+
+        for layout_name, slide_number in sorted(self.layout_mapping.items()):
+            if slide_number in reverse:
+                print(f"[WARNING] Slide {slide_number} partagée par les layouts "
+                      f"'{reverse[slide_number]}' et '{layout_name}' (premier conservé)")
+                continue
+            reverse[slide_number] = layout_name
+
+        return reverse
+
+    def _get_target_layout_index(self, target_presentation: Presentation) -> SlideLayoutIndex:
+        """
+        Retourne l'index des layouts de la présentation cible.
+
+        L'index est construit au premier appel pour une présentation donnée
+        puis réutilisé pour toutes ses slides.
+
+        Args:
+            target_presentation: Présentation de destination
+
+        Returns:
+            SlideLayoutIndex de la présentation
+        """
+        index = self._target_layout_index
+        if index is None or index.presentation is not target_presentation:
+            index = SlideLayoutIndex(target_presentation)
+            self._target_layout_index = index
+        return index
+
     def _load_premier_tech_enums(self) -> Dict[str, Any]:
         """Charge les enums Premier Tech pour validation."""
         try:
@@ -117,7 +505,7 @@ class LayoutBasedPresentationBuilder:
                 return {}
 
             with open(self.premier_tech_enums_path, 'r', encoding='utf-8') as f:
-                enums_data = json.load(f)
+                enums_data = json_backend.load(f)
 
             print(f"[INIT] Premier Tech enums chargés: {enums_data.get('total_slides_analyzed', 0)} slides analysées")
             return enums_data
@@ -152,7 +540,7 @@ class LayoutBasedPresentationBuilder:
         """
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = json_backend.load(f)
 
             # Validation des champs requis
             required_fields = ["presentation_name", "subject", "audience", "slides", "output_path"]
@@ -215,11 +603,7 @@ class LayoutBasedPresentationBuilder:
                         raise ValueError(f"Slide {i+1}: 'slide_number' doit être entre 1 et 57")
 
                     # Trouver le layout_name correspondant au slide_number
-                    layout_name = None
-                    for layout, num in self.layout_mapping.items():
-                        if num == slide_number:
-                            layout_name = layout
-                            break
+                    layout_name = self.slide_number_mapping.get(slide_number)
 
                     if layout_name:
                         slide["layout_name"] = layout_name
@@ -255,31 +639,15 @@ class LayoutBasedPresentationBuilder:
             La nouvelle slide copiée
         """
         slide_number = self.layout_mapping[layout_name]
-        slide_index = slide_number - 1  # Convertir en index 0-based
 
         print(f"[COPY] Copie layout '{layout_name}' (slide {slide_number})")
 
-        # Charger le template
-        template_prs = Presentation(self.template_path)
-
-        if slide_index >= len(template_prs.slides):
-            raise ValueError(f"Slide {slide_number} n'existe pas dans le template")
-
-        # Récupérer la slide source et son layout
-        source_slide = template_prs.slides[slide_index]
-        source_layout = source_slide.slide_layout
+        # Récupérer le layout source depuis le template en cache
+        source_layout_name = self.template_cache.get_source_layout_name(slide_number)
 
         # Trouver le layout correspondant dans la présentation cible
-        target_layout = None
-        for layout in target_presentation.slide_layouts:
-            if layout.name == source_layout.name:
-                target_layout = layout
-                break
-
-        if not target_layout:
-            print(f"[ERROR] Layout '{source_layout.name}' non trouvé dans la présentation cible")
-            # Utiliser le premier layout disponible comme fallback
-            target_layout = target_presentation.slide_layouts[0]
+        # (ValueError si absent plutôt qu'un repli silencieux sur un autre layout)
+        target_layout = self._get_target_layout_index(target_presentation).get(source_layout_name)
 
         # Créer la nouvelle slide avec le bon layout
         new_slide = target_presentation.slides.add_slide(target_layout)
@@ -558,10 +926,182 @@ class LayoutBasedPresentationBuilder:
             print(f"[ERROR] Erreur propriétés PowerPoint: {e}")
             return False
 
+    def _resolve_source_layout(self, layout_name: str) -> str:
+        """Nom du layout du template réellement utilisé pour un layout_name."""
+        return self.template_cache.get_source_layout_name(self.layout_mapping[layout_name])
+
+    @staticmethod
+    def _slide_config_hash(slide_config: Dict[str, Any], source_layout: str) -> str:
+        """
+        Empreinte sha256 d'une slide : sa configuration et le layout source résolu.
+
+        Le layout source dépend de slide-structure (layout_name -> slide du
+        template) et pas seulement du template : il fait partie de l'empreinte
+        pour qu'une structure régénérée invalide les slides concernées.
+
+        Sérialisée avec le module json standard et non json_backend : l'empreinte
+        ne doit pas dépendre de la présence d'orjson (formatage des flottants).
+
+        Args:
+            slide_config: Configuration de la slide
+            source_layout: Nom du layout source résolu dans le template
+        """
+        canonical = json.dumps({'config': slide_config, 'source_layout': source_layout},
+                               sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _build_manifest_path(output_path: str) -> str:
+        """Chemin du manifeste de build associé à un .pptx (fichier caché voisin)."""
+        directory, filename = os.path.split(output_path)
+        return os.path.join(directory, f".{filename}{BUILD_MANIFEST_SUFFIX}")
+
+    def _load_build_manifest(self, output_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Charge le manifeste de build s'il décrit encore le .pptx existant.
+
+        Le manifeste est ignoré si le .pptx a été modifié depuis (mtime/taille),
+        si le template a changé ou si la version du manifeste diffère.
+
+        Args:
+            output_path: Chemin du .pptx de sortie
+
+        Returns:
+            Manifeste utilisable, ou None (reconstruction complète)
+        """
+        manifest_path = self._build_manifest_path(output_path)
+        if not os.path.exists(manifest_path) or not os.path.exists(output_path):
+            return None
+
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest = json_backend.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Manifeste de build illisible ({e}), reconstruction complète")
+            return None
+
+        stat = os.stat(output_path)
+        if manifest.get('version') != BUILD_MANIFEST_VERSION:
+            reason = "version du manifeste différente"
+        elif manifest.get('template_sha256') != self.template_cache.sha256:
+            reason = "template modifié"
+        elif manifest.get('output_signature') != [stat.st_mtime_ns, stat.st_size]:
+            reason = "présentation modifiée hors du builder"
+        else:
+            return manifest
+
+        print(f"[INCREMENTAL] Reconstruction complète: {reason}")
+        return None
+
+    def _write_build_manifest(self, output_path: str, slide_hashes: List[str],
+                              source_layouts: List[str], config: Dict[str, Any]):
+        """
+        Écrit (atomiquement) le manifeste de build du .pptx qui vient d'être sauvegardé.
+
+        Args:
+            output_path: Chemin du .pptx de sortie
+            slide_hashes: Empreinte de chaque slide, dans l'ordre de la présentation
+            source_layouts: Layout source résolu de chaque slide
+            config: Configuration construite
+        """
+        stat = os.stat(output_path)
+        manifest = {
+            'version': BUILD_MANIFEST_VERSION,
+            'template_sha256': self.template_cache.sha256,
+            'output_signature': [stat.st_mtime_ns, stat.st_size],
+            'slides': [
+                {'hash': slide_hash, 'layout_name': slide_config['layout_name'],
+                 'source_layout': source_layout}
+                for slide_hash, source_layout, slide_config
+                in zip(slide_hashes, source_layouts, config['slides'])
+            ],
+        }
+
+        manifest_path = self._build_manifest_path(output_path)
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json_backend.dump(manifest, f)
+        os.replace(temp_path, manifest_path)
+
+    def _splice_changed_slides(self, output_path: str, manifest: Dict[str, Any],
+                               config: Dict[str, Any], slide_hashes: List[str]) -> Optional[Presentation]:
+        """
+        Met à jour la présentation existante en ne reconstruisant que les slides modifiées.
+
+        Chaque slide existante dont l'empreinte se retrouve dans la nouvelle
+        configuration est conservée telle quelle (déplacée au besoin) ; les
+        slides ajoutées ou modifiées sont créées depuis le template, les slides
+        qui ne sont plus demandées sont retirées.
+
+        Args:
+            output_path: Chemin du .pptx existant
+            manifest: Manifeste de build valide de ce .pptx
+            config: Nouvelle configuration
+            slide_hashes: Empreintes des slides de la nouvelle configuration
+
+        Returns:
+            Présentation mise à jour (non sauvegardée), ou None si le .pptx ne
+            correspond pas au manifeste
+        """
+        presentation = Presentation(output_path)
+        sld_id_lst = presentation.slides._sldIdLst
+        existing = list(sld_id_lst)
+
+        previous_hashes = [entry['hash'] for entry in manifest.get('slides', [])]
+        if len(previous_hashes) != len(existing):
+            print(f"[INCREMENTAL] Reconstruction complète: {len(existing)} slides dans le .pptx, "
+                  f"{len(previous_hashes)} dans le manifeste")
+            return None
+
+        # Slides existantes disponibles par empreinte (ordre d'origine pour les doublons)
+        available: Dict[str, deque] = {}
+        for sld_id, slide_hash in zip(existing, previous_hashes):
+            available.setdefault(slide_hash, deque()).append(sld_id)
+
+        ordered = []
+        rebuilt = 0
+        for i, (slide_config, slide_hash) in enumerate(zip(config['slides'], slide_hashes)):
+            if available.get(slide_hash):
+                ordered.append(available[slide_hash].popleft())
+                continue
+
+            layout_name = slide_config["layout_name"]
+            print(f"\n[SLIDE {i+1}] Reconstruction layout '{layout_name}'")
+            new_slide = self._copy_slide_from_template(layout_name, presentation)
+            self._apply_slide_configuration(new_slide, slide_config)
+            ordered.append(sld_id_lst[-1])
+            rebuilt += 1
+
+        # Slides retirées : sans relation, leurs parts ne sont plus écrites
+        removed = 0
+        for remaining in available.values():
+            for sld_id in remaining:
+                presentation.part.drop_rel(sld_id.rId)
+                removed += 1
+
+        for sld_id in list(sld_id_lst):
+            sld_id_lst.remove(sld_id)
+        for sld_id in ordered:
+            sld_id_lst.append(sld_id)
+
+        # Renommer les parts selon le nouvel ordre (slide1.xml, slide2.xml, ...) :
+        # l'extracteur déduit le numéro de slide du nom de part. Le XML des
+        # slides réutilisées n'est pas modifié.
+        presentation.part.rename_slide_parts([sld_id.rId for sld_id in sld_id_lst])
+
+        print(f"[INCREMENTAL] {len(ordered) - rebuilt} slides réutilisées, "
+              f"{rebuilt} reconstruites, {removed} retirées")
+        return presentation
+
     def build_presentation(self, json_path: str) -> str:
         """
         Construit une présentation complète à partir du JSON avec layout_name.
 
+        Si la présentation de sortie existe déjà avec un manifeste de build
+        valide (et que self.incremental est actif), seules les slides
+        ajoutées, modifiées, déplacées ou retirées sont traitées ; les autres
+        sont reprises telles quelles du .pptx existant.
+
         Args:
             json_path: Chemin vers le fichier JSON de configuration
 
@@ -574,40 +1114,59 @@ class LayoutBasedPresentationBuilder:
 
             # 1. Charger la configuration
             config = self.load_presentation_config(json_path)
+            self.last_config = config
 
-            # 2. Créer la présentation en copiant le template
             output_path = config["output_path"]
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            source_layouts = [self._resolve_source_layout(slide["layout_name"]) for slide in config["slides"]]
+            slide_hashes = [self._slide_config_hash(slide, source_layout)
+                            for slide, source_layout in zip(config["slides"], source_layouts)]
+
+            # 2. Reconstruction incrémentale à partir du .pptx existant si possible
+            presentation = None
+            manifest = self._load_build_manifest(output_path) if self.incremental else None
+            if manifest is not None:
+                previous_hashes = [entry['hash'] for entry in manifest.get('slides', [])]
+                if previous_hashes == slide_hashes:
+                    print(f"[INCREMENTAL] Aucune slide modifiée, présentation à jour")
+                    print(f"\n=== SUCCESS: Présentation à jour ===")
+                    print(f"Fichier: {output_path}")
+                    print(f"Slides: {len(config['slides'])}")
+                    return output_path
+                presentation = self._splice_changed_slides(output_path, manifest, config, slide_hashes)
+
+            if presentation is None:
+                # Créer la présentation à partir du squelette du template
+                presentation = self.template_cache.open_skeleton()
+
+                print(f"[INIT] Présentation vide créée à partir du squelette du template")
+
+                # Indexer une seule fois les layouts de la présentation cible
+                layout_index = self._get_target_layout_index(presentation)
+                print(f"[INIT] Layouts indexés: {len(layout_index)}")
+
+                # 3. Ajouter chaque slide selon sa configuration
+                for i, slide_config in enumerate(config["slides"]):
+                    layout_name = slide_config["layout_name"]
+                    print(f"\n[SLIDE {i+1}] Traitement layout '{layout_name}'")
+
+                    # Copier la slide du template
+                    new_slide = self._copy_slide_from_template(layout_name, presentation)
+
+                    # Appliquer la configuration
+                    self._apply_slide_configuration(new_slide, slide_config)
+
+            # 4. Sauvegarder la présentation (écriture atomique : fichier
+            # temporaire puis renommage, jamais de .pptx partiel)
+            temp_path = f"{output_path}.{os.getpid()}.tmp"
+            try:
+                presentation.save(temp_path)
+                os.replace(temp_path, output_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
 
-            # Copier le template complet comme base
-            shutil.copy2(str(self.template_path), output_path)
-            presentation = Presentation(output_path)
-
-            # Supprimer toutes les slides existantes
-            slides_to_remove = list(range(len(presentation.slides)))
-            for i in reversed(slides_to_remove):
-                try:
-                    rId = presentation.slides._sldIdLst[i].rId
-                    presentation.part.drop_rel(rId)
-                    del presentation.slides._sldIdLst[i]
-                except Exception as e:
-                    print(f"[WARNING] Erreur suppression slide {i}: {e}")
-
-            print(f"[INIT] Présentation vide créée à partir du template")
-
-            # 3. Ajouter chaque slide selon sa configuration
-            for i, slide_config in enumerate(config["slides"]):
-                layout_name = slide_config["layout_name"]
-                print(f"\n[SLIDE {i+1}] Traitement layout '{layout_name}'")
-
-                # Copier la slide du template
-                new_slide = self._copy_slide_from_template(layout_name, presentation)
-
-                # Appliquer la configuration
-                self._apply_slide_configuration(new_slide, slide_config)
-
-            # 4. Sauvegarder la présentation
-            presentation.save(output_path)
+            self._write_build_manifest(output_path, slide_hashes, source_layouts, config)
 
             # 5. Vérifier le succès
             if os.path.exists(output_path):
@@ -623,6 +1182,239 @@ class LayoutBasedPresentationBuilder:
             print(f"Erreur: {e}")
             raise
 
+    def _build_batch_entry(self, config_path: str, capture: bool = True) -> Dict[str, Any]:
+        """
+        Construit une présentation du lot et retourne son résultat.
+
+        Args:
+            config_path: Fichier JSON de configuration
+            capture: Capturer le journal du build (sinon affiché directement)
+
+        Returns:
+            Dict: config, output, slides, elapsed (s), error et log capturé
+        """
+        result = {'config': config_path, 'output': None, 'slides': 0,
+                  'elapsed': 0.0, 'error': None, 'log': ''}
+        log = io.StringIO()
+        start = time.perf_counter()
+
+        try:
+            with contextlib.redirect_stdout(log if capture else sys.stdout):
+                result['output'] = self.build_presentation(config_path)
+            result['slides'] = len(self.last_config['slides'])
+        except Exception as e:
+            result['error'] = str(e) or e.__class__.__name__
+
+        result['elapsed'] = time.perf_counter() - start
+        result['log'] = log.getvalue()
+        return result
+
+    def _plan_batch(self, config_paths: List[str]):
+        """
+        Charge chaque configuration du lot pour connaître sa sortie et son coût.
+
+        Args:
+            config_paths: Fichiers JSON de configuration
+
+        Returns:
+            Tuple (outputs, costs) : chemin de sortie normalisé (None si la
+            configuration est invalide, l'erreur sera rapportée au build) et
+            coût estimé de chaque configuration
+        """
+        outputs: List[Optional[str]] = []
+        costs: List[int] = []
+
+        for config_path in config_paths:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    config = self.load_presentation_config(config_path)
+            except Exception:
+                outputs.append(None)
+                costs.append(0)
+                continue
+
+            outputs.append(os.path.normpath(os.path.abspath(config["output_path"])))
+            costs.append(_estimate_build_cost(config))
+
+        return outputs, costs
+
+    def build_batch(self, config_paths: List[str], verbose: bool = False,
+                    workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Construit plusieurs présentations avec un template partagé.
+
+        Le template, son squelette, le mapping des layouts et les enums
+        Premier Tech sont chargés une seule fois. Avec plusieurs processus,
+        ils sont chargés dans le processus principal puis hérités par fork,
+        et les decks les plus longs sont lancés en premier pour que le lot
+        se termine au plus tôt. Un échec n'interrompt pas le lot : il est
+        consigné et la configuration suivante est traitée.
+
+        Args:
+            config_paths: Fichiers JSON de configuration à construire
+            verbose: Afficher le journal complet de chaque deck
+                (par défaut, seulement celui des decks en échec)
+            workers: Nombre de processus (1 = séquentiel dans ce processus)
+
+        Returns:
+            List[Dict]: Un résultat par configuration (config, output, slides,
+                elapsed, error, log), dans l'ordre de config_paths
+        """
+        total = len(config_paths)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        completed = 0
+        start = time.perf_counter()
+
+        # Sorties et coûts estimés avant toute construction : deux configurations
+        # vers le même .pptx se disputeraient le fichier et son manifeste de build
+        outputs, costs = self._plan_batch(config_paths)
+        claims: Dict[str, List[int]] = {}
+        for position, output in enumerate(outputs):
+            if output is not None:
+                claims.setdefault(output, []).append(position)
+        rejected = {}
+        for output, positions in claims.items():
+            if len(positions) > 1:
+                others = ", ".join(config_paths[position] for position in positions)
+                for position in positions:
+                    rejected[position] = f"output_path '{os.path.relpath(output)}' partagé par plusieurs configurations ({others})"
+
+        pending = [position for position in range(total) if position not in rejected]
+        workers = max(1, min(workers, len(pending) or 1))
+
+        print(f"[BATCH] {total} configurations à construire ({workers} processus)")
+
+        def record(position: int, result: Dict[str, Any]):
+            """Affiche le résultat d'un deck terminé."""
+            nonlocal completed
+            completed += 1
+            results[position] = result
+
+            if result['log'] and (verbose or result['error']):
+                print(result['log'], end='')
+            if result['error']:
+                print(f"[BATCH] {completed}/{total} ECHEC {result['config']} "
+                      f"({result['elapsed'] * 1000:.1f} ms): {result['error']}")
+            else:
+                print(f"[BATCH] {completed}/{total} OK {result['config']} -> {result['output']} "
+                      f"({result['slides']} slides, {result['elapsed'] * 1000:.1f} ms)")
+
+        for position, error in sorted(rejected.items()):
+            record(position, {'config': config_paths[position], 'output': None, 'slides': 0,
+                              'elapsed': 0.0, 'error': error, 'log': ''})
+
+        if workers == 1:
+            for position in pending:
+                record(position, self._build_batch_entry(config_paths[position], capture=not verbose))
+        elif pending:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            # Plus long d'abord : les gros decks ne finissent pas seuls en fin de lot
+            order = sorted(pending, key=lambda position: costs[position], reverse=True)
+
+            if 'fork' in multiprocessing.get_all_start_methods():
+                # Squelette et index chargés ici une fois, hérités par les workers forkés
+                self.template_cache.preload()
+                _share_batch_builder(self)
+                pool_options = {'mp_context': multiprocessing.get_context('fork')}
+            else:
+                pool_options = {'initializer': _init_batch_worker}
+
+            try:
+                with ProcessPoolExecutor(max_workers=workers, **pool_options) as executor:
+                    futures = {executor.submit(_batch_worker_task, config_paths[position]): position
+                               for position in order}
+                    for future in as_completed(futures):
+                        position = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            # Worker interrompu (ex: tué par le système) : le lot continue
+                            result = {'config': config_paths[position], 'output': None, 'slides': 0,
+                                      'elapsed': 0.0, 'error': f"worker: {e}", 'log': ''}
+                        record(position, result)
+            finally:
+                _share_batch_builder(None)
+
+        elapsed = time.perf_counter() - start
+        failures = sum(1 for result in results if result['error'])
+        slides = sum(result['slides'] for result in results)
+
+        print(f"\n=== BATCH: {total - failures}/{total} présentations construites ===")
+        print(f"[TIMING] Total: {elapsed:.2f} s ({slides} slides, "
+              f"{elapsed * 1000 / max(total, 1):.1f} ms/deck en moyenne, {workers} processus)")
+        for result in results:
+            if result['error']:
+                print(f"[ERROR] {result['config']}: {result['error']}")
+
+        return results
+
+
+# Builder partagé avec les workers de build parallèle (fork) ou créé par worker
+_BATCH_BUILDER = None
+
+
+def _share_batch_builder(builder: Optional[LayoutBasedPresentationBuilder]):
+    """
+    Publie le builder du processus principal pour les workers créés par fork.
+
+    Args:
+        builder: Builder déjà chargé, hérité tel quel par les workers (None pour retirer)
+    """
+    global _BATCH_BUILDER
+    _BATCH_BUILDER = builder
+
+
+def _init_batch_worker():
+    """Initialise un worker sans fork : chaque worker crée son propre builder."""
+    global _BATCH_BUILDER
+    with contextlib.redirect_stdout(io.StringIO()):
+        _BATCH_BUILDER = LayoutBasedPresentationBuilder()
+
+
+def _batch_worker_task(config_path: str) -> Dict[str, Any]:
+    """Point d'entrée d'un build de lot dans un processus worker."""
+    return _BATCH_BUILDER._build_batch_entry(config_path)
+
+
+def _estimate_build_cost(config: Dict[str, Any]) -> int:
+    """
+    Estime le coût relatif d'un build (slides + shapes configurées).
+
+    Args:
+        config: Configuration chargée par load_presentation_config
+
+    Returns:
+        int: Coût estimé
+    """
+    slides = config["slides"]
+    return len(slides) + sum(len(slide.get("shapes") or []) for slide in slides)
+
+
+def discover_config_files(target: str) -> List[str]:
+    """
+    Découvre les configurations à construire pour --batch, dans un ordre stable.
+
+    Args:
+        target: Dossier (recherche récursive des config.json, dossiers cachés
+            ignorés) ou motif glob (ex: "presentations/*/*/config.json",
+            ** supporté)
+
+    Returns:
+        Chemins des fichiers de configuration, triés
+    """
+    if os.path.isdir(target):
+        configs = []
+        for directory, dirnames, filenames in os.walk(target):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+            if BATCH_CONFIG_NAME in filenames:
+                configs.append(os.path.join(directory, BATCH_CONFIG_NAME))
+        return configs
+
+    return sorted(path for path in glob.glob(target, recursive=True)
+                  if os.path.isfile(path) and path.endswith('.json'))
+
 
 def main():
     """Interface en ligne de commande."""
@@ -633,11 +1425,31 @@ def main():
     parser.add_argument('json_file', nargs='?', help='Fichier JSON de configuration de la présentation')
     parser.add_argument('--validate', action='store_true', help='Valider seulement le JSON')
     parser.add_argument('--list-layouts', action='store_true', help='Lister tous les layouts disponibles')
+    parser.add_argument('--batch', metavar='DIR_OU_GLOB',
+                        help='Construire toutes les configurations d\'un dossier (config.json, récursif) '
+                             'ou d\'un motif glob ; en parallèle sur tous les CPU par défaut '
+                             '(--workers 1 pour un build séquentiel)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Avec --batch: afficher le journal complet de chaque deck')
+    parser.add_argument('--full', action='store_true',
+                        help='Reconstruire toutes les slides (ignorer le manifeste de build)')
+    parser.add_argument('--workers', type=int,
+                        help='Avec --batch: nombre de processus (défaut: nombre de CPU, 1 = séquentiel)')
 
     args = parser.parse_args()
 
     try:
         builder = LayoutBasedPresentationBuilder()
+        builder.incremental = not args.full
+
+        if args.batch:
+            config_paths = discover_config_files(args.batch)
+            if not config_paths:
+                print(f"Erreur: aucune configuration trouvée pour {args.batch}")
+                sys.exit(1)
+            workers = args.workers if args.workers else (os.cpu_count() or 1)
+            results = builder.build_batch(config_paths, verbose=args.verbose, workers=workers)
+            sys.exit(1 if any(result['error'] for result in results) else 0)
 
         if args.list_layouts:
             print(f"\n=== LAYOUTS DISPONIBLES ({len(builder.layout_mapping)}) ===")
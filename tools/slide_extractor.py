@@ -21,21 +21,35 @@ Auteur: Basé sur l'analyse architecturale OOXML approfondie
 """
 
 import zipfile
+import zlib
+import mmap
+import struct
+import io
+import posixpath
 import argparse
-import json
 import sys
 import os
 import re
 import glob
-from typing import Dict, List, Any, Optional, Union
+import itertools
+import time
+import contextlib
+import functools
+import hashlib
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, NamedTuple, Optional, Union
 from pathlib import Path
 
+import json_backend
+
 try:
     from lxml import etree
     LXML_AVAILABLE = True
+    XML_PARSE_ERRORS = (etree.XMLSyntaxError,)
 except ImportError:
     import xml.etree.ElementTree as etree
     LXML_AVAILABLE = False
+    XML_PARSE_ERRORS = (etree.ParseError,)
     print("[WARNING] lxml non disponible, utilisation xml.etree (performances réduites)")
 
 
@@ -50,6 +64,46 @@ NAMESPACES = {
     'xml': 'http://www.w3.org/XML/1998/namespace'
 }
 
+# Namespace des fichiers de relations (.rels)
+RELS_NAMESPACE = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# Types de relations suivis pour construire le graphe du package
+FOLLOWED_RELATIONSHIP_TYPES = {'slide', 'slideLayout', 'slideMaster', 'theme', 'notesSlide'}
+
+# Types de relations vers des médias (non parsés, simplement indexés)
+MEDIA_RELATIONSHIP_TYPES = ('image', 'media', 'video', 'audio')
+
+# Budget par défaut du cache XML (octets décompressés, hors parties épinglées)
+DEFAULT_XML_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Préchargement concurrent des parties : threads de décompression/parsing (un cœur
+# reste au thread principal, 0 = désactivé), parties préchargées non consommées au
+# maximum (borne mémoire), slides anticipées
+DEFAULT_PREFETCH_WORKERS = max(0, min(4, (os.cpu_count() or 1) - 1))
+DEFAULT_PREFETCH_LIMIT = 16
+PREFETCH_LOOKAHEAD_SLIDES = 2
+
+# Parties réutilisées par toutes les slides, jamais évincées du cache
+PINNED_PART_PREFIXES = ('ppt/slideLayouts/', 'ppt/slideMasters/', 'ppt/theme/', 'ppt/presentation.xml')
+
+# Version de la logique d'extraction : à incrémenter dès que le JSON produit change,
+# pour invalider les manifestes de régénération incrémentale
+EXTRACTOR_VERSION = "3.2"
+
+# Manifeste de régénération incrémentale, stocké à côté des structures de layout
+REGENERATION_MANIFEST_NAME = ".regeneration-manifest.json"
+
+# Mode corpus : index des decks, sous-dossier des JSONL par deck (séparé de
+# l'index), intervalle des messages de progression (s), decks en cours par
+# worker (borne la mémoire du processus principal)
+CORPUS_INDEX_NAME = "corpus_index.jsonl"
+CORPUS_DECKS_DIR = "decks"
+CORPUS_PROGRESS_INTERVAL = 2.0
+CORPUS_WINDOW_PER_WORKER = 4
+
+# Attributs de <a:rPr> sans effet sur le style résolu (correction, édition)
+RUN_SIGNATURE_IGNORED_ATTRIBUTES = frozenset({'lang', 'altLang', 'dirty', 'err', 'smtClean', 'smtId', 'noProof'})
+
 # Unités de conversion OOXML
 EMU_PER_POINT = 12700  # 1 point = 12700 EMUs (English Metric Units)
 CENTIPOINTS_PER_POINT = 100  # 1 point = 100 centipoints
@@ -67,6 +121,174 @@ PRESET_COLORS = {
 }
 
 
+# =============================================================================
+# REGISTRE XPATH PRÉCOMPILÉ
+# =============================================================================
+
+# Sections et niveaux de <p:txStyles> dans le master
+TEXT_STYLE_SECTIONS = ('titleStyle', 'bodyStyle', 'otherStyle')
+TEXT_STYLE_LEVELS = tuple(f'lvl{level}pPr' for level in range(1, 10))
+
+# Couleurs standard d'un schéma de couleurs de thème
+THEME_COLOR_NAMES = ('dk1', 'lt1', 'dk2', 'lt2', 'accent1', 'accent2',
+                     'accent3', 'accent4', 'accent5', 'accent6', 'hlink', 'folHlink')
+
+# Expressions fixes : chemins valides à la fois pour lxml et ElementTree
+XPATH_EXPRESSIONS = {
+    # Thème
+    'clr_scheme': './/a:clrScheme',
+    'font_scheme': './/a:fontScheme',
+    'major_latin': './/a:majorFont/a:latin',
+    'minor_latin': './/a:minorFont/a:latin',
+    'srgb_clr': './/a:srgbClr',
+    'sys_clr': './/a:sysClr',
+    'scheme_clr': './/a:schemeClr',
+    'prst_clr': './/a:prstClr',
+
+    # Runs et paragraphes
+    'rpr': './/a:rPr',
+    'rpr_latin': './/a:rPr/a:latin',
+    'ppr': './/a:pPr',
+    'ppr_def_rpr': './/a:pPr/a:defRPr',
+    'ppr_def_rpr_latin': './/a:pPr/a:defRPr/a:latin',
+    'def_rpr': './/a:defRPr',
+    'latin': './/a:latin',
+    'solid_fill_scheme_clr': './/a:solidFill/a:schemeClr',
+    'lvl1_ppr': './/a:lvl1pPr',
+    'lvl2_ppr': './/a:lvl2pPr',
+    'lvl3_ppr': './/a:lvl3pPr',
+
+    # Text frame
+    'body_pr': './/a:bodyPr',
+    'norm_autofit': './/a:normAutofit',
+    'sp_autofit': './/a:spAutofit',
+    'no_autofit': './/a:noAutofit',
+
+    # Formes et structure de slide
+    'sp_tree': './p:cSld/p:spTree',
+    'c_sld': './/p:cSld',
+    'placeholder': './/p:nvSpPr/p:nvPr/p:ph',
+    'sp_pr_xfrm': './p:spPr/a:xfrm',
+    'xfrm_off': './a:off',
+    'xfrm_ext': './a:ext',
+}
+
+# Expressions paramétrées : (XPath lxml avec variables, gabarit ElementTree, domaines)
+XPATH_VARIABLE_EXPRESSIONS = {
+    'theme_color': (
+        'a:*[local-name() = $color]',
+        'a:{color}',
+        {'color': THEME_COLOR_NAMES}
+    ),
+    'master_level_ppr': (
+        './/p:txStyles/p:*[local-name() = $section]/a:*[local-name() = $level]',
+        './/p:txStyles/p:{section}/a:{level}',
+        {'section': TEXT_STYLE_SECTIONS, 'level': TEXT_STYLE_LEVELS}
+    ),
+    'master_level_def_rpr': (
+        './/p:txStyles/p:*[local-name() = $section]/a:*[local-name() = $level]/a:defRPr',
+        './/p:txStyles/p:{section}/a:{level}/a:defRPr',
+        {'section': TEXT_STYLE_SECTIONS, 'level': TEXT_STYLE_LEVELS}
+    ),
+}
+
+# Placeholders d'un layout/master : le prédicat descendant n'existe qu'en lxml
+PLACEHOLDER_SHAPES_XPATH = '//p:sp[.//p:nvSpPr/p:nvPr/p:ph]'
+
+_PREFIX_PATTERN = re.compile(r'(?<![\w{])(' + '|'.join(NAMESPACES) + r'):')
+
+
+def _to_clark(path: str) -> str:
+    """Convertit un chemin préfixé ('.//a:rPr') en notation Clark pour ElementTree."""
+    return _PREFIX_PATTERN.sub(lambda m: f'{{{NAMESPACES[m.group(1)]}}}', path)
+
+
+def _variable_key(variables: Dict[str, str]) -> tuple:
+    """Clé de lookup d'une expression paramétrée (variables triées par nom)."""
+    return tuple(sorted(variables.items()))
+
+
+if LXML_AVAILABLE:
+    XPATHS = {
+        name: etree.XPath(expr, namespaces=NAMESPACES)
+        for name, expr in XPATH_EXPRESSIONS.items()
+    }
+    XPATHS.update({
+        name: etree.XPath(expr, namespaces=NAMESPACES)
+        for name, (expr, _, _) in XPATH_VARIABLE_EXPRESSIONS.items()
+    })
+    XPATHS['placeholder_shapes'] = etree.XPath(PLACEHOLDER_SHAPES_XPATH, namespaces=NAMESPACES)
+    CLARK_PATHS = {}
+else:
+    XPATHS = {}
+    CLARK_PATHS = {name: _to_clark(expr) for name, expr in XPATH_EXPRESSIONS.items()}
+    for _name, (_, _template, _domains) in XPATH_VARIABLE_EXPRESSIONS.items():
+        _var_names = sorted(_domains)
+        CLARK_PATHS[_name] = {
+            _variable_key(dict(zip(_var_names, values))): _to_clark(_template.format(**dict(zip(_var_names, values))))
+            for values in itertools.product(*(_domains[v] for v in _var_names))
+        }
+
+
+def xpath_all(node, name: str, **variables) -> list:
+    """
+    Évalue une expression du registre et retourne tous les éléments trouvés.
+
+    Args:
+        node: Élément ou arbre XML de contexte
+        name: Nom de l'expression dans le registre
+        **variables: Variables XPath pour les expressions paramétrées
+
+    Returns:
+        Liste des éléments correspondants
+    """
+    if LXML_AVAILABLE:
+        return XPATHS[name](node, **variables)
+
+    path = CLARK_PATHS[name]
+    if variables:
+        path = path.get(_variable_key(variables))
+        if path is None:
+            return []
+    return node.findall(path)
+
+
+def xpath_first(node, name: str, **variables):
+    """
+    Évalue une expression du registre et retourne le premier élément trouvé.
+
+    Returns:
+        Premier élément correspondant ou None
+    """
+    if LXML_AVAILABLE:
+        result = XPATHS[name](node, **variables)
+        return result[0] if result else None
+
+    path = CLARK_PATHS[name]
+    if variables:
+        path = path.get(_variable_key(variables))
+        if path is None:
+            return None
+    return node.find(path)
+
+
+def find_placeholder_shapes(tree) -> list:
+    """
+    Retourne toutes les formes <p:sp> portant un placeholder dans un arbre.
+
+    Args:
+        tree: Arbre XML (layout ou master)
+
+    Returns:
+        Liste des éléments <p:sp> placeholder
+    """
+    if LXML_AVAILABLE:
+        return XPATHS['placeholder_shapes'](tree)
+
+    return [sp for sp in tree.iter(f'{{{NAMESPACES["p"]}}}sp')
+            if sp.find(CLARK_PATHS['placeholder']) is not None]
+
+
 # =============================================================================
 # FONCTIONS UTILITAIRES
 # =============================================================================
@@ -127,355 +349,1047 @@ def generate_layout_filename(layout_name: str) -> str:
 
 
 # =============================================================================
-# CLASSE PPTXPackage - Navigation Archive et Relations
+# CLASSE PhaseProfiler - Instrumentation par Phase
 # =============================================================================
 
-class PPTXPackage:
+class PhaseProfiler:
     """
-    Navigateur pour l'archive .pptx et le graphe de relations OOXML.
+    Accumule temps mural et nombre d'appels par phase d'extraction.
 
-    Gère l'accès de bas niveau à l'archive ZIP et la résolution des relations
-    entre les différentes parties du document (slide -> layout -> master -> theme).
+    Désactivé par défaut : phase() renvoie alors un contexte nul partagé et les
+    méthodes décorées par @profiled appellent directement la fonction. Les
+    phases imbriquées sont comptées en temps inclusif et en temps propre
+    (hors sous-phases).
     """
 
-    def __init__(self, pptx_path: str):
-        """
-        Initialise le package PPTX.
+    def __init__(self):
+        """Initialise un profileur désactivé."""
+        self.enabled = False
+        self._totals = {}   # phase -> [appels, temps inclusif, temps propre]
+        self._stack = []    # temps des sous-phases de chaque phase ouverte
 
-        Args:
-            pptx_path: Chemin vers le fichier .pptx
-        """
-        self.pptx_path = Path(pptx_path)
-        self.zip_file = zipfile.ZipFile(pptx_path, 'r')
-        self._xml_cache = {}  # Cache pour éviter de parser plusieurs fois les mêmes fichiers
-        self._relations_cache = {}
+    def enable(self):
+        """Active l'instrumentation et remet les compteurs à zéro."""
+        self.reset()
+        self.enabled = True
 
-        # Charger les relations principales
-        self._load_main_relations()
+    def disable(self):
+        """Désactive l'instrumentation (les compteurs sont conservés)."""
+        self.enabled = False
 
-    def _load_main_relations(self):
-        """Charge les relations principales du document."""
-        try:
-            main_rels = self.get_xml_tree('_rels/.rels')
-            if main_rels is not None:
-                self._relations_cache['main'] = self._parse_relations(main_rels)
-        except:
-            pass
+    def reset(self):
+        """Remet les compteurs à zéro."""
+        self._totals.clear()
+        self._stack.clear()
 
-    def get_xml_tree(self, part_name: str):
+    def phase(self, name: str):
         """
-        Lit et parse un fichier XML depuis l'archive avec mise en cache.
+        Retourne un contexte chronométrant une phase.
 
         Args:
-            part_name: Nom de la partie XML dans l'archive
+            name: Nom de la phase
 
         Returns:
-            Arbre XML parsé ou None si inexistant
+            Gestionnaire de contexte (nul si le profileur est désactivé)
         """
-        if part_name in self._xml_cache:
-            return self._xml_cache[part_name]
-
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._measure(name)
+
+    @contextlib.contextmanager
+    def _measure(self, name: str):
+        """Chronomètre une phase en déduisant le temps des sous-phases."""
+        self._stack.append(0.0)
+        start = time.perf_counter()
         try:
-            with self.zip_file.open(part_name) as xml_file:
-                if LXML_AVAILABLE:
-                    tree = etree.parse(xml_file)
-                else:
-                    # Enregistrer les namespaces pour ElementTree
-                    for prefix, uri in NAMESPACES.items():
-                        etree.register_namespace(prefix, uri)
-                    tree = etree.parse(xml_file)
-
-                self._xml_cache[part_name] = tree
-                return tree
-
-        except (KeyError, etree.XMLSyntaxError) as e:
-            print(f"[WARNING] Impossible de lire {part_name}: {e}")
-            return None
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
 
-    def _parse_relations(self, rels_tree) -> Dict[str, str]:
-        """
-        Parse un fichier .rels et retourne un mapping ID -> Target.
+            totals = self._totals.setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed
+            totals[2] += elapsed - children
 
-        Args:
-            rels_tree: Arbre XML du fichier .rels
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Exporte les compteurs en format JSON.
 
         Returns:
-            Dict mapping relation ID vers target path
+            Dict phase -> {calls, total_ms, self_ms, mean_ms}
         """
-        relations = {}
+        return {
+            name: {
+                'calls': calls,
+                'total_ms': round(total * 1000, 3),
+                'self_ms': round(own * 1000, 3),
+                'mean_ms': round(total * 1000 / calls, 4) if calls else 0.0,
+            }
+            for name, (calls, total, own) in sorted(self._totals.items())
+        }
 
-        # Le namespace pour les fichiers .rels est différent
-        rels_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
+    def summary_table(self) -> str:
+        """Retourne un tableau texte des phases, triées par temps propre décroissant."""
+        rows = sorted(self.to_dict().items(), key=lambda item: item[1]['self_ms'], reverse=True)
+        lines = [f"{'Phase':<20} {'Appels':>8} {'Total ms':>11} {'Propre ms':>11} {'Moyen ms':>10}"]
+        for name, stats in rows:
+            lines.append(f"{name:<20} {stats['calls']:>8} {stats['total_ms']:>11.2f} "
+                         f"{stats['self_ms']:>11.2f} {stats['mean_ms']:>10.4f}")
+        return "\n".join(lines)
 
-        if LXML_AVAILABLE:
-            # lxml avec namespace
-            rels = rels_tree.xpath('//pr:Relationship', namespaces={'pr': rels_ns})
-        else:
-            # ElementTree fallback
-            root = rels_tree.getroot()
-            rels = root.findall(f'.//{{{rels_ns}}}Relationship')
 
-        for rel in rels:
-            rel_id = rel.get('Id')
-            target = rel.get('Target')
-            rel_type = rel.get('Type')
-            if rel_id and target:
-                relations[rel_id] = target
+# Contexte nul partagé par toutes les phases quand le profileur est désactivé
+_NULL_PHASE = contextlib.nullcontext()
 
-        return relations
+# Profileur global du module (activé par --profile)
+PROFILER = PhaseProfiler()
 
-    def get_slide_layout_part(self, slide_part_name: str) -> Optional[str]:
-        """
-        Trouve la partie layout d'une slide donnée.
 
-        Args:
-            slide_part_name: Nom de la partie slide (ex: 'ppt/slides/slide1.xml')
+def profiled(phase_name: str):
+    """
+    Décorateur chronométrant chaque appel d'une méthode sous une phase donnée.
 
-        Returns:
-            Nom de la partie layout ou None
-        """
-        # Construire le nom du fichier .rels correspondant
-        rels_name = slide_part_name.replace('.xml', '.xml.rels').replace('ppt/slides/', 'ppt/slides/_rels/')
+    Args:
+        phase_name: Nom de la phase
 
-        rels_tree = self.get_xml_tree(rels_name)
-        if rels_tree is None:
-            return None
+    Returns:
+        Décorateur (simple test de drapeau quand le profileur est désactivé)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER._measure(phase_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
 
-        # Le namespace pour les fichiers .rels
-        rels_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
 
-        # Chercher directement la relation de type slideLayout
-        if LXML_AVAILABLE:
-            rel_elements = rels_tree.xpath('//pr:Relationship[contains(@Type, "slideLayout")]', namespaces={'pr': rels_ns})
-        else:
-            root = rels_tree.getroot()
-            rel_elements = root.findall(f'.//{{{rels_ns}}}Relationship')
-            rel_elements = [rel for rel in rel_elements if 'slideLayout' in rel.get('Type', '')]
+# =============================================================================
+# CLASSE XMLPartCache - Cache LRU Borné des Parties XML
+# =============================================================================
 
-        for rel_elem in rel_elements:
-            target = rel_elem.get('Target')
-            if target:
-                # Résoudre le chemin relatif depuis slides vers slideLayouts
-                return f"ppt/slideLayouts/{target.split('/')[-1]}"
+class XMLPartCache:
+    """
+    Cache LRU des arbres XML parsés, borné par un budget en octets.
 
-        return None
+    La taille de chaque entrée est la taille décompressée de la partie
+    (ZipInfo.file_size). Les parties partagées par toutes les slides
+    (layouts, masters, thèmes) sont épinglées et ne sont jamais évincées ;
+    les autres (slides, notes) sont évincées par ordre d'utilisation.
+    """
 
-    def get_slide_master_part(self, layout_part_name: str) -> Optional[str]:
+    def __init__(self, budget_bytes: int = DEFAULT_XML_CACHE_BUDGET):
         """
-        Trouve la partie master d'un layout donné.
+        Initialise le cache.
 
         Args:
-            layout_part_name: Nom de la partie layout
+            budget_bytes: Budget maximal (octets décompressés) des parties évinçables
+        """
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # part_name -> (tree, size), ordre LRU
+        self._pinned = {}  # part_name -> (tree, size)
+        self.current_bytes = 0
+        self.pinned_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def is_pinned_part(part_name: str) -> bool:
+        """Indique si une partie est réutilisée par toutes les slides (épinglée)."""
+        return part_name.startswith(PINNED_PART_PREFIXES)
+
+    def __contains__(self, part_name: str) -> bool:
+        return part_name in self._pinned or part_name in self._entries
+
+    def get(self, part_name: str):
+        """
+        Retourne l'arbre en cache et met à jour l'ordre LRU.
 
         Returns:
-            Nom de la partie master ou None
+            Arbre XML ou None si absent (compté comme miss)
         """
-        rels_name = layout_part_name.replace('.xml', '.xml.rels').replace('ppt/slideLayouts/', 'ppt/slideLayouts/_rels/')
+        pinned = self._pinned.get(part_name)
+        if pinned is not None:
+            self.hits += 1
+            return pinned[0]
+
+        entry = self._entries.get(part_name)
+        if entry is not None:
+            self._entries.move_to_end(part_name)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        return None
 
-        rels_tree = self.get_xml_tree(rels_name)
-        if rels_tree is None:
-            return None
+    def put(self, part_name: str, tree, size: int):
+        """
+        Ajoute un arbre au cache, puis évince selon le budget.
 
-        # Le namespace pour les fichiers .rels
-        rels_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
+        Args:
+            part_name: Nom de la partie
+            tree: Arbre XML parsé
+            size: Taille décompressée de la partie (octets)
+        """
+        if self.is_pinned_part(part_name):
+            if part_name not in self._pinned:
+                self.pinned_bytes += size
+            self._pinned[part_name] = (tree, size)
+            return
 
-        # Chercher directement la relation de type slideMaster
-        if LXML_AVAILABLE:
-            rel_elements = rels_tree.xpath('//pr:Relationship[contains(@Type, "slideMaster")]', namespaces={'pr': rels_ns})
-        else:
-            root = rels_tree.getroot()
-            rel_elements = root.findall(f'.//{{{rels_ns}}}Relationship')
-            rel_elements = [rel for rel in rel_elements if 'slideMaster' in rel.get('Type', '')]
+        previous = self._entries.pop(part_name, None)
+        if previous is not None:
+            self.current_bytes -= previous[1]
 
-        for rel_elem in rel_elements:
-            target = rel_elem.get('Target')
-            if target:
-                # Résoudre le chemin relatif depuis slideLayouts vers slideMasters
-                return f"ppt/slideMasters/{target.split('/')[-1]}"
+        self._entries[part_name] = (tree, size)
+        self.current_bytes += size
 
-        return None
+        # Ne jamais évincer l'entrée qui vient d'être ajoutée
+        while self.current_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
 
-    def get_theme_part(self, master_part_name: str) -> Optional[str]:
+    def release(self, part_name: str) -> bool:
         """
-        Trouve la partie theme d'un master donné.
-
-        Args:
-            master_part_name: Nom de la partie master
+        Retire explicitement une partie non épinglée (ex: slide déjà extraite).
 
         Returns:
-            Nom de la partie theme ou None
+            bool: True si une entrée a été retirée
         """
-        rels_name = master_part_name.replace('.xml', '.xml.rels').replace('ppt/slideMasters/', 'ppt/slideMasters/_rels/')
-
-        rels_tree = self.get_xml_tree(rels_name)
-        if rels_tree is None:
-            return None
-
-        # Le namespace pour les fichiers .rels
-        rels_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
-
-        # Chercher directement la relation de type theme
-        if LXML_AVAILABLE:
-            rel_elements = rels_tree.xpath('//pr:Relationship[contains(@Type, "theme")]', namespaces={'pr': rels_ns})
-        else:
-            root = rels_tree.getroot()
-            rel_elements = root.findall(f'.//{{{rels_ns}}}Relationship')
-            rel_elements = [rel for rel in rel_elements if 'theme' in rel.get('Type', '')]
+        entry = self._entries.pop(part_name, None)
+        if entry is None:
+            return False
 
-        for rel_elem in rel_elements:
-            target = rel_elem.get('Target')
-            if target:
-                # Résoudre le chemin relatif depuis slideMasters vers theme
-                return f"ppt/theme/{target.split('/')[-1]}"
+        self.current_bytes -= entry[1]
+        self.evictions += 1
+        return True
 
-        return None
+    def clear(self):
+        """Vide entièrement le cache (y compris les parties épinglées)."""
+        self._entries.clear()
+        self._pinned.clear()
+        self.current_bytes = 0
+        self.pinned_bytes = 0
 
-    def close(self):
-        """Ferme l'archive ZIP."""
-        if self.zip_file:
-            self.zip_file.close()
+    def stats(self) -> Dict[str, int]:
+        """Compteurs du cache pour ajuster le budget."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "pinned_entries": len(self._pinned),
+            "current_bytes": self.current_bytes,
+            "pinned_bytes": self.pinned_bytes,
+            "budget_bytes": self.budget_bytes
+        }
 
 
 # =============================================================================
-# CLASSE Theme - Schémas de Couleurs et Polices
+# CLASSE MappedZipReader - Lecture de l'Archive par Projection Mémoire
 # =============================================================================
 
-class Theme:
+# En-tête local d'une entrée zip : signature, ..., longueur du nom, longueur de l'extra
+ZIP_LOCAL_HEADER = struct.Struct('<4s22xHH')
+ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+
+class MappedZipReader:
     """
-    Parse et met en cache les schémas de couleurs et polices du thème.
+    Lecteur d'archive .pptx adossé à un mmap du fichier.
 
-    Le thème définit les palettes de base qui sont ensuite référencées
-    sémantiquement dans toute la présentation.
+    Le répertoire central est lu une seule fois (via zipfile, ZIP64 compris),
+    puis le fichier est projeté en mémoire et son descripteur fermé :
+    - les parties stockées (sans compression, typiquement les médias) sont
+      exposées comme des memoryview du mmap, sans copie
+    - les parties deflate (XML) sont décompressées directement depuis le mmap
+
+    Sans descripteur ni position de lecture partagés, un lecteur ouvert avant
+    un fork reste utilisable par les processus enfants (pages partagées).
+    Expose le sous-ensemble de l'API zipfile.ZipFile utilisé par PPTXPackage.
     """
 
-    def __init__(self, theme_tree):
+    def __init__(self, path: Union[str, Path]):
         """
-        Initialise le thème depuis son arbre XML.
+        Projette l'archive en mémoire et indexe son répertoire central.
 
         Args:
-            theme_tree: Arbre XML du fichier theme.xml
+            path: Chemin vers le fichier .pptx
+
+        Raises:
+            zipfile.BadZipFile: Archive invalide
+            NotImplementedError: Entrée chiffrée ou méthode de compression non gérée
         """
-        self.tree = theme_tree
-        self.colors = self._parse_color_scheme()
-        self.fonts = self._parse_font_scheme()
+        with open(path, 'rb') as f:
+            with zipfile.ZipFile(f) as archive:
+                infos = archive.infolist()
+
+            for info in infos:
+                if info.flag_bits & 0x1:
+                    raise NotImplementedError(f"Entrée chiffrée non gérée: {info.filename}")
+                if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                    raise NotImplementedError(f"Compression {info.compress_type} non gérée: {info.filename}")
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer = memoryview(self._mmap)
+        self._infos = {info.filename: info for info in infos}
+        self._data_offsets = {}  # part_name -> début des données compressées
+
+    def namelist(self) -> List[str]:
+        """Noms des parties de l'archive."""
+        return list(self._infos)
+
+    def getinfo(self, part_name: str) -> zipfile.ZipInfo:
+        """ZipInfo d'une partie (KeyError si absente, comme zipfile)."""
+        info = self._infos.get(part_name)
+        if info is None:
+            raise KeyError(f"There is no item named {part_name!r} in the archive")
+        return info
 
-    def _parse_color_scheme(self) -> Dict[str, str]:
+    def _raw_view(self, info: zipfile.ZipInfo) -> memoryview:
+        """Données brutes (compressées) d'une entrée, sans copie."""
+        start = self._data_offsets.get(info.filename)
+        if start is None:
+            header = self._buffer[info.header_offset:info.header_offset + ZIP_LOCAL_HEADER.size]
+            signature, name_length, extra_length = ZIP_LOCAL_HEADER.unpack(header)
+            if signature != ZIP_LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"En-tête local invalide: {info.filename}")
+            start = info.header_offset + ZIP_LOCAL_HEADER.size + name_length + extra_length
+            self._data_offsets[info.filename] = start
+
+        return self._buffer[start:start + info.compress_size]
+
+    def read_buffer(self, part_name: str) -> Union[bytes, memoryview]:
         """
-        Parse le schéma de couleurs <a:clrScheme> et extrait les couleurs.
+        Contenu décompressé d'une partie, sans copie quand c'est possible.
+
+        Args:
+            part_name: Nom de la partie
 
         Returns:
-            Dict mapping nom couleur -> valeur hex
+            memoryview du mmap pour une partie stockée, bytes pour une partie deflate
         """
-        colors = {}
+        info = self.getinfo(part_name)
+        raw = self._raw_view(info)
 
-        if self.tree is None:
-            return colors
+        if info.compress_type == zipfile.ZIP_STORED:
+            return raw
 
-        try:
-            if LXML_AVAILABLE:
-                color_scheme = self.tree.xpath('//a:clrScheme', namespaces=NAMESPACES)
-            else:
-                color_scheme = self.tree.findall(f'.//{{{NAMESPACES["a"]}}}clrScheme')
+        data = zlib.decompress(raw, -zlib.MAX_WBITS, info.file_size or zlib.DEF_BUF_SIZE)
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"CRC invalide: {part_name}")
+        return data
 
-            if not color_scheme:
-                return colors
+    def read(self, part_name: str) -> bytes:
+        """Contenu décompressé d'une partie (copie, comme zipfile.ZipFile.read)."""
+        return bytes(self.read_buffer(part_name))
 
-            scheme = color_scheme[0]
+    def close(self):
+        """Libère la projection (laissée au ramasse-miettes si des vues sont encore utilisées)."""
+        if self._mmap is None:
+            return
 
-            # Liste des couleurs standard du thème
-            color_names = ['dk1', 'lt1', 'dk2', 'lt2', 'accent1', 'accent2',
-                          'accent3', 'accent4', 'accent5', 'accent6', 'hlink', 'folHlink']
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._mmap = None
 
-            for color_name in color_names:
-                if LXML_AVAILABLE:
-                    color_elements = scheme.xpath(f'a:{color_name}', namespaces=NAMESPACES)
-                else:
-                    color_elements = scheme.findall(f'{{{NAMESPACES["a"]}}}{color_name}')
 
-                if color_elements:
-                    color_elem = color_elements[0]
-                    hex_color = self._extract_color_value(color_elem)
-                    if hex_color:
-                        colors[color_name] = hex_color
+# =============================================================================
+# CLASSE PPTXPackage - Navigation Archive et Relations
+# =============================================================================
 
-        except Exception as e:
-            print(f"[WARNING] Erreur parsing color scheme: {e}")
+class PPTXPackage:
+    """
+    Navigateur pour l'archive .pptx et le graphe de relations OOXML.
 
-        return colors
+    Gère l'accès de bas niveau à l'archive ZIP et la résolution des relations
+    entre les différentes parties du document (slide -> layout -> master -> theme).
+    """
 
-    def _parse_font_scheme(self) -> Dict[str, str]:
+    @profiled('package_open')
+    def __init__(self, pptx_path: str, cache_budget_bytes: int = DEFAULT_XML_CACHE_BUDGET,
+                 use_mmap: bool = False):
         """
-        Parse le schéma de polices <a:fontScheme> et extrait les polices.
+        Initialise le package PPTX.
 
-        Returns:
-            Dict mapping type police -> nom police
+        Args:
+            pptx_path: Chemin vers le fichier .pptx
+            cache_budget_bytes: Budget du cache XML pour les parties évinçables (octets décompressés)
+            use_mmap: Lire l'archive par projection mémoire (MappedZipReader)
         """
-        fonts = {}
-
-        if self.tree is None:
-            return fonts
-
-        try:
-            if LXML_AVAILABLE:
-                font_scheme = self.tree.xpath('//a:fontScheme', namespaces=NAMESPACES)
-            else:
-                font_scheme = self.tree.findall(f'.//{{{NAMESPACES["a"]}}}fontScheme')
-
-            if not font_scheme:
-                return fonts
+        self.pptx_path = Path(pptx_path)
+        self.zip_file = self._open_archive(pptx_path, use_mmap)
+        self._part_names = set(self.zip_file.namelist())
+        self._xml_cache = XMLPartCache(cache_budget_bytes)  # Cache LRU borné des arbres parsés
+        self._relations_cache = {}
 
-            scheme = font_scheme[0]
+        # Index d'héritage des placeholders par layout/master, thèmes par partie
+        self._placeholder_indexes = {}
+        self._themes = {}
 
-            # Police majeure (titres)
-            if LXML_AVAILABLE:
-                major_fonts = scheme.xpath('.//a:majorFont/a:latin', namespaces=NAMESPACES)
-            else:
-                major_fonts = scheme.findall(f'.//{{{NAMESPACES["a"]}}}majorFont/{{{NAMESPACES["a"]}}}latin')
+        # Graphe de relations typé, construit une seule fois au premier usage
+        self._relationship_graph = None
+        self._relationship_ids = None
+        self._slide_parts = None
+        self._presentation_part = None
 
-            if major_fonts:
-                fonts['major'] = major_fonts[0].get('typeface', 'Calibri')
+        # Préchargement concurrent (pool de threads créé au premier prefetch)
+        self.prefetch_workers = DEFAULT_PREFETCH_WORKERS
+        self.prefetch_limit = DEFAULT_PREFETCH_LIMIT
+        self._prefetch_executor = None
+        self._prefetch_pid = None
+        self._prefetched = OrderedDict()  # part_name -> Future((tree, size))
 
-            # Police mineure (corps de texte)
-            if LXML_AVAILABLE:
-                minor_fonts = scheme.xpath('.//a:minorFont/a:latin', namespaces=NAMESPACES)
-            else:
-                minor_fonts = scheme.findall(f'.//{{{NAMESPACES["a"]}}}minorFont/{{{NAMESPACES["a"]}}}latin')
+        # Charger les relations principales
+        self._load_main_relations()
 
-            if minor_fonts:
-                fonts['minor'] = minor_fonts[0].get('typeface', 'Calibri')
+    @staticmethod
+    def _open_archive(pptx_path: str, use_mmap: bool):
+        """Ouvre l'archive avec MappedZipReader si demandé, zipfile sinon (ou en repli)."""
+        if use_mmap:
+            try:
+                return MappedZipReader(pptx_path)
+            except (NotImplementedError, ValueError, OSError) as e:
+                print(f"[WARNING] Lecture mmap indisponible ({e}), utilisation de zipfile")
 
-        except Exception as e:
-            print(f"[WARNING] Erreur parsing font scheme: {e}")
+        return zipfile.ZipFile(pptx_path, 'r')
 
-        return fonts
+    @property
+    def is_mapped(self) -> bool:
+        """Indique si l'archive est lue par projection mémoire (partageable par fork)."""
+        return isinstance(self.zip_file, MappedZipReader)
 
-    def _extract_color_value(self, color_element) -> Optional[str]:
+    def read_part_buffer(self, part_name: str) -> Union[bytes, memoryview]:
         """
-        Extrait la valeur hexadécimale d'un élément couleur.
+        Lit le contenu décompressé d'une partie, sans copie si l'archive est projetée.
 
         Args:
-            color_element: Élément XML contenant une définition de couleur
+            part_name: Nom de la partie dans l'archive
 
         Returns:
-            Valeur hexadécimale ou None
+            memoryview (partie stockée d'une archive projetée) ou bytes
+
+        Raises:
+            KeyError: Partie absente de l'archive
         """
-        try:
-            # sRGB Color
-            if LXML_AVAILABLE:
-                srgb_colors = color_element.xpath('.//a:srgbClr', namespaces=NAMESPACES)
-            else:
-                srgb_colors = color_element.findall(f'.//{{{NAMESPACES["a"]}}}srgbClr')
+        if self.is_mapped:
+            return self.zip_file.read_buffer(part_name)
+        return self.zip_file.read(part_name)
 
-            if srgb_colors:
-                val = srgb_colors[0].get('val')
-                if val:
+    def _load_main_relations(self):
+        """Charge les relations principales du document."""
+        try:
+            main_rels = self.get_xml_tree('_rels/.rels')
+            if main_rels is not None:
+                self._relations_cache['main'] = self._parse_relations(main_rels)
+        except:
+            pass
+
+    @profiled('get_xml_tree')
+    def get_xml_tree(self, part_name: str):
+        """
+        Lit et parse un fichier XML depuis l'archive avec mise en cache.
+
+        Args:
+            part_name: Nom de la partie XML dans l'archive
+
+        Returns:
+            Arbre XML parsé ou None si inexistant
+        """
+        tree = self._xml_cache.get(part_name)
+        if tree is not None:
+            return tree
+
+        try:
+            future = self._prefetched.pop(part_name, None)
+            if future is not None:
+                # Partie préchargée : attendre la fin de son parsing en arrière-plan
+                with PROFILER.phase('prefetch_wait'):
+                    tree, size = future.result()
+            else:
+                # Décompression et parsing séparés pour être chronométrés distinctement
+                with PROFILER.phase('zip_read'):
+                    data = self.read_part_buffer(part_name)
+
+                with PROFILER.phase('xml_parse'):
+                    tree = self._parse_part(data)
+                size = len(data)
+
+            self._xml_cache.put(part_name, tree, size)
+            return tree
+
+        except (KeyError, *XML_PARSE_ERRORS) as e:
+            print(f"[WARNING] Impossible de lire {part_name}: {e}")
+            return None
+
+    @staticmethod
+    def _parse_part(data: Union[bytes, memoryview]):
+        """Parse le contenu d'une partie XML en arbre."""
+        if LXML_AVAILABLE:
+            # fromstring lit directement le tampon (y compris une vue du mmap)
+            return etree.fromstring(data).getroottree()
+
+        # Enregistrer les namespaces pour ElementTree
+        for prefix, uri in NAMESPACES.items():
+            etree.register_namespace(prefix, uri)
+        return etree.parse(io.BytesIO(data))
+
+    def _load_part(self, part_name: str):
+        """
+        Décompresse et parse une partie hors du cache (exécuté dans un thread de préchargement).
+
+        zlib et le parseur lxml relâchent le GIL : ce travail avance pendant que
+        le thread principal résout les styles de la slide courante. Le cache et
+        le profileur, non thread-safe, ne sont touchés que par le thread principal.
+
+        Returns:
+            Tuple (arbre, taille décompressée)
+        """
+        data = self.read_part_buffer(part_name)
+        return self._parse_part(data), len(data)
+
+    def prefetch(self, part_names: List[str]) -> int:
+        """
+        Précharge des parties XML en arrière-plan (décompression et parsing).
+
+        Les parties déjà en cache, déjà en cours de préchargement ou absentes
+        sont ignorées. Au plus prefetch_limit parties préchargées non consommées
+        sont conservées : au-delà, la plus ancienne demande est abandonnée (elle
+        sera simplement lue à la demande), ce qui borne la mémoire.
+
+        Args:
+            part_names: Parties dont le thread principal aura bientôt besoin
+
+        Returns:
+            Nombre de parties effectivement planifiées (0 si le préchargement est désactivé)
+        """
+        if self.prefetch_workers < 1:
+            # Machine mono-cœur : les threads ne feraient qu'ajouter du surcoût
+            return 0
+
+        if self._prefetch_pid != os.getpid():
+            # Premier appel, ou processus forké : les threads du parent n'existent pas ici
+            from concurrent.futures import ThreadPoolExecutor
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self.prefetch_workers, thread_name_prefix='pptx-prefetch'
+            )
+            self._prefetch_pid = os.getpid()
+            self._prefetched.clear()
+
+        scheduled = 0
+        for part_name in part_names:
+            if (not part_name or part_name not in self._part_names
+                    or part_name in self._prefetched or part_name in self._xml_cache):
+                continue
+
+            while len(self._prefetched) >= self.prefetch_limit:
+                _, stale = self._prefetched.popitem(last=False)
+                stale.cancel()
+
+            self._prefetched[part_name] = self._prefetch_executor.submit(self._load_part, part_name)
+            scheduled += 1
+
+        return scheduled
+
+    def _parse_relations(self, rels_tree) -> Dict[str, str]:
+        """
+        Parse un fichier .rels et retourne un mapping ID -> Target.
+
+        Args:
+            rels_tree: Arbre XML du fichier .rels
+
+        Returns:
+            Dict mapping relation ID vers target path
+        """
+        relations = {}
+
+        # Le namespace pour les fichiers .rels est différent
+        rels_ns = RELS_NAMESPACE
+
+        # Même chemin Clark pour lxml et ElementTree
+        rels = rels_tree.getroot().iter(f'{{{rels_ns}}}Relationship')
+
+        for rel in rels:
+            rel_id = rel.get('Id')
+            target = rel.get('Target')
+            rel_type = rel.get('Type')
+            if rel_id and target:
+                relations[rel_id] = target
+
+        return relations
+
+    def _get_rels_part_name(self, part_name: str) -> str:
+        """
+        Retourne le nom du fichier .rels associé à une partie.
+
+        Args:
+            part_name: Nom de la partie (ex: 'ppt/slides/slide1.xml', '' pour le package)
+
+        Returns:
+            Nom de la partie .rels (ex: 'ppt/slides/_rels/slide1.xml.rels')
+        """
+        directory, filename = posixpath.split(part_name)
+        return posixpath.join(directory, '_rels', f'{filename}.rels')
+
+    def _resolve_target(self, source_part_name: str, target: str) -> str:
+        """Résout une cible de relation relative en nom de partie absolu."""
+        if target.startswith('/'):
+            return target.lstrip('/')
+        return posixpath.normpath(posixpath.join(posixpath.dirname(source_part_name), target))
+
+    def _read_typed_relationships(self, part_name: str) -> List[Dict[str, str]]:
+        """
+        Lit les relations d'une partie avec leur type court et leur cible résolue.
+
+        Le fichier .rels n'est pas conservé dans le cache XML : il n'est lu
+        qu'une fois, lors de la construction du graphe de relations.
+
+        Args:
+            part_name: Nom de la partie source
+
+        Returns:
+            Liste de dicts {'id', 'type', 'target'}
+        """
+        rels_name = self._get_rels_part_name(part_name)
+        if rels_name not in self._part_names:
+            return []
+
+        try:
+            rels_root = etree.fromstring(self.read_part_buffer(rels_name))
+        except XML_PARSE_ERRORS as e:
+            print(f"[WARNING] Impossible de lire {rels_name}: {e}")
+            return []
+
+        relationships = []
+        for rel in rels_root.iter(f'{{{RELS_NAMESPACE}}}Relationship'):
+            rel_id = rel.get('Id')
+            target = rel.get('Target')
+            rel_type = rel.get('Type', '')
+            if not rel_id or not target or rel.get('TargetMode') == 'External':
+                continue
+
+            relationships.append({
+                'id': rel_id,
+                'type': rel_type.rsplit('/', 1)[-1],
+                'target': self._resolve_target(part_name, target)
+            })
+
+        return relationships
+
+    def _ensure_relationship_graph(self):
+        """
+        Construit le graphe de relations typé (une seule fois, au premier usage).
+
+        Parcourt presentation -> slides -> layout -> master -> theme,
+        ainsi que notesSlide et media, pour que chaque résolution ultérieure
+        soit un simple accès dictionnaire.
+        """
+        if self._relationship_graph is not None:
+            return
+
+        graph = {}
+        relationship_ids = {}
+
+        package_rels = self._read_typed_relationships('')
+        presentation_part = next(
+            (rel['target'] for rel in package_rels if rel['type'] == 'officeDocument'),
+            'ppt/presentation.xml'
+        )
+
+        pending = [presentation_part]
+        while pending:
+            part_name = pending.pop()
+            if part_name in graph:
+                continue
+
+            part_rels = {}
+            rel_ids = {}
+            for rel in self._read_typed_relationships(part_name):
+                part_rels.setdefault(rel['type'], []).append(rel['target'])
+                rel_ids[rel['id']] = rel['target']
+                if rel['type'] in FOLLOWED_RELATIONSHIP_TYPES and rel['target'] not in graph:
+                    pending.append(rel['target'])
+
+            graph[part_name] = part_rels
+            relationship_ids[part_name] = rel_ids
+
+        # Ordre des slides selon sldIdLst (et non selon les noms de fichiers)
+        slide_parts = []
+        presentation_tree = self.get_xml_tree(presentation_part) if presentation_part in self._part_names else None
+        if presentation_tree is not None:
+            presentation_rel_ids = relationship_ids.get(presentation_part, {})
+            for sld_id in presentation_tree.getroot().iter(f'{{{NAMESPACES["p"]}}}sldId'):
+                target = presentation_rel_ids.get(sld_id.get(f'{{{NAMESPACES["r"]}}}id'))
+                if target:
+                    slide_parts.append(target)
+
+        self._presentation_part = presentation_part
+        self._relationship_graph = graph
+        self._relationship_ids = relationship_ids
+        self._slide_parts = slide_parts
+
+    def _get_related_part(self, part_name: Optional[str], rel_type: str) -> Optional[str]:
+        """Retourne la première cible d'un type de relation donné (accès O(1))."""
+        if not part_name:
+            return None
+
+        self._ensure_relationship_graph()
+        targets = self._relationship_graph.get(part_name, {}).get(rel_type)
+        return targets[0] if targets else None
+
+    def get_slide_parts(self) -> List[str]:
+        """
+        Retourne les parties slide dans l'ordre de présentation (sldIdLst).
+
+        Returns:
+            Liste des noms de parties slide
+        """
+        self._ensure_relationship_graph()
+        return list(self._slide_parts)
+
+    def get_relationship_target(self, part_name: str, rel_id: str) -> Optional[str]:
+        """
+        Résout un identifiant de relation (rId) d'une partie donnée.
+
+        Args:
+            part_name: Nom de la partie source
+            rel_id: Identifiant de relation (ex: 'rId2')
+
+        Returns:
+            Nom de la partie cible ou None
+        """
+        self._ensure_relationship_graph()
+        return self._relationship_ids.get(part_name, {}).get(rel_id)
+
+    def get_slide_layout_part(self, slide_part_name: str) -> Optional[str]:
+        """
+        Trouve la partie layout d'une slide donnée.
+
+        Args:
+            slide_part_name: Nom de la partie slide (ex: 'ppt/slides/slide1.xml')
+
+        Returns:
+            Nom de la partie layout ou None
+        """
+        return self._get_related_part(slide_part_name, 'slideLayout')
+
+    def get_slide_master_part(self, layout_part_name: str) -> Optional[str]:
+        """
+        Trouve la partie master d'un layout donné.
+
+        Args:
+            layout_part_name: Nom de la partie layout
+
+        Returns:
+            Nom de la partie master ou None
+        """
+        return self._get_related_part(layout_part_name, 'slideMaster')
+
+    def get_theme_part(self, master_part_name: str) -> Optional[str]:
+        """
+        Trouve la partie theme d'un master donné.
+
+        Args:
+            master_part_name: Nom de la partie master
+
+        Returns:
+            Nom de la partie theme ou None
+        """
+        return self._get_related_part(master_part_name, 'theme')
+
+    def get_notes_slide_part(self, slide_part_name: str) -> Optional[str]:
+        """
+        Trouve la partie notesSlide d'une slide donnée.
+
+        Args:
+            slide_part_name: Nom de la partie slide
+
+        Returns:
+            Nom de la partie notesSlide ou None
+        """
+        return self._get_related_part(slide_part_name, 'notesSlide')
+
+    def get_media_parts(self, part_name: str) -> List[str]:
+        """
+        Liste les médias (images, vidéos, audio) référencés par une partie.
+
+        Args:
+            part_name: Nom de la partie source (slide, layout ou master)
+
+        Returns:
+            Liste des noms de parties média
+        """
+        self._ensure_relationship_graph()
+        part_rels = self._relationship_graph.get(part_name, {})
+        media = []
+        for rel_type in MEDIA_RELATIONSHIP_TYPES:
+            media.extend(part_rels.get(rel_type, []))
+        return media
+
+    def get_placeholder_index(self, part_name: str) -> Optional['PlaceholderIndex']:
+        """
+        Retourne l'index d'héritage des placeholders d'un layout ou d'un master.
+
+        L'index est construit une seule fois par partie et partagé par toutes
+        les slides qui l'utilisent.
+
+        Args:
+            part_name: Nom de la partie layout ou master
+
+        Returns:
+            PlaceholderIndex ou None si la partie est introuvable
+        """
+        if part_name in self._placeholder_indexes:
+            return self._placeholder_indexes[part_name]
+
+        tree = self.get_xml_tree(part_name) if part_name else None
+        index = PlaceholderIndex(tree) if tree is not None else None
+        self._placeholder_indexes[part_name] = index
+        return index
+
+    def get_theme(self, theme_part_name: str) -> Optional['Theme']:
+        """
+        Retourne l'objet Theme d'une partie thème, parsé une seule fois par package.
+
+        Args:
+            theme_part_name: Nom de la partie thème (ex: 'ppt/theme/theme1.xml')
+
+        Returns:
+            Theme ou None si la partie est introuvable
+        """
+        if theme_part_name in self._themes:
+            return self._themes[theme_part_name]
+
+        theme_tree = self.get_xml_tree(theme_part_name) if theme_part_name else None
+        theme = Theme(theme_tree) if theme_tree is not None else None
+        self._themes[theme_part_name] = theme
+        return theme
+
+    def theme_for(self, master_part_name: Optional[str]) -> Optional['Theme']:
+        """
+        Retourne le thème partagé d'un master (schémas couleurs/polices parsés une fois).
+
+        Args:
+            master_part_name: Nom de la partie master
+
+        Returns:
+            Theme ou None si le master n'a pas de thème
+        """
+        theme_part = self.get_theme_part(master_part_name) if master_part_name else None
+        return self.get_theme(theme_part) if theme_part else None
+
+    def get_part_crc(self, part_name: str) -> Optional[int]:
+        """
+        Retourne le CRC-32 d'une partie tel qu'enregistré dans l'archive ZIP.
+
+        Args:
+            part_name: Nom de la partie
+
+        Returns:
+            CRC-32 de la partie ou None si elle est absente
+        """
+        if part_name not in self._part_names:
+            return None
+        return self.zip_file.getinfo(part_name).CRC
+
+    def get_slide_inputs(self, slide_part_name: str) -> Dict[str, Optional[int]]:
+        """
+        Liste les parties dont dépend l'extraction d'une slide, avec leur CRC-32.
+
+        Args:
+            slide_part_name: Nom de la partie slide
+
+        Returns:
+            Dict nom de partie -> CRC-32 (slide, layout, master, thème)
+        """
+        return {part: self.get_part_crc(part) for part in self.get_slide_dependencies(slide_part_name)}
+
+    def get_slide_dependencies(self, slide_part_name: str, include_notes: bool = False) -> List[str]:
+        """
+        Liste les parties XML lues pour extraire une slide.
+
+        Args:
+            slide_part_name: Nom de la partie slide
+            include_notes: Inclure la partie notesSlide si elle existe
+
+        Returns:
+            Parties dans l'ordre slide, layout, master, thème (puis notes)
+        """
+        parts = [slide_part_name]
+        layout_part = self.get_slide_layout_part(slide_part_name)
+        master_part = self.get_slide_master_part(layout_part) if layout_part else None
+        theme_part = self.get_theme_part(master_part) if master_part else None
+        parts.extend(part for part in (layout_part, master_part, theme_part) if part)
+
+        if include_notes:
+            notes_part = self.get_notes_slide_part(slide_part_name)
+            if notes_part:
+                parts.append(notes_part)
+
+        return parts
+
+    def release_part(self, part_name: str) -> bool:
+        """
+        Libère l'arbre XML d'une partie déjà traitée (ex: slide extraite).
+
+        Les layouts, masters et thèmes restent épinglés.
+
+        Args:
+            part_name: Nom de la partie à libérer
+
+        Returns:
+            bool: True si la partie était en cache et a été libérée
+        """
+        future = self._prefetched.pop(part_name, None)
+        if future is not None:
+            future.cancel()
+        return self._xml_cache.release(part_name)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache XML (hits, misses, évictions, octets)."""
+        return self._xml_cache.stats()
+
+    def close(self):
+        """Arrête le préchargement et ferme l'archive ZIP."""
+        for future in self._prefetched.values():
+            future.cancel()
+        if self._prefetch_executor is not None and self._prefetch_pid == os.getpid():
+            self._prefetch_executor.shutdown(wait=True)
+        self._prefetch_executor = None
+        self._prefetch_pid = None
+        self._prefetched.clear()
+
+        if self.zip_file:
+            self.zip_file.close()
+
+
+# =============================================================================
+# CLASSE Theme - Schémas de Couleurs et Polices
+# =============================================================================
+
+class Theme:
+    """
+    Parse et met en cache les schémas de couleurs et polices du thème.
+
+    Le thème définit les palettes de base qui sont ensuite référencées
+    sémantiquement dans toute la présentation.
+    """
+
+    def __init__(self, theme_tree):
+        """
+        Initialise le thème depuis son arbre XML.
+
+        Args:
+            theme_tree: Arbre XML du fichier theme.xml
+        """
+        self.tree = theme_tree
+        self.colors = self._parse_color_scheme()
+        self.fonts = self._parse_font_scheme()
+
+    def _parse_color_scheme(self) -> Dict[str, str]:
+        """
+        Parse le schéma de couleurs <a:clrScheme> et extrait les couleurs.
+
+        Returns:
+            Dict mapping nom couleur -> valeur hex
+        """
+        colors = {}
+
+        if self.tree is None:
+            return colors
+
+        try:
+            color_scheme = xpath_all(self.tree, 'clr_scheme')
+
+            if not color_scheme:
+                return colors
+
+            scheme = color_scheme[0]
+
+            # Couleurs standard du thème (expression paramétrée par $color)
+            for color_name in THEME_COLOR_NAMES:
+                color_elements = xpath_all(scheme, 'theme_color', color=color_name)
+
+                if color_elements:
+                    color_elem = color_elements[0]
+                    hex_color = self._extract_color_value(color_elem)
+                    if hex_color:
+                        colors[color_name] = hex_color
+
+        except Exception as e:
+            print(f"[WARNING] Erreur parsing color scheme: {e}")
+
+        return colors
+
+    def _parse_font_scheme(self) -> Dict[str, str]:
+        """
+        Parse le schéma de polices <a:fontScheme> et extrait les polices.
+
+        Returns:
+            Dict mapping type police -> nom police
+        """
+        fonts = {}
+
+        if self.tree is None:
+            return fonts
+
+        try:
+            font_scheme = xpath_all(self.tree, 'font_scheme')
+
+            if not font_scheme:
+                return fonts
+
+            scheme = font_scheme[0]
+
+            # Police majeure (titres)
+            major_fonts = xpath_all(scheme, 'major_latin')
+
+            if major_fonts:
+                fonts['major'] = major_fonts[0].get('typeface', 'Calibri')
+
+            # Police mineure (corps de texte)
+            minor_fonts = xpath_all(scheme, 'minor_latin')
+
+            if minor_fonts:
+                fonts['minor'] = minor_fonts[0].get('typeface', 'Calibri')
+
+        except Exception as e:
+            print(f"[WARNING] Erreur parsing font scheme: {e}")
+
+        return fonts
+
+    def _extract_color_value(self, color_element) -> Optional[str]:
+        """
+        Extrait la valeur hexadécimale d'un élément couleur.
+
+        Args:
+            color_element: Élément XML contenant une définition de couleur
+
+        Returns:
+            Valeur hexadécimale ou None
+        """
+        try:
+            # sRGB Color
+            srgb_colors = xpath_all(color_element, 'srgb_clr')
+
+            if srgb_colors:
+                val = srgb_colors[0].get('val')
+                if val:
                     return f"#{val.upper()}"
 
             # System Color
-            if LXML_AVAILABLE:
-                sys_colors = color_element.xpath('.//a:sysClr', namespaces=NAMESPACES)
-            else:
-                sys_colors = color_element.findall(f'.//{{{NAMESPACES["a"]}}}sysClr')
+            sys_colors = xpath_all(color_element, 'sys_clr')
 
             if sys_colors:
                 val = sys_colors[0].get('lastClr') or sys_colors[0].get('val')
@@ -509,19 +1423,341 @@ class Theme:
             }
             color = default_colors.get(scheme_color_name)
 
-        return color
+        return color
+
+    def get_font(self, font_scheme_name: str) -> Optional[str]:
+        """
+        Obtient le nom d'une police de thème.
+
+        Args:
+            font_scheme_name: Type de police ('major' ou 'minor')
+
+        Returns:
+            Nom de la police ou None
+        """
+        return self.fonts.get(font_scheme_name)
+
+
+# =============================================================================
+# CLASSES de Données - Enregistrements Compacts des Résultats d'Extraction
+# =============================================================================
+#
+# Tuples nommés (sans __dict__ par instance) : les styles résolus et les formes
+# extraites ne deviennent des dict JSON qu'à la sortie (extract_metadata).
+
+class Margins(NamedTuple):
+    """Marges internes d'un text frame, en points (None si non résolue)."""
+
+    margin_left: Optional[float] = None
+    margin_right: Optional[float] = None
+    margin_top: Optional[float] = None
+    margin_bottom: Optional[float] = None
+
+    def fill_missing(self, values: Dict[str, Optional[float]]) -> 'Margins':
+        """
+        Complète les marges absentes sans écraser celles déjà résolues.
+
+        Args:
+            values: Marges candidates par nom de champ
+
+        Returns:
+            Nouvelles marges (self si rien n'a été complété)
+        """
+        missing = {key: value for key, value in values.items() if getattr(self, key) is None}
+        return self._replace(**missing) if missing else self
+
+
+class Autofit(NamedTuple):
+    """Ajustement automatique du texte (normAutofit / spAutofit)."""
+
+    type: str = 'none'  # none, normal, shape
+    font_scale: Optional[float] = None
+    line_spacing_reduction: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON."""
+        return self._asdict()
+
+
+# Autofit par défaut (aucun ajustement), partagé car immuable
+NO_AUTOFIT = Autofit()
+
+
+class ShapePosition(NamedTuple):
+    """Position et dimensions d'une forme, en points."""
+
+    left: float = 0
+    top: float = 0
+    width: float = 0
+    height: float = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Représentation JSON."""
+        return self._asdict()
+
+
+class ResolvedTextStyle(NamedTuple):
+    """Propriétés de texte d'un run après résolution de la cascade d'héritage."""
+
+    font_name: Optional[str] = None
+    font_size: Optional[float] = None
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    underline: Optional[bool] = None
+    color: Optional[str] = None
+    alignment: Optional[str] = None
+    vertical_alignment: Optional[str] = None
+    margins: Margins = Margins()
+    text_wrapping: Optional[str] = None  # None : pas de forme parente
+    autofit: Optional[Autofit] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON (marges à plat, propriétés de forme si résolues)."""
+        style = {
+            'font_name': self.font_name,
+            'font_size': self.font_size,
+            'bold': self.bold,
+            'italic': self.italic,
+            'underline': self.underline,
+            'color': self.color,
+            'alignment': self.alignment,
+            'vertical_alignment': self.vertical_alignment,
+        }
+        style.update(self.margins._asdict())
+
+        if self.text_wrapping is not None:
+            style['text_wrapping'] = self.text_wrapping
+        if self.autofit is not None:
+            style['autofit'] = self.autofit.to_dict()
+
+        return style
+
+
+class ExtractedShape(NamedTuple):
+    """Forme extraite d'une slide (champs optionnels omis du JSON si absents)."""
+
+    name: str
+    shape_id: int
+    type: str
+    position: ShapePosition
+    placeholder_type: Optional[str] = None
+    placeholder_idx: Optional[int] = None
+    image: Optional[str] = None
+    graphic_type: Optional[str] = None
+    shapes: Optional[List['ExtractedShape']] = None  # Enfants d'un groupe
+    text: Optional[str] = None
+    style: Optional[ResolvedTextStyle] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON de la forme et de ses enfants."""
+        shape = {
+            'name': self.name,
+            'shape_id': self.shape_id,
+            'type': self.type,
+            'position': self.position.to_dict(),
+        }
+
+        if self.placeholder_type is not None:
+            shape['placeholder_type'] = self.placeholder_type
+        if self.placeholder_idx is not None:
+            shape['placeholder_idx'] = self.placeholder_idx
+        if self.image is not None:
+            shape['image'] = self.image
+        if self.graphic_type is not None:
+            shape['graphic_type'] = self.graphic_type
+        if self.shapes is not None:
+            shape['shapes'] = [child.to_dict() for child in self.shapes]
+
+        if self.text is not None:
+            shape['text'] = self.text
+            if self.style is not None:
+                shape.update(self.style.to_dict())
+
+        return shape
+
+
+class ExtractedSlide(NamedTuple):
+    """Résultat d'extraction d'une slide."""
+
+    slide_number: int
+    layout_name: str
+    shapes: List[ExtractedShape]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON (format de sortie de extract_metadata)."""
+        return {
+            'slide_number': self.slide_number,
+            'layout_name': self.layout_name,
+            'extraction_method': 'xml_direct_analysis_with_inheritance',
+            'shapes': [shape.to_dict() for shape in self.shapes],
+            'total_shapes': len(self.shapes),
+        }
+
+
+# =============================================================================
+# CLASSE PlaceholderIndex - Index d'Héritage par Layout / Master
+# =============================================================================
+
+class PlaceholderIndex:
+    """
+    Index des propriétés héritables des placeholders d'un layout ou d'un master.
+
+    Construit une seule fois par partie (voir PPTXPackage.get_placeholder_index)
+    et partagé par toutes les slides qui l'utilisent. Chaque clé
+    (placeholder_type, placeholder_idx) donne accès, dans l'ordre du document,
+    aux valeurs brutes lstStyle defRPr, alignement, marges bodyPr, autofit,
+    wrap et xfrm. La résolution dépendante du thème (couleurs, polices +mn-lt)
+    reste à la charge du StyleResolver.
+    """
+
+    def __init__(self, tree):
+        """
+        Construit l'index depuis l'arbre XML d'un layout ou d'un master.
+
+        Args:
+            tree: Arbre XML de la partie (ou None)
+        """
+        # (type brut, idx) -> entrées dans l'ordre du document
+        self.entries: Dict[tuple, List[Dict[str, Any]]] = {}
+        # (type ou 'body', idx) -> premier xfrm trouvé
+        self.xfrms: Dict[tuple, Any] = {}
+        # (section, niveau) -> styles <p:txStyles> (masters uniquement)
+        self.text_styles: Dict[tuple, Dict[str, Any]] = {}
+
+        if tree is None:
+            return
+
+        for ph_shape in find_placeholder_shapes(tree):
+            ph_elem = xpath_first(ph_shape, 'placeholder')
+            ph_type = ph_elem.get('type')
+            ph_idx = self._parse_idx(ph_elem.get('idx'))
+
+            entry = self._build_entry(ph_shape)
+            self.entries.setdefault((ph_type, ph_idx), []).append(entry)
+
+            xfrm_key = (ph_type or 'body', ph_idx)
+            if entry['xfrm'] is not None and xfrm_key not in self.xfrms:
+                self.xfrms[xfrm_key] = entry['xfrm']
+
+        for section in TEXT_STYLE_SECTIONS:
+            for level in TEXT_STYLE_LEVELS[:3]:
+                def_rpr = xpath_first(tree, 'master_level_def_rpr', section=section, level=level)
+                if def_rpr is None:
+                    continue
+                ppr = xpath_first(tree, 'master_level_ppr', section=section, level=level)
+                self.text_styles[(section, level)] = {
+                    'def_rpr': self._extract_def_rpr(def_rpr),
+                    'algn': ppr.get('algn') if ppr is not None else None
+                }
+
+    @staticmethod
+    def _parse_idx(idx_str: Optional[str]) -> Optional[int]:
+        """Convertit l'attribut idx d'un placeholder (None si absent ou invalide)."""
+        if idx_str and idx_str != "None":
+            try:
+                return int(idx_str)
+            except ValueError:
+                pass
+        return None
+
+    @staticmethod
+    def _extract_def_rpr(def_rpr) -> Dict[str, Any]:
+        """Extrait les valeurs brutes d'un élément <a:defRPr>."""
+        font_size = None
+        sz = def_rpr.get('sz')
+        if sz:
+            try:
+                font_size = int(sz) / CENTIPOINTS_PER_POINT
+            except ValueError:
+                pass
+
+        latin = xpath_first(def_rpr, 'latin')
+        scheme_clr = xpath_first(def_rpr, 'solid_fill_scheme_clr')
+
+        return {
+            'font_size': font_size,
+            'typeface': latin.get('typeface') if latin is not None else None,
+            'bold': def_rpr.get('b') == '1',
+            'italic': def_rpr.get('i') == '1',
+            'scheme_color': scheme_clr.get('val') if scheme_clr is not None else None
+        }
+
+    @staticmethod
+    def _extract_insets(body_pr) -> Margins:
+        """Extrait les marges (lIns, rIns, tIns, bIns) en points, None si absentes."""
+        insets = {}
+        for key, attr in (('margin_left', 'lIns'), ('margin_right', 'rIns'),
+                          ('margin_top', 'tIns'), ('margin_bottom', 'bIns')):
+            value = body_pr.get(attr)
+            if value is not None:
+                try:
+                    insets[key] = round(int(value) / EMU_PER_POINT, 2)
+                except (ValueError, TypeError):
+                    pass
+        return Margins(**insets)
+
+    @staticmethod
+    def _extract_autofit(body_pr) -> Autofit:
+        """Extrait l'autofit (normAutofit / spAutofit) d'un élément bodyPr."""
+        if body_pr is None:
+            return NO_AUTOFIT
+
+        norm_autofit = xpath_first(body_pr, 'norm_autofit')
+        if norm_autofit is not None:
+            font_scale = None
+            line_spacing_reduction = None
+            try:
+                value = norm_autofit.get('fontScale')
+                if value:
+                    font_scale = int(value) / 1000
+
+                value = norm_autofit.get('lnSpcReduction')
+                if value:
+                    line_spacing_reduction = int(value) / 1000
+            except ValueError:
+                pass
+
+            return Autofit('normal', font_scale, line_spacing_reduction)
 
-    def get_font(self, font_scheme_name: str) -> Optional[str]:
-        """
-        Obtient le nom d'une police de thème.
+        if xpath_first(body_pr, 'sp_autofit') is not None:
+            return Autofit('shape')
 
-        Args:
-            font_scheme_name: Type de police ('major' ou 'minor')
+        return NO_AUTOFIT
 
-        Returns:
-            Nom de la police ou None
-        """
-        return self.fonts.get(font_scheme_name)
+    def _build_entry(self, ph_shape) -> Dict[str, Any]:
+        """Précalcule toutes les propriétés héritables d'un placeholder."""
+        def_rpr = xpath_first(ph_shape, 'def_rpr')
+        body_pr = xpath_first(ph_shape, 'body_pr')
+
+        # Alignement : premier pPr / lvlNpPr portant un attribut algn
+        algn = None
+        for ppr_name in ('ppr', 'lvl1_ppr', 'lvl2_ppr', 'lvl3_ppr'):
+            ppr = xpath_first(ph_shape, ppr_name)
+            if ppr is not None and ppr.get('algn'):
+                algn = ppr.get('algn')
+                break
+
+        return {
+            'def_rpr': self._extract_def_rpr(def_rpr) if def_rpr is not None else None,
+            'algn': algn,
+            'has_body_pr': body_pr is not None,
+            'insets': self._extract_insets(body_pr) if body_pr is not None else None,
+            'wrap': body_pr.get('wrap') if body_pr is not None else None,
+            'autofit': self._extract_autofit(body_pr),
+            'xfrm': xpath_first(ph_shape, 'sp_pr_xfrm')
+        }
+
+    def get_entries(self, placeholder_type: Optional[str], placeholder_idx: Optional[int]) -> List[Dict[str, Any]]:
+        """Entrées correspondant exactement à (type, idx), dans l'ordre du document."""
+        return self.entries.get((placeholder_type, placeholder_idx), [])
+
+    def get_xfrm(self, placeholder_type: Optional[str], placeholder_idx: Optional[int]):
+        """Premier xfrm d'un placeholder (type absent traité comme 'body')."""
+        return self.xfrms.get((placeholder_type, placeholder_idx))
+
+    def get_text_style(self, section: str, level: str) -> Optional[Dict[str, Any]]:
+        """Style <p:txStyles> d'une section et d'un niveau (masters uniquement)."""
+        return self.text_styles.get((section, level))
 
 
 # =============================================================================
@@ -536,7 +1772,9 @@ class StyleResolver:
     pour chaque propriété de formatage (police, couleur, taille, etc.).
     """
 
-    def __init__(self, slide_tree, layout_tree, master_tree, theme: Theme):
+    def __init__(self, slide_tree, layout_tree, master_tree, theme: Theme,
+                 layout_index: Optional[PlaceholderIndex] = None,
+                 master_index: Optional[PlaceholderIndex] = None):
         """
         Initialise le résolveur de styles.
 
@@ -545,6 +1783,8 @@ class StyleResolver:
             layout_tree: Arbre XML du layout
             master_tree: Arbre XML du master
             theme: Objet Theme parsé
+            layout_index: Index d'héritage partagé du layout (construit si absent)
+            master_index: Index d'héritage partagé du master (construit si absent)
         """
         self.slide_tree = slide_tree
         self.layout_tree = layout_tree
@@ -552,7 +1792,60 @@ class StyleResolver:
         self.theme = theme
         self.nsmap = NAMESPACES
 
-    def resolve_text_properties(self, run_element, paragraph_element, shape_element, placeholder_idx: Optional[int] = None, placeholder_type: Optional[str] = None) -> Dict[str, Any]:
+        if layout_index is None and layout_tree is not None:
+            layout_index = PlaceholderIndex(layout_tree)
+        if master_index is None and master_tree is not None:
+            master_index = PlaceholderIndex(master_tree)
+
+        self.layout_index = layout_index
+        self.master_index = master_index
+
+        # bodyPr de la forme en cours, fourni par le parcours de l'extracteur
+        self._shape_context = (None, None)
+
+    def set_shape_context(self, shape_element, body_pr):
+        """
+        Mémorise le bodyPr déjà collecté pour la forme en cours d'extraction.
+
+        Args:
+            shape_element: Élément forme en cours
+            body_pr: Son élément <a:bodyPr> (ou None)
+        """
+        self._shape_context = (shape_element, body_pr)
+
+    def _find_body_pr(self, shape_element) -> list:
+        """Retourne le bodyPr d'une forme (mémorisé si c'est la forme en cours)."""
+        current_shape, body_pr = self._shape_context
+        if current_shape is shape_element:
+            return [body_pr] if body_pr is not None else []
+        return xpath_all(shape_element, 'body_pr')
+
+    @staticmethod
+    def run_style_signature(run_element) -> tuple:
+        """
+        Calcule une signature canonique du formatage direct d'un run.
+
+        Deux runs de même signature se résolvent à l'identique dans un même
+        contexte (paragraphe, shape, placeholder) : la résolution ne lit que
+        le sous-arbre <a:rPr> du run. Les attributs sans effet sur le style
+        (langue, marqueurs de correction) sont ignorés.
+
+        Args:
+            run_element: Élément <a:r>
+
+        Returns:
+            tuple: Signature hashable (tag, attributs triés, texte, enfants)
+        """
+        def element_signature(element):
+            attributes = tuple(sorted((name, value) for name, value in element.attrib.items()
+                                      if name not in RUN_SIGNATURE_IGNORED_ATTRIBUTES))
+            return (element.tag, attributes, (element.text or '').strip(),
+                    tuple(element_signature(child) for child in element))
+
+        return tuple(element_signature(rpr) for rpr in xpath_all(run_element, 'rpr'))
+
+    @profiled('style_resolution')
+    def resolve_text_properties(self, run_element, paragraph_element, shape_element, placeholder_idx: Optional[int] = None, placeholder_type: Optional[str] = None) -> ResolvedTextStyle:
         """
         Résout toutes les propriétés de texte pour un run donné.
 
@@ -563,51 +1856,34 @@ class StyleResolver:
             placeholder_idx: Index du placeholder si applicable
 
         Returns:
-            Dict avec toutes les propriétés de formatage résolues
+            ResolvedTextStyle avec toutes les propriétés de formatage résolues
         """
+        # Résoudre chaque propriété via la cascade
         properties = {
-            'font_name': None,
-            'font_size': None,
-            'bold': None,
-            'italic': None,
-            'underline': None,
-            'color': None,
-            'alignment': None,
-            'vertical_alignment': None,
-            'margin_left': None,
-            'margin_right': None,
-            'margin_top': None,
-            'margin_bottom': None
+            'font_name': self._resolve_font_name(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'font_size': self._resolve_font_size(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'bold': self._resolve_bold(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'italic': self._resolve_italic(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'underline': self._resolve_underline(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'color': self._resolve_color(run_element, paragraph_element, placeholder_idx, placeholder_type),
+            'alignment': self._resolve_alignment(paragraph_element, placeholder_idx, placeholder_type),
         }
 
-        # Résoudre chaque propriété via la cascade
-        properties['font_name'] = self._resolve_font_name(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['font_size'] = self._resolve_font_size(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['bold'] = self._resolve_bold(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['italic'] = self._resolve_italic(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['underline'] = self._resolve_underline(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['color'] = self._resolve_color(run_element, paragraph_element, placeholder_idx, placeholder_type)
-        properties['alignment'] = self._resolve_alignment(paragraph_element, placeholder_idx, placeholder_type)
-
         # Propriétés de shape/text frame
         if shape_element is not None:
-            margins = self._resolve_margins(shape_element)
-            properties.update(margins)
+            properties['margins'] = self._resolve_margins(shape_element)
             properties['vertical_alignment'] = self._resolve_vertical_alignment(shape_element)
             properties['text_wrapping'] = self._resolve_text_wrapping(shape_element, placeholder_idx, placeholder_type)
             properties['autofit'] = self._resolve_autofit(shape_element, placeholder_idx, placeholder_type)
 
-        return properties
+        return ResolvedTextStyle(**properties)
 
     def _resolve_font_name(self, run_element, paragraph_element, placeholder_idx: Optional[int], placeholder_type: Optional[str] = None) -> Optional[str]:
         """Résout le nom de la police via la cascade d'héritage."""
 
         # 1. Vérifier formatage direct sur le run
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr/a:latin', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr/{{{self.nsmap["a"]}}}latin')
+            rpr = xpath_all(run_element, 'rpr_latin')
 
             if rpr:
                 typeface = rpr[0].get('typeface')
@@ -616,10 +1892,7 @@ class StyleResolver:
 
         # 2. Vérifier propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr/a:latin', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr/{{{self.nsmap["a"]}}}latin')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr_latin')
 
             if def_rpr:
                 typeface = def_rpr[0].get('typeface')
@@ -646,10 +1919,7 @@ class StyleResolver:
 
         # 1. Formatage direct sur le run
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr')
+            rpr = xpath_all(run_element, 'rpr')
 
             if rpr and rpr[0].get('sz'):
                 try:
@@ -659,10 +1929,7 @@ class StyleResolver:
 
         # 2. Propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr')
 
             if def_rpr and def_rpr[0].get('sz'):
                 try:
@@ -690,10 +1957,7 @@ class StyleResolver:
 
         # 1. Formatage direct
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr')
+            rpr = xpath_all(run_element, 'rpr')
 
             if rpr:
                 bold_attr = rpr[0].get('b')
@@ -702,10 +1966,7 @@ class StyleResolver:
 
         # 2. Propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr')
 
             if def_rpr:
                 bold_attr = def_rpr[0].get('b')
@@ -726,10 +1987,7 @@ class StyleResolver:
 
         # 1. Formatage direct
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr')
+            rpr = xpath_all(run_element, 'rpr')
 
             if rpr:
                 italic_attr = rpr[0].get('i')
@@ -738,10 +1996,7 @@ class StyleResolver:
 
         # 2. Propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr')
 
             if def_rpr:
                 italic_attr = def_rpr[0].get('i')
@@ -761,10 +2016,7 @@ class StyleResolver:
 
         # 1. Formatage direct
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr')
+            rpr = xpath_all(run_element, 'rpr')
 
             if rpr:
                 underline_attr = rpr[0].get('u')
@@ -773,10 +2025,7 @@ class StyleResolver:
 
         # 2. Propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr')
 
             if def_rpr:
                 underline_attr = def_rpr[0].get('u')
@@ -790,10 +2039,7 @@ class StyleResolver:
 
         # 1. Formatage direct dans les propriétés du run (a:rPr)
         if run_element is not None:
-            if LXML_AVAILABLE:
-                rpr = run_element.xpath('.//a:rPr', namespaces=self.nsmap)
-            else:
-                rpr = run_element.findall(f'.//{{{self.nsmap["a"]}}}rPr')
+            rpr = xpath_all(run_element, 'rpr')
 
             if rpr:
                 color = self._extract_color_from_element(rpr[0])
@@ -802,10 +2048,7 @@ class StyleResolver:
 
         # 2. Propriétés par défaut du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                def_rpr = paragraph_element.xpath('.//a:pPr/a:defRPr', namespaces=self.nsmap)
-            else:
-                def_rpr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr/{{{self.nsmap["a"]}}}defRPr')
+            def_rpr = xpath_all(paragraph_element, 'ppr_def_rpr')
 
             if def_rpr:
                 color = self._extract_color_from_element(def_rpr[0])
@@ -831,10 +2074,7 @@ class StyleResolver:
 
         # 1. Propriétés directes du paragraphe
         if paragraph_element is not None:
-            if LXML_AVAILABLE:
-                ppr = paragraph_element.xpath('.//a:pPr', namespaces=self.nsmap)
-            else:
-                ppr = paragraph_element.findall(f'.//{{{self.nsmap["a"]}}}pPr')
+            ppr = xpath_all(paragraph_element, 'ppr')
 
             if ppr:
                 algn = ppr[0].get('algn')
@@ -855,24 +2095,16 @@ class StyleResolver:
 
         return 'LEFT'  # Gauche par défaut
 
-    def _resolve_margins(self, shape_element) -> Dict[str, Optional[float]]:
+    def _resolve_margins(self, shape_element) -> Margins:
         """Résout les marges du text frame."""
-        margins = {
-            'margin_left': None,
-            'margin_right': None,
-            'margin_top': None,
-            'margin_bottom': None
-        }
+        margins = Margins()
 
         if shape_element is None:
             return margins
 
         try:
             # Chercher d'abord directement dans la shape
-            if LXML_AVAILABLE:
-                body_pr = shape_element.xpath('.//a:bodyPr', namespaces=self.nsmap)
-            else:
-                body_pr = shape_element.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
+            body_pr = self._find_body_pr(shape_element)
 
             # Fonction pour extraire et convertir les marges depuis un élément bodyPr
             def extract_margins_from_bodypr(bp_elem):
@@ -915,7 +2147,7 @@ class StyleResolver:
 
                 # Si des marges ont été extraites directement, les utiliser
                 if extracted_margins:
-                    margins.update(extracted_margins)
+                    margins = margins._replace(**extracted_margins)
 
                 # Pour les marges non définies, utiliser la cascade d'héritage
                 placeholder_info = self._get_placeholder_info(shape_element)
@@ -923,7 +2155,7 @@ class StyleResolver:
                 placeholder_idx = placeholder_info.get("placeholder_idx")
 
                 # Combler les marges manquantes avec le layout/master/défaut
-                self._fill_missing_margins(margins, placeholder_idx, placeholder_type)
+                margins = self._fill_missing_margins(margins, placeholder_idx, placeholder_type)
 
             else:
                 # Si pas de bodyPr dans la shape, chercher dans le layout ou master
@@ -932,10 +2164,10 @@ class StyleResolver:
                 placeholder_idx = placeholder_info.get("placeholder_idx")
 
                 # Utiliser la cascade complète
-                self._fill_missing_margins(margins, placeholder_idx, placeholder_type)
+                margins = self._fill_missing_margins(margins, placeholder_idx, placeholder_type)
         except Exception as e:
             # En cas d'erreur, utiliser la méthode de fallback
-            self._fill_missing_margins(margins, None, None)
+            margins = self._fill_missing_margins(margins, None, None)
 
         return margins
 
@@ -946,10 +2178,7 @@ class StyleResolver:
             return 'square'  # Valeur par défaut OOXML
 
         try:
-            if LXML_AVAILABLE:
-                body_pr = shape_element.xpath('.//a:bodyPr', namespaces=self.nsmap)
-            else:
-                body_pr = shape_element.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
+            body_pr = self._find_body_pr(shape_element)
 
             if body_pr:
                 wrap_attr = body_pr[0].get('wrap')
@@ -975,73 +2204,31 @@ class StyleResolver:
         # Valeur par défaut OOXML
         return 'square'
 
-    def _resolve_autofit(self, shape_element, placeholder_idx: Optional[int] = None, placeholder_type: Optional[str] = None) -> Dict[str, Any]:
+    def _resolve_autofit(self, shape_element, placeholder_idx: Optional[int] = None, placeholder_type: Optional[str] = None) -> Autofit:
         """Résout les propriétés d'autofit du text frame."""
 
-        autofit_data = {
-            'type': 'none',  # none, normal, shape
-            'font_scale': None,
-            'line_spacing_reduction': None
-        }
+        autofit_data = NO_AUTOFIT
 
         if shape_element is None:
             return autofit_data
 
         try:
-            if LXML_AVAILABLE:
-                body_pr = shape_element.xpath('.//a:bodyPr', namespaces=self.nsmap)
-            else:
-                body_pr = shape_element.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
+            body_pr = self._find_body_pr(shape_element)
 
             if body_pr:
-                # Vérifier normAutofit
-                if LXML_AVAILABLE:
-                    norm_autofit = body_pr[0].xpath('.//a:normAutofit', namespaces=self.nsmap)
-                else:
-                    norm_autofit = body_pr[0].findall(f'.//{{{self.nsmap["a"]}}}normAutofit')
-
-                if norm_autofit:
-                    autofit_data['type'] = 'normal'
-
-                    # Extraire fontScale (en pourcentage, 100000 = 100%)
-                    font_scale = norm_autofit[0].get('fontScale')
-                    if font_scale:
-                        autofit_data['font_scale'] = int(font_scale) / 1000  # Convertir en pourcentage
-
-                    # Extraire lnSpcReduction (réduction de l'espacement des lignes)
-                    ln_spc_reduction = norm_autofit[0].get('lnSpcReduction')
-                    if ln_spc_reduction:
-                        autofit_data['line_spacing_reduction'] = int(ln_spc_reduction) / 1000  # Convertir en pourcentage
-
-                else:
-                    # Vérifier spAutofit
-                    if LXML_AVAILABLE:
-                        sp_autofit = body_pr[0].xpath('.//a:spAutofit', namespaces=self.nsmap)
-                    else:
-                        sp_autofit = body_pr[0].findall(f'.//{{{self.nsmap["a"]}}}spAutofit')
-
-                    if sp_autofit:
-                        autofit_data['type'] = 'shape'
-
-                    else:
-                        # Vérifier noAutofit (explicitement défini)
-                        if LXML_AVAILABLE:
-                            no_autofit = body_pr[0].xpath('.//a:noAutofit', namespaces=self.nsmap)
-                        else:
-                            no_autofit = body_pr[0].findall(f'.//{{{self.nsmap["a"]}}}noAutofit')
-
-                        if no_autofit:
-                            autofit_data['type'] = 'none'
+                # normAutofit (fontScale et lnSpcReduction en pourcentage) ou spAutofit ;
+                # noAutofit explicite équivaut à l'absence d'autofit
+                autofit_data = PlaceholderIndex._extract_autofit(body_pr[0])
 
             # Si pas de bodyPr dans la shape, chercher dans le layout ou master
-            if autofit_data['type'] == 'none':
+            if autofit_data.type == 'none':
                 layout_autofit = self._get_layout_autofit(placeholder_idx, placeholder_type)
-                if layout_autofit['type'] != 'none':
+                if layout_autofit.type != 'none':
                     autofit_data = layout_autofit
 
-            if autofit_data['type'] == 'none':
+            if autofit_data.type == 'none':
                 master_autofit = self._get_master_autofit(placeholder_idx, placeholder_type)
-                if master_autofit['type'] != 'none':
+                if master_autofit.type != 'none':
                     autofit_data = master_autofit
 
         except Exception as e:
@@ -1056,10 +2243,7 @@ class StyleResolver:
             return None
 
         try:
-            if LXML_AVAILABLE:
-                body_pr = shape_element.xpath('.//a:bodyPr', namespaces=self.nsmap)
-            else:
-                body_pr = shape_element.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
+            body_pr = self._find_body_pr(shape_element)
 
             if body_pr:
                 anchor = body_pr[0].get('anchor')
@@ -1077,10 +2261,7 @@ class StyleResolver:
             # Recherche couleur dans l'élément
 
             # sRGB Color
-            if LXML_AVAILABLE:
-                srgb = element.xpath('.//a:srgbClr', namespaces=self.nsmap)
-            else:
-                srgb = element.findall(f'.//{{{self.nsmap["a"]}}}srgbClr')
+            srgb = xpath_all(element, 'srgb_clr')
 
             if srgb:
                 val = srgb[0].get('val')
@@ -1088,10 +2269,7 @@ class StyleResolver:
                     return f"#{val.upper()}"
 
             # Scheme Color (référence au thème)
-            if LXML_AVAILABLE:
-                scheme = element.xpath('.//a:schemeClr', namespaces=self.nsmap)
-            else:
-                scheme = element.findall(f'.//{{{self.nsmap["a"]}}}schemeClr')
+            scheme = xpath_all(element, 'scheme_clr')
 
             if scheme:
                 val = scheme[0].get('val')
@@ -1101,10 +2279,7 @@ class StyleResolver:
                         return theme_color
 
             # Preset Color
-            if LXML_AVAILABLE:
-                preset = element.xpath('.//a:prstClr', namespaces=self.nsmap)
-            else:
-                preset = element.findall(f'.//{{{self.nsmap["a"]}}}prstClr')
+            preset = xpath_all(element, 'prst_clr')
 
             if preset:
                 val = preset[0].get('val')
@@ -1139,139 +2314,60 @@ class StyleResolver:
         Returns:
             Valeur de la propriété ou None
         """
-        if self.master_tree is None:
+        if self.master_index is None:
             return None
 
-        try:
-            # Déterminer le type de style basé sur le placeholder_type et idx
-            # Dans le template Premier Tech slide 11:
-            # - placeholder_type "title": titre principal (titleStyle level 1)
-            # - placeholder_idx 11: metadata/date (bodyStyle level 1)
-            # - placeholder_idx 14: sous-titre (titleStyle level différent ou styles spéciaux)
-
-            if placeholder_type == "title":
-                # Les éléments de type "title" utilisent titleStyle
-                style_section = 'titleStyle'
-                level = 1
-            elif placeholder_idx == 11:
-                # Metadata/date - utiliser bodyStyle
-                style_section = 'bodyStyle'
-                level = 1
-            elif placeholder_idx == 14:
-                # Sous-titre - essayer titleStyle level 2 ou body level différent
-                style_section = 'titleStyle'
-                level = 2
-            else:
-                # Par défaut bodyStyle
-                style_section = 'bodyStyle'
-                level = 1
-
-            # Debug info pour le style resolver (peut être activé si nécessaire)
-            # print(f"[DEBUG] placeholder_idx={placeholder_idx}, placeholder_type={placeholder_type}, property={property_name}, style_section={style_section}, level={level}")
-
-            # Construire le XPath pour trouver le style approprié
-            if LXML_AVAILABLE:
-                if level == 1:
-                    xpath = f'.//p:txStyles/p:{style_section}/a:lvl1pPr/a:defRPr'
-                elif level == 2:
-                    xpath = f'.//p:txStyles/p:{style_section}/a:lvl2pPr/a:defRPr'
-                else:
-                    xpath = f'.//p:txStyles/p:{style_section}/a:lvl3pPr/a:defRPr'
-
-                def_rpr_elements = self.master_tree.xpath(xpath, namespaces=self.nsmap)
-            else:
-                # ElementTree fallback
-                if level == 1:
-                    path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl1pPr/{{{self.nsmap["a"]}}}defRPr'
-                elif level == 2:
-                    path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl2pPr/{{{self.nsmap["a"]}}}defRPr'
-                else:
-                    path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl3pPr/{{{self.nsmap["a"]}}}defRPr'
-
-                def_rpr_elements = self.master_tree.findall(path)
-
-            if not def_rpr_elements:
-                return None
-
-            def_rpr = def_rpr_elements[0]
-
-            # Extraire la propriété demandée
-            if property_name == 'font_size':
-                sz = def_rpr.get('sz')
-                if sz:
-                    try:
-                        return int(sz) / CENTIPOINTS_PER_POINT
-                    except:
-                        pass
+        # Déterminer le type de style basé sur le placeholder_type et idx
+        # Dans le template Premier Tech slide 11:
+        # - placeholder_type "title": titre principal (titleStyle level 1)
+        # - placeholder_idx 11: metadata/date (bodyStyle level 1)
+        # - placeholder_idx 14: sous-titre (titleStyle level différent ou styles spéciaux)
+
+        if placeholder_type == "title":
+            # Les éléments de type "title" utilisent titleStyle
+            style_section = 'titleStyle'
+            level = 1
+        elif placeholder_idx == 11:
+            # Metadata/date - utiliser bodyStyle
+            style_section = 'bodyStyle'
+            level = 1
+        elif placeholder_idx == 14:
+            # Sous-titre - essayer titleStyle level 2 ou body level différent
+            style_section = 'titleStyle'
+            level = 2
+        else:
+            # Par défaut bodyStyle
+            style_section = 'bodyStyle'
+            level = 1
 
-            elif property_name == 'font_name':
-                # Chercher la police latin
-                if LXML_AVAILABLE:
-                    latin_elements = def_rpr.xpath('.//a:latin', namespaces=self.nsmap)
-                else:
-                    latin_elements = def_rpr.findall(f'.//{{{self.nsmap["a"]}}}latin')
+        text_style = self.master_index.get_text_style(style_section, TEXT_STYLE_LEVELS[level - 1])
+        if text_style is None:
+            return None
 
-                if latin_elements:
-                    typeface = latin_elements[0].get('typeface')
-                    if typeface:
-                        return self._resolve_font_reference(typeface)
+        def_rpr = text_style['def_rpr']
 
-            elif property_name == 'bold':
-                bold_val = def_rpr.get('b')
-                # print(f"[DEBUG] Bold found in master: b='{bold_val}' for {style_section} level {level}")
-                return bold_val == '1'
+        # Extraire la propriété demandée
+        if property_name == 'font_size':
+            return def_rpr['font_size']
 
-            elif property_name == 'italic':
-                return def_rpr.get('i') == '1'
+        elif property_name == 'font_name':
+            if def_rpr['typeface']:
+                return self._resolve_font_reference(def_rpr['typeface'])
 
-            elif property_name == 'color':
-                # Analyser solidFill/schemeClr pour la couleur
-                if LXML_AVAILABLE:
-                    scheme_clr = def_rpr.xpath('.//a:solidFill/a:schemeClr', namespaces=self.nsmap)
-                else:
-                    scheme_clr = def_rpr.findall(f'.//{{{self.nsmap["a"]}}}solidFill/{{{self.nsmap["a"]}}}schemeClr')
+        elif property_name == 'bold':
+            return def_rpr['bold']
 
-                if scheme_clr:
-                    scheme_val = scheme_clr[0].get('val')
-                    if scheme_val and self.theme:
-                        return self.theme.get_color(scheme_val)
+        elif property_name == 'italic':
+            return def_rpr['italic']
 
-        except Exception as e:
-            # print(f"[DEBUG] Erreur dans _get_master_text_style_property: {e}")
-            pass
+        elif property_name == 'color':
+            if def_rpr['scheme_color'] and self.theme:
+                return self.theme.get_color(def_rpr['scheme_color'])
 
         # Gestion spéciale pour l'alignement (propriété de paragraphe, pas de run)
-        if property_name == 'alignment':
-            try:
-                # Chercher dans les propriétés de paragraphe du niveau approprié
-                if LXML_AVAILABLE:
-                    if level == 1:
-                        xpath = f'.//p:txStyles/p:{style_section}/a:lvl1pPr'
-                    elif level == 2:
-                        xpath = f'.//p:txStyles/p:{style_section}/a:lvl2pPr'
-                    else:
-                        xpath = f'.//p:txStyles/p:{style_section}/a:lvl3pPr'
-
-                    ppr_elements = self.master_tree.xpath(xpath, namespaces=self.nsmap)
-                else:
-                    # ElementTree fallback
-                    if level == 1:
-                        path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl1pPr'
-                    elif level == 2:
-                        path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl2pPr'
-                    else:
-                        path = f'.//{{{self.nsmap["p"]}}}txStyles/{{{self.nsmap["p"]}}}{style_section}/{{{self.nsmap["a"]}}}lvl3pPr'
-
-                    ppr_elements = self.master_tree.findall(path)
-
-                if ppr_elements:
-                    algn = ppr_elements[0].get('algn')
-                    if algn:
-                        return self._map_alignment(algn)
-
-            except Exception as e:
-                # print(f"[DEBUG] Erreur alignment master: {e}")
-                pass
+        elif property_name == 'alignment':
+            if text_style['algn']:
+                return self._map_alignment(text_style['algn'])
 
         return None
 
@@ -1287,157 +2383,42 @@ class StyleResolver:
         Returns:
             Valeur de la propriété ou None
         """
-        if self.layout_tree is None:
+        if self.layout_index is None:
             return None
 
-        try:
-            # Chercher le placeholder correspondant dans le layout
-            if LXML_AVAILABLE:
-                # Chercher toutes les shapes avec placeholder
-                ph_shapes = self.layout_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                # ElementTree fallback
-                root = self.layout_tree.getroot()
-                ph_shapes = []
-                for sp in root.findall(f'.//{{{self.nsmap["p"]}}}sp'):
-                    ph_check = sp.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                    if ph_check:
-                        ph_shapes.append(sp)
-
-            for ph_shape in ph_shapes:
-                # Vérifier si c'est le bon placeholder
-                if LXML_AVAILABLE:
-                    ph_elem = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_elem = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_elem.get('type')
-                ph_idx_str = ph_elem.get('idx')
-
-                # Convertir l'index
-                ph_idx = None
-                if ph_idx_str and ph_idx_str != "None":
-                    try:
-                        ph_idx = int(ph_idx_str)
-                    except:
-                        pass
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and
-                    (placeholder_idx == ph_idx)):
-
-                    # Chercher les styles dans ce placeholder
-                    if LXML_AVAILABLE:
-                        def_rpr_elements = ph_shape.xpath('.//a:defRPr', namespaces=self.nsmap)
-                    else:
-                        def_rpr_elements = ph_shape.findall(f'.//{{{self.nsmap["a"]}}}defRPr')
-
-                    if def_rpr_elements:
-                        def_rpr = def_rpr_elements[0]
-
-                        if property_name == 'font_size':
-                            sz = def_rpr.get('sz')
-                            if sz:
-                                try:
-                                    return int(sz) / CENTIPOINTS_PER_POINT
-                                except:
-                                    pass
-
-                        elif property_name == 'font_name':
-                            # Chercher la police latin
-                            if LXML_AVAILABLE:
-                                latin_elements = def_rpr.xpath('.//a:latin', namespaces=self.nsmap)
-                            else:
-                                latin_elements = def_rpr.findall(f'.//{{{self.nsmap["a"]}}}latin')
-
-                            if latin_elements:
-                                typeface = latin_elements[0].get('typeface')
-                                if typeface:
-                                    return self._resolve_font_reference(typeface)
-
-                        elif property_name == 'bold':
-                            bold_val = def_rpr.get('b')
-                            return bold_val == '1'
-
-                        elif property_name == 'italic':
-                            return def_rpr.get('i') == '1'
-
-                        elif property_name == 'color':
-                            # Analyser solidFill/schemeClr pour la couleur
-                            if LXML_AVAILABLE:
-                                scheme_clr = def_rpr.xpath('.//a:solidFill/a:schemeClr', namespaces=self.nsmap)
-                            else:
-                                scheme_clr = def_rpr.findall(f'.//{{{self.nsmap["a"]}}}solidFill/{{{self.nsmap["a"]}}}schemeClr')
-
-                            if scheme_clr:
-                                scheme_val = scheme_clr[0].get('val')
-                                if scheme_val and self.theme:
-                                    layout_color = self.theme.get_color(scheme_val)
-                                    if layout_color:
-                                        return layout_color
-
-        except Exception as e:
-            # print(f"[DEBUG] Erreur dans _get_layout_text_style_property: {e}")
-            pass
+        entries = self.layout_index.get_entries(placeholder_type, placeholder_idx)
 
         # Gestion spéciale pour l'alignement (propriété de paragraphe, pas de run)
         if property_name == 'alignment':
-            try:
-                # Chercher le placeholder correspondant dans le layout
-                if LXML_AVAILABLE:
-                    ph_shapes = self.layout_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-                else:
-                    root = self.layout_tree.getroot()
-                    ph_shapes = []
-                    for sp in root.findall(f'.//{{{self.nsmap["p"]}}}sp'):
-                        ph_check = sp.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                        if ph_check:
-                            ph_shapes.append(sp)
-
-                for ph_shape in ph_shapes:
-                    if LXML_AVAILABLE:
-                        ph_elem = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                    else:
-                        ph_elem = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                    ph_type = ph_elem.get('type')
-                    ph_idx_str = ph_elem.get('idx')
-                    ph_idx = None
-                    if ph_idx_str and ph_idx_str != "None":
-                        try:
-                            ph_idx = int(ph_idx_str)
-                        except:
-                            pass
-
-                    # Si c'est notre placeholder cible
-                    if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                        # Chercher dans les propriétés de paragraphe - plusieurs niveaux possibles
-                        if LXML_AVAILABLE:
-                            # Chercher dans tous les niveaux de paragraphe possible
-                            ppr_paths = ['.//a:pPr', './/a:lvl1pPr', './/a:lvl2pPr', './/a:lvl3pPr']
-                            for ppr_path in ppr_paths:
-                                ppr_elements = ph_shape.xpath(ppr_path, namespaces=self.nsmap)
-                                if ppr_elements:
-                                    algn = ppr_elements[0].get('algn')
-                                    if algn:
-                                        return self._map_alignment(algn)
-                        else:
-                            # ElementTree fallback
-                            ppr_paths = [
-                                f'.//{{{self.nsmap["a"]}}}pPr',
-                                f'.//{{{self.nsmap["a"]}}}lvl1pPr',
-                                f'.//{{{self.nsmap["a"]}}}lvl2pPr',
-                                f'.//{{{self.nsmap["a"]}}}lvl3pPr'
-                            ]
-                            for ppr_path in ppr_paths:
-                                ppr_elements = ph_shape.findall(ppr_path)
-                                if ppr_elements:
-                                    algn = ppr_elements[0].get('algn')
-                                    if algn:
-                                        return self._map_alignment(algn)
-
-            except Exception as e:
-                pass
+            for entry in entries:
+                if entry['algn']:
+                    return self._map_alignment(entry['algn'])
+            return None
+
+        for entry in entries:
+            def_rpr = entry['def_rpr']
+            if def_rpr is None:
+                continue
+
+            if property_name == 'font_size':
+                if def_rpr['font_size'] is not None:
+                    return def_rpr['font_size']
+
+            elif property_name == 'font_name':
+                if def_rpr['typeface']:
+                    return self._resolve_font_reference(def_rpr['typeface'])
+
+            elif property_name == 'bold':
+                return def_rpr['bold']
+
+            elif property_name == 'italic':
+                return def_rpr['italic']
+
+            elif property_name == 'color':
+                if def_rpr['scheme_color'] and self.theme:
+                    layout_color = self.theme.get_color(def_rpr['scheme_color'])
+                    if layout_color:
+                        return layout_color
 
         return None
 
@@ -1471,125 +2452,52 @@ class StyleResolver:
         Returns:
             Dict avec les marges ou None si non trouvé
         """
-        if self.layout_tree is None:
+        if self.layout_index is None:
             return None
 
-        try:
-            # Chercher le placeholder correspondant dans le layout
-            if LXML_AVAILABLE:
-                ph_shapes = self.layout_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.layout_tree.getroot()
-                ph_shapes = []
-                for sp in root.findall(f'.//{{{self.nsmap["p"]}}}sp'):
-                    ph_check = sp.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                    if ph_check:
-                        ph_shapes.append(sp)
-
-            for ph_shape in ph_shapes:
-                # Vérifier si c'est le bon placeholder
-                if LXML_AVAILABLE:
-                    ph_elem = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_elem = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_elem.get('type')
-                ph_idx_str = ph_elem.get('idx')
-
-                # Convertir l'index
-                ph_idx = None
-                if ph_idx_str and ph_idx_str != "None":
-                    try:
-                        ph_idx = int(ph_idx_str)
-                    except:
-                        pass
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    # Chercher bodyPr dans ce placeholder du layout
-                    if LXML_AVAILABLE:
-                        body_pr = ph_shape.xpath('.//a:bodyPr', namespaces=self.nsmap)
-                    else:
-                        body_pr = ph_shape.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
-
-                    if body_pr:
-                        bp = body_pr[0]
-                        margins = {}
-
-                        # Extraire les marges avec valeurs par défaut
-                        lins = bp.get('lIns')
-                        if lins is not None:
-                            try:
-                                margins['margin_left'] = round(int(lins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                margins['margin_left'] = round(91440 / EMU_PER_POINT, 2)
-                        else:
-                            margins['margin_left'] = round(91440 / EMU_PER_POINT, 2)
-
-                        rins = bp.get('rIns')
-                        if rins is not None:
-                            try:
-                                margins['margin_right'] = round(int(rins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                margins['margin_right'] = round(91440 / EMU_PER_POINT, 2)
-                        else:
-                            margins['margin_right'] = round(91440 / EMU_PER_POINT, 2)
-
-                        tins = bp.get('tIns')
-                        if tins is not None:
-                            try:
-                                margins['margin_top'] = round(int(tins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                margins['margin_top'] = round(45720 / EMU_PER_POINT, 2)
-                        else:
-                            margins['margin_top'] = round(45720 / EMU_PER_POINT, 2)
-
-                        bins = bp.get('bIns')
-                        if bins is not None:
-                            try:
-                                margins['margin_bottom'] = round(int(bins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                margins['margin_bottom'] = round(45720 / EMU_PER_POINT, 2)
-                        else:
-                            margins['margin_bottom'] = round(45720 / EMU_PER_POINT, 2)
-
-                        return margins
+        # Valeurs par défaut OOXML (91440 EMU gauche/droite, 45720 EMU haut/bas)
+        default_insets = {
+            'margin_left': round(91440 / EMU_PER_POINT, 2),
+            'margin_right': round(91440 / EMU_PER_POINT, 2),
+            'margin_top': round(45720 / EMU_PER_POINT, 2),
+            'margin_bottom': round(45720 / EMU_PER_POINT, 2)
+        }
 
-        except Exception as e:
-            pass
+        for entry in self.layout_index.get_entries(placeholder_type, placeholder_idx):
+            if entry['has_body_pr']:
+                return {
+                    key: value if value is not None else default_insets[key]
+                    for key, value in entry['insets']._asdict().items()
+                }
 
         return None
 
-    def _fill_missing_margins(self, margins: Dict[str, Optional[float]], placeholder_idx: Optional[int], placeholder_type: Optional[str]):
+    def _fill_missing_margins(self, margins: Margins, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Margins:
         """
         Remplit les marges manquantes en utilisant la cascade d'héritage complète.
 
         Args:
-            margins: Dict des marges (modifié en place)
+            margins: Marges déjà résolues
             placeholder_idx: Index du placeholder
             placeholder_type: Type du placeholder
+
+        Returns:
+            Marges complétées
         """
         # 1. Essayer de récupérer depuis le layout
         if self.layout_tree is not None:
             layout_margins = self._get_layout_margins(placeholder_idx, placeholder_type)
             if layout_margins:
-                for key, value in layout_margins.items():
-                    if margins.get(key) is None:
-                        margins[key] = value
+                margins = margins.fill_missing(layout_margins)
 
         # 2. Essayer de récupérer depuis le master
         if self.master_tree is not None:
             master_margins = self._get_master_margins(placeholder_idx, placeholder_type)
             if master_margins:
-                for key, value in master_margins.items():
-                    if margins.get(key) is None:
-                        margins[key] = value
+                margins = margins.fill_missing(master_margins)
 
         # 3. Utiliser des valeurs par défaut intelligentes basées sur le type de placeholder
-        default_margins = self._get_smart_default_margins(placeholder_type)
-        for key, value in default_margins.items():
-            if margins.get(key) is None:
-                margins[key] = value
+        return margins.fill_missing(self._get_smart_default_margins(placeholder_type))
 
     def _get_master_margins(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Optional[Dict[str, float]]:
         """
@@ -1602,319 +2510,62 @@ class StyleResolver:
         Returns:
             Dict avec les marges ou None si non trouvé
         """
-        if self.master_tree is None:
+        if self.master_index is None:
             return None
 
-        try:
-            # Chercher le placeholder correspondant dans le master
-            if LXML_AVAILABLE:
-                ph_shapes = self.master_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.master_tree.getroot()
-                ph_shapes = []
-                for sp in root.findall(f'.//{{{self.nsmap["p"]}}}sp'):
-                    ph_check = sp.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                    if ph_check:
-                        ph_shapes.append(sp)
-
-            for ph_shape in ph_shapes:
-                # Vérifier si c'est le bon placeholder
-                if LXML_AVAILABLE:
-                    ph_elem = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_elem = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_elem.get('type')
-                ph_idx_str = ph_elem.get('idx')
-
-                # Convertir l'index
-                ph_idx = None
-                if ph_idx_str and ph_idx_str != "None":
-                    try:
-                        ph_idx = int(ph_idx_str)
-                    except:
-                        pass
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    # Chercher bodyPr dans ce placeholder du master
-                    if LXML_AVAILABLE:
-                        body_pr = ph_shape.xpath('.//a:bodyPr', namespaces=self.nsmap)
-                    else:
-                        body_pr = ph_shape.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
-
-                    if body_pr:
-                        bp = body_pr[0]
-                        margins = {}
-
-                        # Extraire les marges du master
-                        lins = bp.get('lIns')
-                        if lins is not None:
-                            try:
-                                margins['margin_left'] = round(int(lins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                pass
-
-                        rins = bp.get('rIns')
-                        if rins is not None:
-                            try:
-                                margins['margin_right'] = round(int(rins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                pass
-
-                        tins = bp.get('tIns')
-                        if tins is not None:
-                            try:
-                                margins['margin_top'] = round(int(tins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                pass
-
-                        bins = bp.get('bIns')
-                        if bins is not None:
-                            try:
-                                margins['margin_bottom'] = round(int(bins) / EMU_PER_POINT, 2)
-                            except (ValueError, TypeError):
-                                pass
-
-                        if margins:  # Retourner seulement si des marges ont été trouvées
-                            return margins
+        for entry in self.master_index.get_entries(placeholder_type, placeholder_idx):
+            if not entry['has_body_pr']:
+                continue
 
-        except Exception as e:
-            pass
+            margins = {key: value for key, value in entry['insets']._asdict().items() if value is not None}
+            if margins:  # Retourner seulement si des marges ont été trouvées
+                return margins
 
         return None
 
     def _get_layout_text_wrapping(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Optional[str]:
         """Récupère le text wrapping depuis le layout pour un placeholder donné."""
 
-        if self.layout_tree is None:
+        if self.layout_index is None:
             return None
 
-        try:
-            # Chercher le placeholder correspondant dans le layout
-            if LXML_AVAILABLE:
-                ph_shapes = self.layout_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.layout_tree.getroot()
-                ph_shapes = []
-                for el in root.iter():
-                    if el.tag.endswith('}sp'):
-                        ph_elements = el.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                        if ph_elements:
-                            ph_shapes.append(el)
-
-            for ph_shape in ph_shapes:
-                if LXML_AVAILABLE:
-                    ph_element = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_element = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_element.get('type')
-                ph_idx = ph_element.get('idx')
-                ph_idx = int(ph_idx) if ph_idx else None
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    # Chercher bodyPr dans ce placeholder du layout
-                    if LXML_AVAILABLE:
-                        body_pr = ph_shape.xpath('.//a:bodyPr', namespaces=self.nsmap)
-                    else:
-                        body_pr = ph_shape.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
-
-                    if body_pr:
-                        wrap_attr = body_pr[0].get('wrap')
-                        if wrap_attr is not None:
-                            return wrap_attr
-
-        except Exception as e:
-            pass
+        for entry in self.layout_index.get_entries(placeholder_type, placeholder_idx):
+            if entry['wrap'] is not None:
+                return entry['wrap']
 
         return None
 
     def _get_master_text_wrapping(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Optional[str]:
         """Récupère le text wrapping depuis le master pour un placeholder donné."""
 
-        if self.master_tree is None:
+        if self.master_index is None:
             return None
 
-        try:
-            # Chercher le placeholder correspondant dans le master
-            if LXML_AVAILABLE:
-                ph_shapes = self.master_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.master_tree.getroot()
-                ph_shapes = []
-                for el in root.iter():
-                    if el.tag.endswith('}sp'):
-                        ph_elements = el.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                        if ph_elements:
-                            ph_shapes.append(el)
-
-            for ph_shape in ph_shapes:
-                if LXML_AVAILABLE:
-                    ph_element = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_element = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_element.get('type')
-                ph_idx = ph_element.get('idx')
-                ph_idx = int(ph_idx) if ph_idx else None
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    # Chercher bodyPr dans ce placeholder du master
-                    if LXML_AVAILABLE:
-                        body_pr = ph_shape.xpath('.//a:bodyPr', namespaces=self.nsmap)
-                    else:
-                        body_pr = ph_shape.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
-
-                    if body_pr:
-                        wrap_attr = body_pr[0].get('wrap')
-                        if wrap_attr is not None:
-                            return wrap_attr
-
-        except Exception as e:
-            pass
+        for entry in self.master_index.get_entries(placeholder_type, placeholder_idx):
+            if entry['wrap'] is not None:
+                return entry['wrap']
 
         return None
 
-    def _get_layout_autofit(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Dict[str, Any]:
+    def _get_layout_autofit(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Autofit:
         """Récupère l'autofit depuis le layout pour un placeholder donné."""
 
-        autofit_data = {
-            'type': 'none',
-            'font_scale': None,
-            'line_spacing_reduction': None
-        }
-
-        if self.layout_tree is None:
-            return autofit_data
-
-        try:
-            # Chercher le placeholder correspondant dans le layout
-            if LXML_AVAILABLE:
-                ph_shapes = self.layout_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.layout_tree.getroot()
-                ph_shapes = []
-                for el in root.iter():
-                    if el.tag.endswith('}sp'):
-                        ph_elements = el.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                        if ph_elements:
-                            ph_shapes.append(el)
-
-            for ph_shape in ph_shapes:
-                if LXML_AVAILABLE:
-                    ph_element = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_element = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_element.get('type')
-                ph_idx = ph_element.get('idx')
-                ph_idx = int(ph_idx) if ph_idx else None
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    return self._extract_autofit_from_shape(ph_shape)
-
-        except Exception as e:
-            pass
+        if self.layout_index is not None:
+            entries = self.layout_index.get_entries(placeholder_type, placeholder_idx)
+            if entries:
+                return entries[0]['autofit']
 
-        return autofit_data
+        return NO_AUTOFIT
 
-    def _get_master_autofit(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Dict[str, Any]:
+    def _get_master_autofit(self, placeholder_idx: Optional[int], placeholder_type: Optional[str]) -> Autofit:
         """Récupère l'autofit depuis le master pour un placeholder donné."""
 
-        autofit_data = {
-            'type': 'none',
-            'font_scale': None,
-            'line_spacing_reduction': None
-        }
-
-        if self.master_tree is None:
-            return autofit_data
-
-        try:
-            # Chercher le placeholder correspondant dans le master
-            if LXML_AVAILABLE:
-                ph_shapes = self.master_tree.xpath('//p:sp[.//p:nvSpPr/p:nvPr/p:ph]', namespaces=self.nsmap)
-            else:
-                root = self.master_tree.getroot()
-                ph_shapes = []
-                for el in root.iter():
-                    if el.tag.endswith('}sp'):
-                        ph_elements = el.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')
-                        if ph_elements:
-                            ph_shapes.append(el)
-
-            for ph_shape in ph_shapes:
-                if LXML_AVAILABLE:
-                    ph_element = ph_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=self.nsmap)[0]
-                else:
-                    ph_element = ph_shape.findall(f'.//{{{self.nsmap["p"]}}}nvSpPr/{{{self.nsmap["p"]}}}nvPr/{{{self.nsmap["p"]}}}ph')[0]
-
-                ph_type = ph_element.get('type')
-                ph_idx = ph_element.get('idx')
-                ph_idx = int(ph_idx) if ph_idx else None
-
-                # Vérifier si c'est le bon placeholder
-                if ((placeholder_type == ph_type) and (placeholder_idx == ph_idx)):
-                    return self._extract_autofit_from_shape(ph_shape)
-
-        except Exception as e:
-            pass
-
-        return autofit_data
-
-    def _extract_autofit_from_shape(self, shape_element) -> Dict[str, Any]:
-        """Extrait l'autofit d'un élément shape."""
-
-        autofit_data = {
-            'type': 'none',
-            'font_scale': None,
-            'line_spacing_reduction': None
-        }
-
-        try:
-            if LXML_AVAILABLE:
-                body_pr = shape_element.xpath('.//a:bodyPr', namespaces=self.nsmap)
-            else:
-                body_pr = shape_element.findall(f'.//{{{self.nsmap["a"]}}}bodyPr')
-
-            if body_pr:
-                # Vérifier normAutofit
-                if LXML_AVAILABLE:
-                    norm_autofit = body_pr[0].xpath('.//a:normAutofit', namespaces=self.nsmap)
-                else:
-                    norm_autofit = body_pr[0].findall(f'.//{{{self.nsmap["a"]}}}normAutofit')
-
-                if norm_autofit:
-                    autofit_data['type'] = 'normal'
-
-                    # Extraire fontScale
-                    font_scale = norm_autofit[0].get('fontScale')
-                    if font_scale:
-                        autofit_data['font_scale'] = int(font_scale) / 1000
-
-                    # Extraire lnSpcReduction
-                    ln_spc_reduction = norm_autofit[0].get('lnSpcReduction')
-                    if ln_spc_reduction:
-                        autofit_data['line_spacing_reduction'] = int(ln_spc_reduction) / 1000
-
-                else:
-                    # Vérifier spAutofit
-                    if LXML_AVAILABLE:
-                        sp_autofit = body_pr[0].xpath('.//a:spAutofit', namespaces=self.nsmap)
-                    else:
-                        sp_autofit = body_pr[0].findall(f'.//{{{self.nsmap["a"]}}}spAutofit')
-
-                    if sp_autofit:
-                        autofit_data['type'] = 'shape'
-
-        except Exception as e:
-            pass
+        if self.master_index is not None:
+            entries = self.master_index.get_entries(placeholder_type, placeholder_idx)
+            if entries:
+                return entries[0]['autofit']
 
-        return autofit_data
+        return NO_AUTOFIT
 
     def _get_smart_default_margins(self, placeholder_type: Optional[str]) -> Dict[str, float]:
         """
@@ -1940,6 +2591,157 @@ class StyleResolver:
         }
 
 
+# =============================================================================
+# CLASSE ShapeNode - Parcours Unique de l'Arbre des Formes
+# =============================================================================
+
+_P = f'{{{NAMESPACES["p"]}}}'
+_A = f'{{{NAMESPACES["a"]}}}'
+_R = f'{{{NAMESPACES["r"]}}}'
+
+# Enfants de p:spTree / p:grpSp considérés comme des formes : même ensemble et
+# même ordre que slide.shapes dans python-pptx (les shape_id du builder)
+SHAPE_KINDS = {
+    _P + 'sp': 'shape',
+    _P + 'grpSp': 'group',
+    _P + 'graphicFrame': 'graphic_frame',
+    _P + 'cxnSp': 'connector',
+    _P + 'pic': 'picture',
+    _P + 'contentPart': 'content_part',
+}
+
+# Propriétés non visuelles (cNvPr, nvPr/ph) selon le type de forme
+NON_VISUAL_TAGS = frozenset({_P + 'nvSpPr', _P + 'nvGrpSpPr', _P + 'nvGraphicFramePr',
+                             _P + 'nvCxnSpPr', _P + 'nvPicPr'})
+
+# Propriétés de forme portant l'a:xfrm
+SHAPE_PROPERTY_TAGS = frozenset({_P + 'spPr', _P + 'grpSpPr'})
+
+
+class ShapeNode:
+    """
+    Nœuds utiles d'une forme, collectés en un seul parcours de son sous-arbre.
+
+    Remplace les requêtes descendantes répétées (.//) par forme : nom,
+    placeholder, xfrm, bodyPr, paragraphes et runs du premier paragraphe sont
+    relevés en descendant une seule fois dans les branches concernées.
+    """
+
+    __slots__ = ('element', 'kind', 'name', 'placeholder', 'xfrm', 'tx_body', 'body_pr',
+                 'paragraphs', 'runs', 'run_texts', 'image_rel_id', 'graphic_uri', 'children')
+
+    def __init__(self, element, kind: str):
+        """
+        Initialise un nœud vide pour un élément forme.
+
+        Args:
+            element: Élément forme (p:sp, p:grpSp, p:pic, ...)
+            kind: Type de forme (valeur de SHAPE_KINDS)
+        """
+        self.element = element
+        self.kind = kind
+        self.name = None
+        self.placeholder = None
+        self.xfrm = None
+        self.tx_body = None
+        self.body_pr = None
+        self.paragraphs = []
+        self.runs = []          # Runs du premier paragraphe
+        self.run_texts = []     # Texte concaténé de chaque run
+        self.image_rel_id = None
+        self.graphic_uri = None
+        self.children = []      # Formes enfants d'un groupe
+
+    @classmethod
+    def collect(cls, element, kind: str) -> 'ShapeNode':
+        """
+        Parcourt une forme une seule fois en aiguillant sur le tag des enfants.
+
+        Args:
+            element: Élément forme
+            kind: Type de forme
+
+        Returns:
+            ShapeNode renseigné (récursif pour les groupes)
+        """
+        node = cls(element, kind)
+
+        for child in element:
+            tag = child.tag
+
+            if tag in NON_VISUAL_TAGS:
+                for nv_child in child:
+                    if nv_child.tag == _P + 'cNvPr' and node.name is None:
+                        node.name = nv_child.get('name', 'Unknown Shape')
+                    elif nv_child.tag == _P + 'nvPr' and node.placeholder is None:
+                        for prop in nv_child:
+                            if prop.tag == _P + 'ph':
+                                node.placeholder = prop
+                                break
+
+            elif tag in SHAPE_PROPERTY_TAGS:
+                if node.xfrm is None:
+                    for prop in child:
+                        if prop.tag == _A + 'xfrm':
+                            node.xfrm = prop
+                            break
+
+            elif tag == _P + 'xfrm':
+                # p:graphicFrame porte son xfrm directement
+                node.xfrm = child
+
+            elif tag == _P + 'txBody':
+                if node.tx_body is None:
+                    node.tx_body = child
+                    for text_child in child:
+                        if text_child.tag == _A + 'p':
+                            node.paragraphs.append(text_child)
+                        elif text_child.tag == _A + 'bodyPr' and node.body_pr is None:
+                            node.body_pr = text_child
+
+            elif tag == _P + 'blipFill':
+                for blip in child:
+                    if blip.tag == _A + 'blip':
+                        node.image_rel_id = blip.get(_R + 'embed')
+                        break
+
+            elif tag == _A + 'graphic':
+                for graphic_data in child:
+                    if graphic_data.tag == _A + 'graphicData':
+                        node.graphic_uri = graphic_data.get('uri')
+                        break
+
+            elif kind == 'group' and tag in SHAPE_KINDS:
+                node.children.append(cls.collect(child, SHAPE_KINDS[tag]))
+
+        # Runs et texte du premier paragraphe (référence du formatage)
+        if node.paragraphs:
+            for run in node.paragraphs[0]:
+                if run.tag == _A + 'r':
+                    node.runs.append(run)
+                    node.run_texts.append(''.join(t.text for t in run if t.tag == _A + 't' and t.text))
+
+        return node
+
+
+def walk_shape_tree(slide_root) -> List[ShapeNode]:
+    """
+    Parcourt p:spTree une seule fois et collecte les formes de premier niveau.
+
+    Args:
+        slide_root: Racine XML de la slide
+
+    Returns:
+        Liste des ShapeNode dans l'ordre du document
+    """
+    sp_tree = xpath_first(slide_root, 'sp_tree')
+    if sp_tree is None:
+        return []
+
+    return [ShapeNode.collect(child, SHAPE_KINDS[child.tag])
+            for child in sp_tree if child.tag in SHAPE_KINDS]
+
+
 # =============================================================================
 # CLASSE SlideExtractor - Orchestrateur Principal
 # =============================================================================
@@ -1972,15 +2774,20 @@ class SlideExtractor:
         master_part = package.get_slide_master_part(layout_part) if layout_part else None
         self.master_tree = package.get_xml_tree(master_part) if master_part else None
 
-        theme_part = package.get_theme_part(master_part) if master_part else None
-        theme_tree = package.get_xml_tree(theme_part) if theme_part else None
-        self.theme = Theme(theme_tree) if theme_tree else None
+        # Thème partagé par toutes les slides du même master
+        self.theme = package.theme_for(master_part)
+
+        # Index d'héritage partagés par toutes les slides du même layout/master
+        self.layout_index = package.get_placeholder_index(layout_part) if self.layout_tree is not None else None
+        self.master_index = package.get_placeholder_index(master_part) if self.master_tree is not None else None
 
         # Initialiser le résolveur de styles
         self.style_resolver = StyleResolver(
-            self.slide_tree, self.layout_tree, self.master_tree, self.theme
+            self.slide_tree, self.layout_tree, self.master_tree, self.theme,
+            self.layout_index, self.master_index
         )
 
+    @profiled('extract_metadata')
     def extract_metadata(self) -> Dict[str, Any]:
         """
         Extrait toutes les métadonnées de la slide avec formatage complet.
@@ -1991,27 +2798,26 @@ class SlideExtractor:
         if self.slide_tree is None:
             return {"error": "Impossible de charger la slide"}
 
+        return self.extract().to_dict()
+
+    def extract(self) -> ExtractedSlide:
+        """
+        Extrait la slide sous forme d'enregistrements compacts (sans conversion JSON).
+
+        Returns:
+            ExtractedSlide avec les formes peuplées de la slide
+        """
         # Métadonnées de base
         slide_number = self._extract_slide_number()
         layout_name = self._extract_layout_name()
 
-        result = {
-            "slide_number": slide_number,
-            "layout_name": layout_name,
-            "extraction_method": "xml_direct_analysis_with_inheritance",
-            "shapes": []
-        }
-
         # Extraire toutes les formes avec formatage complet
         shapes = self._extract_all_shapes()
 
         # Appliquer la logique de classification (éviter données parasites)
         filtered_shapes = self._filter_populated_content(shapes)
 
-        result["shapes"] = filtered_shapes
-        result["total_shapes"] = len(filtered_shapes)
-
-        return result
+        return ExtractedSlide(slide_number, layout_name, filtered_shapes)
 
     def _extract_slide_number(self) -> int:
         """Extrait le numéro de la slide depuis le nom de fichier."""
@@ -2031,10 +2837,7 @@ class SlideExtractor:
         try:
             root = self.layout_tree.getroot()
 
-            if LXML_AVAILABLE:
-                csldes = root.xpath('.//p:cSld', namespaces=NAMESPACES)
-            else:
-                csldes = root.findall(f'.//{{{NAMESPACES["p"]}}}cSld')
+            csldes = xpath_all(root, 'c_sld')
 
             if csldes:
                 name = csldes[0].get('name')
@@ -2046,8 +2849,15 @@ class SlideExtractor:
 
         return "Unknown Layout"
 
-    def _extract_all_shapes(self) -> List[Dict[str, Any]]:
-        """Extrait toutes les formes de la slide avec leur formatage."""
+    @profiled('shape_extraction')
+    def _extract_all_shapes(self) -> List[ExtractedShape]:
+        """
+        Extrait toutes les formes de la slide avec leur formatage.
+
+        p:spTree est parcouru une seule fois ; les shape_id suivent l'ordre des
+        formes de premier niveau (sp, grpSp, graphicFrame, cxnSp, pic,
+        contentPart), identique à slide.shapes côté builder.
+        """
 
         shapes = []
 
@@ -2055,15 +2865,10 @@ class SlideExtractor:
             return shapes
 
         try:
-            root = self.slide_tree.getroot()
-
-            if LXML_AVAILABLE:
-                shape_elements = root.xpath('.//p:sp', namespaces=NAMESPACES)
-            else:
-                shape_elements = root.findall(f'.//{{{NAMESPACES["p"]}}}sp')
+            nodes = walk_shape_tree(self.slide_tree.getroot())
 
-            for i, shape_elem in enumerate(shape_elements):
-                shape_data = self._extract_shape_data(shape_elem, i + 1)
+            for i, node in enumerate(nodes):
+                shape_data = self._extract_shape_data(node, i + 1)
                 if shape_data:
                     shapes.append(shape_data)
 
@@ -2072,96 +2877,84 @@ class SlideExtractor:
 
         return shapes
 
-    def _extract_shape_data(self, shape_element, shape_index: int) -> Optional[Dict[str, Any]]:
-        """Extrait les données complètes d'une forme."""
+    def _extract_shape_data(self, node: ShapeNode, shape_index: int) -> Optional[ExtractedShape]:
+        """Extrait les données complètes d'une forme à partir de son nœud collecté."""
 
         try:
+            is_placeholder = node.placeholder is not None
+            if node.kind == 'shape':
+                shape_type = "placeholder" if is_placeholder else "shape"
+            else:
+                shape_type = node.kind
+
             # Données de base
             shape_data = {
-                "name": self._get_shape_name(shape_element),
+                "name": node.name if node.name is not None else 'Unknown Shape',
                 "shape_id": shape_index,
-                "type": "placeholder" if self._is_placeholder(shape_element) else "shape",
-                "position": self._get_shape_position(shape_element)
+                "type": shape_type,
+                "position": self._get_shape_position(node)
             }
 
             # Si c'est un placeholder, ajouter les métadonnées
-            if self._is_placeholder(shape_element):
-                placeholder_info = self._get_placeholder_info(shape_element)
+            if is_placeholder:
+                placeholder_info = self._get_placeholder_info(node.placeholder)
                 shape_data.update(placeholder_info)
 
+            # Contenu propre aux formes non textuelles
+            if node.kind == 'picture' and node.image_rel_id:
+                shape_data["image"] = self.package.get_relationship_target(self.slide_part_name, node.image_rel_id)
+            elif node.kind == 'graphic_frame' and node.graphic_uri:
+                shape_data["graphic_type"] = node.graphic_uri.rsplit('/', 1)[-1]
+            elif node.kind == 'group':
+                children = [self._extract_shape_data(child, i + 1) for i, child in enumerate(node.children)]
+                shape_data["shapes"] = self._filter_populated_content([child for child in children if child])
+
             # Extraire le contenu texte avec formatage complet
-            text_content = self._extract_text_with_formatting(shape_element)
+            text_content = self._extract_text_with_formatting(node)
             if text_content:
-                shape_data["text"] = text_content["text"]
-                shape_data.update(text_content["formatting"])
+                shape_data["text"], shape_data["style"] = text_content
 
-            return shape_data
+            return ExtractedShape(**shape_data)
 
         except Exception as e:
             print(f"[WARNING] Erreur extraction forme {shape_index}: {e}")
             return None
 
-    def _extract_text_with_formatting(self, shape_element) -> Optional[Dict[str, Any]]:
-        """Extrait le texte avec toutes les métadonnées de formatage."""
+    def _extract_text_with_formatting(self, node: ShapeNode) -> Optional[tuple]:
+        """Extrait le texte avec toutes les métadonnées de formatage (texte, style)."""
 
         try:
-            if LXML_AVAILABLE:
-                txbody = shape_element.xpath('.//p:txBody', namespaces=NAMESPACES)
-            else:
-                txbody = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}txBody')
-
-            if not txbody:
+            if node.tx_body is None:
                 return None
 
-            # Obtenir le texte brut
-            if LXML_AVAILABLE:
-                paragraphs = txbody[0].xpath('.//a:p', namespaces=NAMESPACES)
-            else:
-                paragraphs = txbody[0].findall(f'.//{{{NAMESPACES["a"]}}}p')
-
             full_text = ""
-            formatting = {}
+            formatting = None
 
-            if paragraphs:
+            if node.paragraphs:
                 # Prendre le premier paragraphe pour le formatage de référence
-                para = paragraphs[0]
+                para = node.paragraphs[0]
 
-                # Obtenir le texte de tous les runs
-                if LXML_AVAILABLE:
-                    runs = para.xpath('.//a:r', namespaces=NAMESPACES)
-                else:
-                    runs = para.findall(f'.//{{{NAMESPACES["a"]}}}r')
-
-                for run in runs:
-                    if LXML_AVAILABLE:
-                        t_elements = run.xpath('.//a:t', namespaces=NAMESPACES)
-                    else:
-                        t_elements = run.findall(f'.//{{{NAMESPACES["a"]}}}t')
-
-                    for t_elem in t_elements:
-                        if t_elem.text:
-                            full_text += t_elem.text
+                # Texte de tous les runs du premier paragraphe
+                full_text = "".join(node.run_texts)
 
                 # Résoudre le formatage en analysant tous les runs
-                if runs:
-                    placeholder_idx = self._get_placeholder_idx(shape_element)
-                    placeholder_type = self._get_placeholder_type(shape_element)
+                if node.runs:
+                    placeholder_idx = self._get_placeholder_idx(node.placeholder)
+                    placeholder_type = self._get_placeholder_type(node.placeholder)
+                    self.style_resolver.set_shape_context(node.element, node.body_pr)
                     formatting = self._analyze_comprehensive_formatting(
-                        runs, para, shape_element, placeholder_idx, placeholder_type
+                        node.runs, node.run_texts, para, node.element, placeholder_idx, placeholder_type
                     )
 
             if full_text.strip():
-                return {
-                    "text": full_text.strip(),
-                    "formatting": formatting
-                }
+                return full_text.strip(), formatting
 
         except Exception as e:
             print(f"[WARNING] Erreur extraction texte: {e}")
 
         return None
 
-    def _analyze_comprehensive_formatting(self, runs, paragraph_element, shape_element, placeholder_idx, placeholder_type):
+    def _analyze_comprehensive_formatting(self, runs, run_texts, paragraph_element, shape_element, placeholder_idx, placeholder_type):
         """
         Analyse le formatage de tous les runs pour déterminer l'état global des propriétés.
 
@@ -2171,25 +2964,23 @@ class SlideExtractor:
         - null : formatage mixte (certains runs activés, d'autres non)
         """
         if not runs:
-            return {}
-
-        # Collecter le formatage de tous les runs qui contiennent du texte
-        run_formats = []
-
-        for run in runs:
-            # Vérifier si ce run contient du texte
-            if LXML_AVAILABLE:
-                t_elements = run.xpath('.//a:t', namespaces=NAMESPACES)
-            else:
-                t_elements = run.findall(f'.//{{{NAMESPACES["a"]}}}t')
+            return None
 
-            has_text = any(t.text and t.text.strip() for t in t_elements if t.text)
+        # Collecter le formatage des runs qui contiennent du texte, résolu une
+        # seule fois par signature <a:rPr> distincte (ordre de première apparition)
+        formats_by_signature = {}
+
+        for run, run_text in zip(runs, run_texts):
+            # Ne retenir que les runs qui contiennent du texte
+            if run_text.strip():
+                signature = StyleResolver.run_style_signature(run)
+                if signature not in formats_by_signature:
+                    formats_by_signature[signature] = self.style_resolver.resolve_text_properties(
+                        run, paragraph_element, shape_element, placeholder_idx, placeholder_type
+                    )
 
-            if has_text:
-                run_format = self.style_resolver.resolve_text_properties(
-                    run, paragraph_element, shape_element, placeholder_idx, placeholder_type
-                )
-                run_formats.append(run_format)
+        # Les valeurs tri-état ne dépendent que des formats distincts
+        run_formats = list(formats_by_signature.values())
 
         if not run_formats:
             # Si aucun run avec texte, utiliser le formatage par défaut
@@ -2197,60 +2988,22 @@ class SlideExtractor:
                 runs[0], paragraph_element, shape_element, placeholder_idx, placeholder_type
             )
 
-        # Analyser les propriétés tri-état pour bold, italic, underline
-        comprehensive_format = run_formats[0].copy()  # Base format
+        # Analyser les propriétés tri-état pour bold, italic, underline et color :
+        # une valeur commune à tous les runs est conservée, des valeurs différentes
+        # donnent None (formatage mixte). Sans valeur explicite dans les runs, la
+        # valeur par défaut résolue du premier run est gardée.
+        comprehensive_format = run_formats[0]  # Base format
+        merged = {}
 
-        # Analyser bold - respect de la valeur résolue par défaut si pas de formatage explicite
-        bold_values = [rf.get('bold') for rf in run_formats if 'bold' in rf and rf.get('bold') is not None]
-        if bold_values:
-            unique_bold_values = set(bold_values)
-            if len(unique_bold_values) == 1:
-                # Tous les runs ont la même valeur
-                comprehensive_format['bold'] = bold_values[0]
-            else:
-                # Formatage mixte (certains True, certains False)
-                comprehensive_format['bold'] = None
-        # Si aucune valeur bold explicite dans les runs, garder la valeur par défaut résolue
-
-        # Analyser italic - respect de la valeur résolue par défaut si pas de formatage explicite
-        italic_values = [rf.get('italic') for rf in run_formats if 'italic' in rf and rf.get('italic') is not None]
-        if italic_values:
-            unique_italic_values = set(italic_values)
-            if len(unique_italic_values) == 1:
-                # Tous les runs ont la même valeur
-                comprehensive_format['italic'] = italic_values[0]
-            else:
-                # Formatage mixte (certains True, certains False)
-                comprehensive_format['italic'] = None
-        # Si aucune valeur italic explicite dans les runs, garder la valeur par défaut résolue
-
-        # Analyser underline - respect de la valeur résolue par défaut si pas de formatage explicite
-        underline_values = [rf.get('underline') for rf in run_formats if 'underline' in rf and rf.get('underline') is not None]
-        if underline_values:
-            unique_underline_values = set(underline_values)
-            if len(unique_underline_values) == 1:
-                # Tous les runs ont la même valeur
-                comprehensive_format['underline'] = underline_values[0]
-            else:
-                # Formatage mixte (certains True, certains False)
-                comprehensive_format['underline'] = None
-        # Si aucune valeur underline explicite dans les runs, garder la valeur par défaut résolue
-
-        # Analyser color - respect de la valeur résolue par défaut si pas de couleur explicite
-        color_values = [rf.get('color') for rf in run_formats if 'color' in rf and rf.get('color') is not None]
-        if color_values:
-            unique_color_values = set(color_values)
-            if len(unique_color_values) == 1:
-                # Tous les runs ont la même couleur
-                comprehensive_format['color'] = color_values[0]
-            else:
-                # Formatage mixte (couleurs différentes dans les runs)
-                comprehensive_format['color'] = None
-        # Si aucune valeur color explicite dans les runs, garder la valeur par défaut résolue
+        for property_name in ('bold', 'italic', 'underline', 'color'):
+            values = [getattr(rf, property_name) for rf in run_formats if getattr(rf, property_name) is not None]
+            if values:
+                unique_values = set(values)
+                merged[property_name] = values[0] if len(unique_values) == 1 else None
 
-        return comprehensive_format
+        return comprehensive_format._replace(**merged) if merged else comprehensive_format
 
-    def _filter_populated_content(self, shapes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_populated_content(self, shapes: List[ExtractedShape]) -> List[ExtractedShape]:
         """
         Filtre les formes pour ne garder que le contenu spécifique à la slide.
 
@@ -2261,7 +3014,7 @@ class SlideExtractor:
 
         for shape in shapes:
             # Si ce n'est pas un placeholder, c'est une forme directe -> toujours inclure
-            if shape.get("type") != "placeholder":
+            if shape.type != "placeholder":
                 filtered.append(shape)
                 continue
 
@@ -2271,19 +3024,19 @@ class SlideExtractor:
 
         return filtered
 
-    def _is_placeholder_populated(self, shape_data: Dict[str, Any]) -> bool:
+    def _is_placeholder_populated(self, shape_data: ExtractedShape) -> bool:
         """
         Détermine si un placeholder est peuplé avec du contenu spécifique.
 
         Utilise la comparaison différentielle entre slide et layout.
         """
         # Si pas de texte, considéré comme non peuplé
-        if not shape_data.get("text"):
+        if not shape_data.text:
             return False
 
         # Pour une implémentation complète, on devrait comparer avec le layout
         # Pour l'instant, version simplifiée qui évite les textes par défaut courants
-        text = shape_data.get("text", "").strip().lower()
+        text = shape_data.text.strip().lower()
 
         # Textes d'invite courants (à compléter selon les templates)
         default_texts = [
@@ -2291,51 +3044,18 @@ class SlideExtractor:
             "cliquez pour ajouter du texte",
             "cliquez pour ajouter un sous-titre",
             "click to add title",
-            "click to add text",
-            "click to add subtitle"
-        ]
-
-        return text not in default_texts
-
-    def _get_shape_name(self, shape_element) -> str:
-        """Obtient le nom de la forme."""
-        try:
-            if LXML_AVAILABLE:
-                nvsppr = shape_element.xpath('.//p:nvSpPr/p:cNvPr', namespaces=NAMESPACES)
-            else:
-                nvsppr = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}cNvPr')
-
-            if nvsppr:
-                return nvsppr[0].get('name', 'Unknown Shape')
-        except:
-            pass
-
-        return 'Unknown Shape'
-
-    def _is_placeholder(self, shape_element) -> bool:
-        """Vérifie si la forme est un placeholder."""
-        try:
-            if LXML_AVAILABLE:
-                ph = shape_element.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
-            else:
-                ph = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}nvPr/{{{NAMESPACES["p"]}}}ph')
+            "click to add text",
+            "click to add subtitle"
+        ]
 
-            return len(ph) > 0
-        except:
-            return False
+        return text not in default_texts
 
-    def _get_placeholder_info(self, shape_element) -> Dict[str, Any]:
-        """Obtient les informations de placeholder."""
+    def _get_placeholder_info(self, ph_elem) -> Dict[str, Any]:
+        """Obtient les informations d'un élément placeholder <p:ph>."""
         info = {}
 
         try:
-            if LXML_AVAILABLE:
-                ph = shape_element.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
-            else:
-                ph = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}nvPr/{{{NAMESPACES["p"]}}}ph')
-
-            if ph:
-                ph_elem = ph[0]
+            if ph_elem is not None:
                 info["placeholder_type"] = ph_elem.get('type', 'body')
 
                 idx = ph_elem.get('idx')
@@ -2346,16 +3066,11 @@ class SlideExtractor:
 
         return info
 
-    def _get_placeholder_idx(self, shape_element) -> Optional[int]:
+    def _get_placeholder_idx(self, ph_elem) -> Optional[int]:
         """Obtient l'index du placeholder."""
         try:
-            if LXML_AVAILABLE:
-                ph = shape_element.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
-            else:
-                ph = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}nvPr/{{{NAMESPACES["p"]}}}ph')
-
-            if ph:
-                idx = ph[0].get('idx')
+            if ph_elem is not None:
+                idx = ph_elem.get('idx')
                 if idx and idx != "None":  # Vérifier que ce n'est pas la chaîne "None"
                     return int(idx)
         except:
@@ -2363,112 +3078,44 @@ class SlideExtractor:
 
         return None
 
-    def _get_placeholder_type(self, shape_element) -> Optional[str]:
+    def _get_placeholder_type(self, ph_elem) -> Optional[str]:
         """Obtient le type du placeholder."""
-        try:
-            if LXML_AVAILABLE:
-                ph = shape_element.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
-            else:
-                ph = shape_element.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}nvPr/{{{NAMESPACES["p"]}}}ph')
-
-            if ph:
-                return ph[0].get('type', 'body')
-        except:
-            pass
+        if ph_elem is not None:
+            return ph_elem.get('type', 'body')
 
         return None
 
-    def _get_shape_position(self, shape_element) -> Dict[str, float]:
+    def _get_shape_position(self, node: ShapeNode) -> ShapePosition:
         """Obtient la position et dimensions de la forme."""
         position = {"left": 0, "top": 0, "width": 0, "height": 0}
 
-        # Étape 1: Chercher position directe dans la forme
-        xfrm_elem = self._find_xfrm_in_shape(shape_element)
+        # Étape 1: Position directe dans la forme (relevée lors du parcours)
+        xfrm_elem = node.xfrm
 
         # Étape 2: Si pas trouvé et c'est un placeholder, chercher dans le layout
-        if xfrm_elem is None and self._is_placeholder(shape_element):
-            xfrm_elem = self._find_xfrm_in_layout_for_placeholder(shape_element)
+        if xfrm_elem is None and node.placeholder is not None:
+            xfrm_elem = self._find_xfrm_in_layout_for_placeholder(node.placeholder)
 
         if xfrm_elem is not None:
             self._extract_position_from_xfrm(xfrm_elem, position)
 
-        return position
+        return ShapePosition(**position)
 
-    def _find_xfrm_in_shape(self, shape_element):
-        """Cherche l'élément xfrm directement dans la forme."""
-        try:
-            if LXML_AVAILABLE:
-                xfrm = shape_element.xpath('./p:spPr/a:xfrm', namespaces=NAMESPACES)
-            else:
-                xfrm = shape_element.findall(f'./{{{NAMESPACES["p"]}}}spPr/{{{NAMESPACES["a"]}}}xfrm')
-
-            return xfrm[0] if xfrm else None
-        except:
-            return None
-
-    def _find_xfrm_in_layout_for_placeholder(self, shape_element):
+    def _find_xfrm_in_layout_for_placeholder(self, ph_elem):
         """Cherche la position dans le layout pour un placeholder."""
-        if self.layout_tree is None:
+        if self.layout_index is None:
             return None
 
-        try:
-            # Obtenir les informations du placeholder
-            placeholder_info = self._get_placeholder_info(shape_element)
-            placeholder_type = placeholder_info.get("placeholder_type")
-            placeholder_idx = placeholder_info.get("placeholder_idx")
-
-            # Chercher le placeholder correspondant dans le layout
-            if LXML_AVAILABLE:
-                layout_shapes = self.layout_tree.xpath('//p:sp', namespaces=NAMESPACES)
-            else:
-                layout_shapes = self.layout_tree.findall(f'.//{{{NAMESPACES["p"]}}}sp')
-
-            for layout_shape in layout_shapes:
-                # Vérifier si c'est le bon placeholder
-                if LXML_AVAILABLE:
-                    ph_elements = layout_shape.xpath('.//p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
-                else:
-                    ph_elements = layout_shape.findall(f'.//{{{NAMESPACES["p"]}}}nvSpPr/{{{NAMESPACES["p"]}}}nvPr/{{{NAMESPACES["p"]}}}ph')
-
-                if ph_elements:
-                    ph_elem = ph_elements[0]
-                    layout_type = ph_elem.get('type', 'body')
-                    layout_idx_str = ph_elem.get('idx')
-
-                    layout_idx = None
-                    if layout_idx_str and layout_idx_str != "None":
-                        try:
-                            layout_idx = int(layout_idx_str)
-                        except:
-                            pass
-
-                    # Vérifier correspondance
-                    if ((placeholder_type == layout_type) and
-                        (placeholder_idx == layout_idx)):
-
-                        # Chercher xfrm dans ce placeholder du layout
-                        if LXML_AVAILABLE:
-                            xfrm = layout_shape.xpath('./p:spPr/a:xfrm', namespaces=NAMESPACES)
-                        else:
-                            xfrm = layout_shape.findall(f'./{{{NAMESPACES["p"]}}}spPr/{{{NAMESPACES["a"]}}}xfrm')
-
-                        if xfrm:
-                            return xfrm[0]
-
-        except Exception as e:
-            # print(f"[DEBUG] Erreur recherche dans layout: {e}")
-            pass
-
-        return None
+        placeholder_info = self._get_placeholder_info(ph_elem)
+        return self.layout_index.get_xfrm(
+            placeholder_info.get("placeholder_type"), placeholder_info.get("placeholder_idx")
+        )
 
     def _extract_position_from_xfrm(self, xfrm_elem, position):
         """Extrait les positions depuis un élément xfrm."""
         try:
             # Position (off)
-            if LXML_AVAILABLE:
-                off = xfrm_elem.xpath('./a:off', namespaces=NAMESPACES)
-            else:
-                off = xfrm_elem.findall(f'./{{{NAMESPACES["a"]}}}off')
+            off = xpath_all(xfrm_elem, 'xfrm_off')
 
             if off:
                 x = off[0].get('x')
@@ -2485,10 +3132,7 @@ class SlideExtractor:
                         pass
 
             # Dimensions (ext)
-            if LXML_AVAILABLE:
-                ext = xfrm_elem.xpath('./a:ext', namespaces=NAMESPACES)
-            else:
-                ext = xfrm_elem.findall(f'./{{{NAMESPACES["a"]}}}ext')
+            ext = xpath_all(xfrm_elem, 'xfrm_ext')
 
             if ext:
                 cx = ext[0].get('cx')
@@ -2524,45 +3168,182 @@ def find_slide_part_name(package: PPTXPackage, slide_number: int) -> Optional[st
         Nom de la partie slide ou None
     """
     try:
-        presentation_tree = package.get_xml_tree('ppt/presentation.xml')
-        if presentation_tree is None:
-            return None
+        slide_parts = package.get_slide_parts()
+        if 1 <= slide_number <= len(slide_parts):
+            return slide_parts[slide_number - 1]
 
-        root = presentation_tree.getroot()
+    except Exception as e:
+        print(f"[WARNING] Erreur recherche slide {slide_number}: {e}")
+
+    # Fallback : nom standard
+    return f"ppt/slides/slide{slide_number}.xml"
+
+
+# Package ouvert une seule fois par processus worker de régénération
+_REGENERATION_PACKAGE = None
+
+
+def _init_regeneration_worker(pptx_file: str, use_mmap: bool = False):
+    """
+    Initialise un processus worker : chaque worker ouvre son propre PPTXPackage.
+
+    Args:
+        pptx_file: Chemin vers le fichier template .pptx
+        use_mmap: Lire l'archive par projection mémoire
+    """
+    global _REGENERATION_PACKAGE
+    _REGENERATION_PACKAGE = PPTXPackage(pptx_file, use_mmap=use_mmap)
+
+
+def _share_regeneration_package(package: Optional[PPTXPackage]):
+    """
+    Publie le package du processus principal pour les workers créés par fork.
+
+    Args:
+        package: Package projeté en mémoire, hérité tel quel par les workers (None pour retirer)
+    """
+    global _REGENERATION_PACKAGE
+    _REGENERATION_PACKAGE = package
 
-        if LXML_AVAILABLE:
-            slide_ids = root.xpath('.//p:sldIdLst/p:sldId', namespaces=NAMESPACES)
-        else:
-            slide_ids = root.findall(f'.//{{{NAMESPACES["p"]}}}sldIdLst/{{{NAMESPACES["p"]}}}sldId')
 
-        if slide_number <= len(slide_ids):
-            slide_id_elem = slide_ids[slide_number - 1]
-            rel_id = slide_id_elem.get(f'{{{NAMESPACES["r"]}}}id')
+def _extract_slide_for_regeneration(package: PPTXPackage, slide_number: int,
+                                    slide_part_name: str) -> Dict[str, Any]:
+    """
+    Extrait une slide et capture ses messages pour un affichage ordonné.
+
+    Args:
+        package: Package PPTX ouvert
+        slide_number: Numéro de slide (1-indexé)
+        slide_part_name: Nom de la partie slide
 
-            if rel_id:
-                # Résoudre la relation
-                pres_rels = package.get_xml_tree('ppt/_rels/presentation.xml.rels')
-                if pres_rels:
-                    relations = package._parse_relations(pres_rels)
-                    target = relations.get(rel_id)
-                    if target:
-                        return f"ppt/{target}"
+    Returns:
+        Résultat avec métadonnées (ou erreur), journal capturé et durée en secondes
+    """
+    log = io.StringIO()
+    result = {
+        'slide_number': slide_number,
+        'slide_part': slide_part_name,
+        'metadata': None,
+        'error': None,
+        'traceback': None,
+    }
 
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            extractor = SlideExtractor(package, slide_part_name)
+            result['metadata'] = extractor.extract_metadata()
     except Exception as e:
-        print(f"[WARNING] Erreur recherche slide {slide_number}: {e}")
+        import traceback
+        result['error'] = str(e)
+        result['traceback'] = traceback.format_exc()
+    finally:
+        package.release_part(slide_part_name)
 
-    # Fallback : nom standard
-    return f"ppt/slides/slide{slide_number}.xml"
+    result['elapsed'] = time.perf_counter() - start
+    result['log'] = log.getvalue()
+    return result
+
+
+def _regeneration_worker_task(task) -> Dict[str, Any]:
+    """Point d'entrée d'une tâche de régénération dans un processus worker."""
+    slide_number, slide_part_name = task
+    # Les processus occupent déjà chaque CPU : pas de threads de préchargement en plus
+    # (package ouvert par l'initialiseur ou hérité du parent par fork)
+    _REGENERATION_PACKAGE.prefetch_workers = 0
+    return _extract_slide_for_regeneration(_REGENERATION_PACKAGE, slide_number, slide_part_name)
+
+
+def _load_regeneration_manifest(output_dir: str, compact: bool = False) -> Dict[str, Any]:
+    """
+    Charge le manifeste de régénération incrémentale d'un dossier de structures.
+
+    Args:
+        output_dir: Dossier des structures de layout
+        compact: Format JSON demandé pour les structures
+
+    Returns:
+        Entrées du manifeste par numéro de slide (vide si absent, invalide,
+        produit par une autre version de l'extracteur, dans un autre format
+        ou par un autre backend JSON)
+    """
+    manifest_path = os.path.join(output_dir, REGENERATION_MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {}
 
+    try:
+        with open(manifest_path, 'rb') as f:
+            manifest = json_backend.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Manifeste illisible, régénération complète: {e}")
+        return {}
+
+    if manifest.get('extractor_version') != EXTRACTOR_VERSION:
+        print(f"[INFO] Version d'extracteur modifiée "
+              f"({manifest.get('extractor_version')} -> {EXTRACTOR_VERSION}), régénération complète")
+        return {}
+
+    if manifest.get('compact', False) != compact:
+        print(f"[INFO] Format JSON modifié ({'compact' if compact else 'indenté'}), régénération complète")
+        return {}
+
+    # orjson et json ne formatent pas tous les flottants de la même façon
+    if manifest.get('json_backend') != json_backend.BACKEND:
+        print(f"[INFO] Backend JSON modifié ({manifest.get('json_backend')} -> {json_backend.BACKEND}), "
+              f"régénération complète")
+        return {}
+
+    return manifest.get('slides', {})
+
+
+def _save_regeneration_manifest(output_dir: str, pptx_file: str, entries: Dict[str, Any],
+                                compact: bool = False):
+    """
+    Écrit le manifeste de régénération (clés triées pour des diffs minimaux).
 
-def regenerate_all_layouts(pptx_file: str, output_dir: str = None, debug: bool = False):
+    Args:
+        output_dir: Dossier des structures de layout
+        pptx_file: Template source
+        entries: Entrées par numéro de slide
+        compact: Format JSON des structures (et du manifeste)
+    """
+    manifest = {
+        'extractor_version': EXTRACTOR_VERSION,
+        'template': os.path.basename(pptx_file),
+        'compact': compact,
+        'json_backend': json_backend.BACKEND,
+        'slides': {str(number): entries[number] for number in sorted(entries)},
+    }
+    manifest_path = os.path.join(output_dir, REGENERATION_MANIFEST_NAME)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json_backend.dump(manifest, f, pretty=not compact, sort_keys=True)
+        f.write('\n')
+
+
+def regenerate_all_layouts(pptx_file: str, output_dir: str = None, debug: bool = False,
+                           workers: Optional[int] = None, force: bool = False,
+                           compact: bool = False, use_mmap: bool = False):
     """
     Régénère toutes les structures de layout avec noms basés sur layout_name.
 
+    Les slides sont lues depuis presentation.xml (sldIdLst) puis extraites en
+    parallèle dans un pool de processus. Les fichiers sont écrits par le
+    processus principal dans l'ordre des slides : à nom de layout identique,
+    la dernière slide l'emporte, comme en exécution séquentielle.
+
+    La régénération est incrémentale : un manifeste enregistre, pour chaque
+    slide, les CRC-32 des parties slide/layout/master/thème utilisées. Les
+    slides dont ces entrées n'ont pas changé sont réutilisées telles quelles.
+
     Args:
         pptx_file: Chemin vers le fichier template .pptx
         output_dir: Dossier de sortie (défaut: templates/presentation-project/slide-structure/)
         debug: Mode debug
+        workers: Nombre de processus (défaut: nombre de CPU, 1 = séquentiel)
+        force: Ignorer le manifeste et tout régénérer
+        compact: Écrire les structures en JSON compact plutôt qu'indenté
+        use_mmap: Lire l'archive par projection mémoire ; avec fork, les workers
+            héritent du package du processus principal au lieu de le rouvrir
     """
     if output_dir is None:
         output_dir = "templates/presentation-project/slide-structure"
@@ -2575,44 +3356,148 @@ def regenerate_all_layouts(pptx_file: str, output_dir: str = None, debug: bool =
 
     package = None
     generated_count = 0
+    total_start = time.perf_counter()
 
     try:
-        package = PPTXPackage(pptx_file)
+        package = PPTXPackage(pptx_file, use_mmap=use_mmap)
+        slide_parts = dict(enumerate(package.get_slide_parts(), start=1))
+        slide_inputs = {number: package.get_slide_inputs(part)
+                        for number, part in slide_parts.items()}
+
+        # Slides dont les entrées (partie, CRC, fichier de sortie) sont inchangées
+        previous = {} if force else _load_regeneration_manifest(output_dir, compact)
+        previous = {int(number): entry for number, entry in previous.items()}
+        reused = set()
+        for number, part in slide_parts.items():
+            entry = previous.get(number)
+            if (entry and entry.get('slide_part') == part
+                    and entry.get('inputs') == slide_inputs[number]
+                    and os.path.exists(os.path.join(output_dir, entry.get('output', '')))):
+                reused.add(number)
+
+        # Un fichier partagé par plusieurs slides n'est fiable que si toutes sont inchangées
+        stale_outputs = {entry.get('output') for number, entry in previous.items()
+                         if number not in reused}
+        reused = {number for number in reused if previous[number]['output'] not in stale_outputs}
+
+        tasks = [(number, part) for number, part in slide_parts.items() if number not in reused]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if PROFILER.enabled and workers != 1:
+            # Les compteurs de phase ne sont accumulés que dans ce processus
+            print(f"[INFO] Profilage actif: extraction séquentielle dans ce processus")
+            workers = 1
+        workers = max(1, min(workers, len(tasks) or 1))
+
+        print(f"[INFO] {len(slide_parts)} slides: {len(reused)} inchangées, "
+              f"{len(tasks)} à extraire ({workers} processus)")
+
+        if not tasks:
+            results = []
+        elif workers == 1:
+            results = [_extract_slide_for_regeneration(package, number, part)
+                       for number, part in tasks]
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            if package.is_mapped and 'fork' in multiprocessing.get_all_start_methods():
+                # Archive projetée : les workers forkés partagent le mmap et le cache déjà chargé
+                _share_regeneration_package(package)
+                pool_options = {'mp_context': multiprocessing.get_context('fork')}
+            else:
+                pool_options = {'initializer': _init_regeneration_worker,
+                                'initargs': (pptx_file, use_mmap)}
 
-        # Extraire toutes les slides (1 à 57)
-        for slide_number in range(1, 58):
             try:
-                slide_part_name = find_slide_part_name(package, slide_number)
-                if not slide_part_name:
-                    if debug:
-                        print(f"[DEBUG] Slide {slide_number} non trouvée, ignorée")
-                    continue
+                with ProcessPoolExecutor(max_workers=workers, **pool_options) as executor:
+                    # map() conserve l'ordre des slides quel que soit l'ordre de fin
+                    results = list(executor.map(_regeneration_worker_task, tasks))
+            finally:
+                _share_regeneration_package(None)
+
+        # Nouvelles entrées du manifeste : réutilisées telles quelles, puis extraites
+        manifest_entries = {number: previous[number] for number in reused}
+        extracted = {}
+        for result in results:
+            slide_number = result['slide_number']
+            if result['log']:
+                print(result['log'], end='')
+
+            if result['error'] is not None:
+                print(f"[WARNING] Erreur slide {slide_number}: {result['error']}")
+                if debug:
+                    print(result['traceback'], end='')
+                continue
+
+            metadata = result['metadata']
+            layout_name = metadata.get('layout_name', f'Unknown_Layout_{slide_number}')
+            extracted[slide_number] = result
+            manifest_entries[slide_number] = {
+                'slide_part': result['slide_part'],
+                'layout_name': layout_name,
+                'output': generate_layout_filename(layout_name),
+                'inputs': slide_inputs[slide_number],
+            }
+
+        # Dernière slide écrivant chaque fichier (ordre séquentiel d'origine)
+        final_writers = {}
+        for number in sorted(manifest_entries):
+            final_writers[manifest_entries[number]['output']] = number
 
-                extractor = SlideExtractor(package, slide_part_name)
-                metadata = extractor.extract_metadata()
+        # Écriture déterministe, dans l'ordre des slides
+        for slide_number in sorted(extracted):
+            result = extracted[slide_number]
+            metadata = result['metadata']
+            entry = manifest_entries[slide_number]
+            filename = entry['output']
+            output_path = os.path.join(output_dir, filename)
 
-                layout_name = metadata.get('layout_name', f'Unknown_Layout_{slide_number}')
-                filename = generate_layout_filename(layout_name)
-                output_path = os.path.join(output_dir, filename)
+            if final_writers[filename] != slide_number:
+                if debug:
+                    print(f"[DEBUG] Slide {slide_number}: {filename} fourni par la slide "
+                          f"{final_writers[filename]}")
+                continue
 
+            try:
                 # Sauvegarder avec le nouveau nom
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                with PROFILER.phase('output_write'), open(output_path, 'w', encoding='utf-8') as f:
+                    json_backend.dump(metadata, f, pretty=not compact)
+            except OSError as e:
+                print(f"[WARNING] Erreur écriture slide {slide_number}: {e}")
+                del manifest_entries[slide_number]
+                continue
 
-                generated_count += 1
-                print(f"[CREATED] Slide {slide_number}: {layout_name} -> {filename}")
+            generated_count += 1
+            print(f"[CREATED] Slide {slide_number}: {entry['layout_name']} -> {filename} "
+                  f"({result['elapsed'] * 1000:.1f} ms)")
 
-                if debug:
-                    print(f"[DEBUG] - Shapes: {metadata.get('total_shapes', 0)}")
-                    print(f"[DEBUG] - Fichier: {output_path}")
+            if debug:
+                print(f"[DEBUG] - Shapes: {metadata.get('total_shapes', 0)}")
+                print(f"[DEBUG] - Fichier: {output_path}")
 
-            except Exception as e:
-                print(f"[WARNING] Erreur slide {slide_number}: {e}")
-                if debug:
-                    import traceback
-                    traceback.print_exc()
+        _save_regeneration_manifest(output_dir, pptx_file, manifest_entries, compact)
+
+        if reused:
+            print(f"[REUSED] Slides inchangées: {', '.join(str(n) for n in sorted(reused))}")
+        if extracted:
+            print(f"[REBUILT] Slides régénérées: {', '.join(str(n) for n in sorted(extracted))}")
+
+        print(f"\n[SUCCESS] {generated_count} structures de layout générées, "
+              f"{len(reused)} slides réutilisées dans {output_dir}")
 
-        print(f"\n[SUCCESS] {generated_count} structures de layout générées dans {output_dir}")
+        # Résumé des temps par slide
+        if results:
+            timings = sorted(results, key=lambda r: r['elapsed'], reverse=True)
+            cumulated = sum(r['elapsed'] for r in results)
+            print(f"[TIMING] Total: {time.perf_counter() - total_start:.2f} s "
+                  f"(extraction cumulée: {cumulated:.2f} s, {workers} processus)")
+            for result in timings[:5]:
+                print(f"[TIMING] - Slide {result['slide_number']}: {result['elapsed'] * 1000:.1f} ms")
+
+        if debug:
+            print(f"[DEBUG] Cache XML: {package.cache_stats()}")
 
     except Exception as e:
         print(f"[ERROR] Erreur lors de la régénération: {e}")
@@ -2626,6 +3511,399 @@ def regenerate_all_layouts(pptx_file: str, output_dir: str = None, debug: bool =
             package.close()
 
 
+def parse_slide_selection(selection: str) -> List[int]:
+    """
+    Parse un sélecteur de slides de type "3-17,22".
+
+    Args:
+        selection: Liste de numéros et d'intervalles séparés par des virgules
+
+    Returns:
+        Numéros de slides (1-indexés), sans doublons, dans l'ordre donné
+    """
+    slide_numbers = []
+    seen = set()
+
+    for token in selection.split(','):
+        token = token.strip()
+        if not token:
+            continue
+
+        if '-' in token:
+            start_str, end_str = token.split('-', 1)
+            start, end = int(start_str), int(end_str)
+            if start > end:
+                raise ValueError(f"Intervalle de slides invalide: {token}")
+            numbers = range(start, end + 1)
+        else:
+            numbers = [int(token)]
+
+        for number in numbers:
+            if number < 1:
+                raise ValueError(f"Numéro de slide invalide: {number}")
+            if number not in seen:
+                seen.add(number)
+                slide_numbers.append(number)
+
+    if not slide_numbers:
+        raise ValueError(f"Sélection de slides vide: '{selection}'")
+
+    return slide_numbers
+
+
+def iter_slide_metadata(package: PPTXPackage, slide_numbers: Optional[List[int]] = None):
+    """
+    Extrait les slides d'un package une par une (générateur).
+
+    Parcourt sldIdLst une seule fois. Chaque partie slide est libérée du
+    cache dès son extraction pour que la mémoire reste constante.
+
+    Args:
+        package: Package PPTX ouvert
+        slide_numbers: Numéros à extraire (1-indexés), toutes les slides si None
+
+    Yields:
+        Tuple (slide_number, metadata)
+    """
+    slide_parts = package.get_slide_parts()
+
+    if slide_numbers is None:
+        slide_numbers = range(1, len(slide_parts) + 1)
+    slide_numbers = list(slide_numbers)
+
+    for position, slide_number in enumerate(slide_numbers):
+        if slide_number > len(slide_parts):
+            print(f"[WARNING] Slide {slide_number} hors limites (présentation: {len(slide_parts)} slides), ignorée")
+            continue
+
+        # Précharger les slides suivantes pendant l'extraction de celle-ci
+        for upcoming in slide_numbers[position:position + 1 + PREFETCH_LOOKAHEAD_SLIDES]:
+            if upcoming <= len(slide_parts):
+                package.prefetch(package.get_slide_dependencies(slide_parts[upcoming - 1]))
+
+        slide_part_name = slide_parts[slide_number - 1]
+        metadata = SlideExtractor(package, slide_part_name).extract_metadata()
+        package.release_part(slide_part_name)
+
+        # Position dans la présentation (le numéro du fichier XML peut différer)
+        metadata["slide_index"] = slide_number
+        yield slide_number, metadata
+
+
+def extract_slides(source: Union[str, Path, PPTXPackage],
+                   slide_numbers: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    API d'extraction en processus : extrait plusieurs slides d'une présentation.
+
+    Un PPTXPackage déjà ouvert peut être fourni pour partager l'archive, les
+    thèmes et les index de placeholders entre plusieurs appels ; il reste
+    alors ouvert. Un chemin ouvre un package qui est fermé en fin d'appel.
+
+    Args:
+        source: Chemin vers le fichier .pptx ou package déjà ouvert
+        slide_numbers: Numéros à extraire (1-indexés), toutes les slides si None
+
+    Returns:
+        Dict numéro de slide -> métadonnées (les slides hors limites sont ignorées)
+    """
+    owns_package = not isinstance(source, PPTXPackage)
+    package = PPTXPackage(source) if owns_package else source
+
+    try:
+        return dict(iter_slide_metadata(package, slide_numbers))
+    finally:
+        if owns_package:
+            package.close()
+
+
+def stream_slides_jsonl(pptx_file: str, output_file: Optional[str] = None,
+                        slide_numbers: Optional[List[int]] = None, debug: bool = False,
+                        use_mmap: bool = False) -> int:
+    """
+    Extrait les slides d'une présentation en flux JSONL (un objet compact par ligne).
+
+    Chaque ligne est écrite et flushée dès que la slide est extraite, pour que
+    les outils en aval puissent consommer le flux avant la fin de l'extraction.
+
+    Args:
+        pptx_file: Chemin vers le fichier .pptx
+        output_file: Fichier .jsonl de sortie (stdout si None)
+        slide_numbers: Numéros à extraire (1-indexés), toutes les slides si None
+        debug: Mode debug
+        use_mmap: Lire l'archive par projection mémoire
+
+    Returns:
+        int: Nombre de slides écrites
+    """
+    # Sur stdout, les messages de diagnostic sont redirigés vers stderr
+    stream = open(output_file, 'w', encoding='utf-8') if output_file else sys.stdout
+    log_target = sys.stdout if output_file else sys.stderr
+
+    package = None
+    written = 0
+
+    try:
+        with contextlib.redirect_stdout(log_target):
+            package = PPTXPackage(pptx_file, use_mmap=use_mmap)
+
+            for slide_number, metadata in iter_slide_metadata(package, slide_numbers):
+                with PROFILER.phase('output_write'):
+                    stream.write(json_backend.dumps(metadata, pretty=False))
+                    stream.write('\n')
+                    stream.flush()
+                written += 1
+
+                if debug:
+                    print(f"[DEBUG] Slide {slide_number}: {metadata.get('layout_name')} "
+                          f"({metadata.get('total_shapes', 0)} formes)")
+
+            print(f"[SUCCESS] {written} slides extraites"
+                  + (f" dans {output_file}" if output_file else ""))
+
+            if debug:
+                print(f"[DEBUG] Cache XML: {package.cache_stats()}")
+
+    finally:
+        if package:
+            package.close()
+        if output_file:
+            stream.close()
+
+    return written
+
+
+def discover_pptx_files(corpus_dir: str) -> List[str]:
+    """
+    Découvre récursivement les fichiers .pptx d'un dossier, dans un ordre stable.
+
+    Les dossiers cachés et les fichiers verrous de PowerPoint (~$*.pptx) sont ignorés.
+
+    Args:
+        corpus_dir: Dossier racine du corpus
+
+    Returns:
+        Chemins des decks, triés
+    """
+    decks = []
+
+    for directory, dirnames, filenames in os.walk(corpus_dir):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+
+        for filename in sorted(filenames):
+            if filename.lower().endswith('.pptx') and not filename.startswith('~$'):
+                decks.append(os.path.join(directory, filename))
+
+    return decks
+
+
+def _file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Empreinte sha256 d'un fichier, lu par blocs."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_corpus_deck(task, prefetch: bool = True) -> Dict[str, Any]:
+    """
+    Extrait un deck du corpus vers son fichier JSONL et retourne son entrée d'index.
+
+    Seul le résumé (layouts, nombre de formes) remonte au processus principal :
+    les métadonnées complètes sont écrites au fil de l'eau puis libérées.
+
+    Args:
+        task: Tuple (chemin du deck, chemin relatif, fichier JSONL de sortie, use_mmap)
+        prefetch: Précharger les parts sur un pool de threads (désactivé dans
+            les workers d'un pool de processus, déjà un par CPU)
+
+    Returns:
+        Entrée d'index du deck, avec journal capturé et durée en secondes
+    """
+    pptx_path, relative_path, output_path, use_mmap = task
+    log = io.StringIO()
+    entry = {
+        'deck': relative_path,
+        'sha256': None,
+        'size_bytes': None,
+        'output': None,
+        'slide_count': 0,
+        'slides': [],
+        'error': None,
+    }
+
+    start = time.perf_counter()
+    temp_path = output_path + '.tmp'
+    package = None
+    try:
+        with contextlib.redirect_stdout(log):
+            entry['size_bytes'] = os.path.getsize(pptx_path)
+            entry['sha256'] = _file_sha256(pptx_path)
+
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            package = PPTXPackage(pptx_path, use_mmap=use_mmap)
+            if not prefetch:
+                package.prefetch_workers = 0
+
+            with open(temp_path, 'w', encoding='utf-8') as stream:
+                for slide_index, metadata in iter_slide_metadata(package):
+                    stream.write(json_backend.dumps(metadata, pretty=False))
+                    stream.write('\n')
+                    entry['slides'].append({
+                        'slide_index': slide_index,
+                        'layout_name': metadata.get('layout_name'),
+                        'total_shapes': metadata.get('total_shapes', 0),
+                    })
+
+            # Remplacement atomique : pas de JSONL partiel en cas d'erreur
+            os.replace(temp_path, output_path)
+            entry['output'] = output_path
+            entry['slide_count'] = len(entry['slides'])
+
+    except Exception as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+        entry['slides'] = []
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    finally:
+        if package:
+            package.close()
+
+    entry['elapsed'] = time.perf_counter() - start
+    entry['log'] = log.getvalue()
+    return entry
+
+
+def extract_corpus(corpus_dir: str, output_dir: Optional[str] = None, workers: Optional[int] = None,
+                   debug: bool = False, use_mmap: bool = False) -> Dict[str, Any]:
+    """
+    Extrait tous les decks .pptx d'un dossier (récursif) avec un pool de processus.
+
+    Chaque deck produit un fichier JSONL (une slide par ligne) sous
+    output_dir/decks, à la même position relative que dans le corpus et sous
+    son nom complet (a.pptx -> decks/a.pptx.jsonl). L'index du corpus
+    (corpus_index.jsonl : deck -> slides -> layouts -> nombre de formes ->
+    sha256) est écrit au fil de l'eau dans l'ordre de découverte. Le nombre de
+    decks en cours est borné : la mémoire reste constante quelle que soit la
+    taille du corpus.
+
+    Args:
+        corpus_dir: Dossier racine du corpus
+        output_dir: Dossier de sortie (défaut: output/corpus)
+        workers: Nombre de processus (défaut: nombre de CPU, 1 = séquentiel)
+        debug: Afficher les journaux de chaque deck
+        use_mmap: Lire les archives par projection mémoire
+
+    Returns:
+        Totaux du corpus (decks, erreurs, slides, octets, durée)
+
+    Raises:
+        NotADirectoryError: corpus_dir n'est pas un dossier
+        ValueError: Plusieurs decks produiraient le même fichier de sortie
+    """
+    if output_dir is None:
+        output_dir = "output/corpus"
+
+    if not os.path.isdir(corpus_dir):
+        raise NotADirectoryError(f"--corpus attend un dossier de decks: {corpus_dir}")
+
+    decks = discover_pptx_files(corpus_dir)
+    decks_dir = os.path.join(output_dir, CORPUS_DECKS_DIR)
+    tasks = []
+    targets = {}
+    for path in decks:
+        relative_path = os.path.relpath(path, corpus_dir)
+        output_path = os.path.join(decks_dir, relative_path + '.jsonl')
+        # Comparaison insensible à la casse : a.pptx et A.pptx se confondent
+        # sur les systèmes de fichiers Windows et macOS
+        target_key = os.path.normcase(output_path).casefold()
+        if target_key in targets:
+            raise ValueError(f"Sortie en conflit pour {targets[target_key]} et {relative_path}: "
+                             f"{output_path}")
+        targets[target_key] = relative_path
+        tasks.append((path, relative_path, output_path, use_mmap))
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if PROFILER.enabled and workers != 1:
+        # Les compteurs de phase ne sont accumulés que dans ce processus
+        print(f"[INFO] Profilage actif: extraction séquentielle dans ce processus")
+        workers = 1
+    workers = max(1, min(workers, len(decks) or 1))
+
+    print(f"[INFO] Corpus: {corpus_dir}")
+    print(f"[INFO] Dossier de sortie: {output_dir}")
+    print(f"[INFO] {len(decks)} decks trouvés ({workers} processus)")
+
+    totals = {'decks': 0, 'errors': 0, 'slides': 0, 'bytes': 0}
+    start = time.perf_counter()
+    last_report = start
+    index_path = os.path.join(output_dir, CORPUS_INDEX_NAME)
+
+    def record(entry, index):
+        """Écrit l'entrée d'index d'un deck terminé et met à jour les totaux."""
+        nonlocal last_report
+
+        if entry['log'] and (debug or entry['error']):
+            print(entry['log'], end='')
+        if entry['error']:
+            totals['errors'] += 1
+            print(f"[WARNING] {entry['deck']}: {entry['error']}")
+
+        elapsed_ms = round(entry.pop('elapsed') * 1000, 1)
+        entry.pop('log')
+        if entry['output']:
+            entry['output'] = os.path.relpath(entry['output'], output_dir)
+        entry['elapsed_ms'] = elapsed_ms
+        index.write(json_backend.dumps(entry, pretty=False))
+        index.write('\n')
+
+        totals['decks'] += 1
+        totals['slides'] += entry['slide_count']
+        totals['bytes'] += entry['size_bytes'] or 0
+
+        now = time.perf_counter()
+        if now - last_report >= CORPUS_PROGRESS_INTERVAL or totals['decks'] == len(decks):
+            last_report = now
+            index.flush()
+            elapsed = max(now - start, 1e-9)
+            rate = totals['decks'] / elapsed
+            remaining = (len(decks) - totals['decks']) / rate if rate else 0
+            print(f"[PROGRESS] {totals['decks']}/{len(decks)} decks "
+                  f"({totals['decks'] * 100 / max(len(decks), 1):.1f}%) - {rate:.1f} decks/s, "
+                  f"{totals['slides'] / elapsed:.1f} slides/s, "
+                  f"{totals['bytes'] / elapsed / (1024 * 1024):.1f} Mo/s - reste ~{remaining:.0f} s")
+
+    with open(index_path, 'w', encoding='utf-8') as index:
+        if workers == 1:
+            for task in tasks:
+                record(_extract_corpus_deck(task), index)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Fenêtre bornée de decks en cours, consommée dans l'ordre de soumission :
+            # index déterministe sans conserver les résultats de tout le corpus
+            window = workers * CORPUS_WINDOW_PER_WORKER
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for task in tasks:
+                    pending.append(executor.submit(_extract_corpus_deck, task, False))
+                    if len(pending) >= window:
+                        record(pending.popleft().result(), index)
+                while pending:
+                    record(pending.popleft().result(), index)
+
+    totals['elapsed'] = time.perf_counter() - start
+    print(f"\n[SUCCESS] {totals['decks'] - totals['errors']}/{totals['decks']} decks extraits, "
+          f"{totals['slides']} slides, index: {index_path}")
+    print(f"[TIMING] Total: {totals['elapsed']:.2f} s "
+          f"({totals['slides'] / max(totals['elapsed'], 1e-9):.1f} slides/s, {workers} processus)")
+
+    return totals
+
+
 def main():
     """Point d'entrée principal du script."""
     parser = argparse.ArgumentParser(
@@ -2636,19 +3914,37 @@ Exemples d'utilisation:
   # Extraire une slide spécifique
   python tools/slide_extractor.py presentation.pptx --slide-number 11
   python tools/slide_extractor.py presentation.pptx --slide-number 11 --output slide_11.json
+  python tools/slide_extractor.py presentation.pptx --slide-number 11 --output slide_11.json --compact
 
   # Extraire avec nommage automatique selon layout
   python tools/slide_extractor.py presentation.pptx --slide-number 11 --auto-name
 
   # Régénérer toutes les structures de template
   python tools/slide_extractor.py templates/Template_PT.pptx --regenerate-all
+  python tools/slide_extractor.py templates/Template_PT.pptx --regenerate-all --workers 8
+  python tools/slide_extractor.py templates/Template_PT.pptx --regenerate-all --force
+  python tools/slide_extractor.py templates/Template_PT.pptx --regenerate-all --mmap --workers 8
+
+  # Extraire toutes les slides en flux JSONL (stdout ou fichier)
+  python tools/slide_extractor.py presentation.pptx --all-slides
+  python tools/slide_extractor.py presentation.pptx --all-slides --output slides.jsonl
+
+  # Extraire une sélection de slides
+  python tools/slide_extractor.py presentation.pptx --slides 3-17,22 --output selection.jsonl
+
+  # Extraire tout un corpus de decks (JSONL par deck + index)
+  python tools/slide_extractor.py presentations/ --corpus --output-dir output/corpus --workers 8
 
   # Debug détaillé
   python tools/slide_extractor.py presentation.pptx --slide-number 11 --debug
+
+  # Profilage par phase et profil cProfile
+  python tools/slide_extractor.py presentation.pptx --all-slides --output slides.jsonl --profile
+  python tools/slide_extractor.py presentation.pptx --regenerate-all --cprofile out.prof
         """
     )
 
-    parser.add_argument("pptx_file", help="Chemin vers le fichier .pptx")
+    parser.add_argument("pptx_file", help="Chemin vers le fichier .pptx (dossier avec --corpus)")
 
     # Groupe mutuellement exclusif pour slide-number vs regenerate-all
     action_group = parser.add_mutually_exclusive_group(required=True)
@@ -2656,13 +3952,35 @@ Exemples d'utilisation:
                              help="Numéro de la slide à extraire (commence à 1)")
     action_group.add_argument("--regenerate-all", action="store_true",
                              help="Régénérer toutes les structures de layout du template")
-
-    parser.add_argument("--output", help="Chemin du fichier JSON de sortie")
-    parser.add_argument("--output-dir", help="Dossier de sortie pour --regenerate-all")
+    action_group.add_argument("--all-slides", action="store_true",
+                             help="Extraire toutes les slides en flux JSONL (stdout ou --output)")
+    action_group.add_argument("--slides",
+                             help="Extraire une sélection de slides en flux JSONL (ex: 3-17,22)")
+    action_group.add_argument("--corpus", action="store_true",
+                             help="Traiter pptx_file comme un dossier : extraire récursivement tous "
+                                  "ses decks (decks/<deck>.pptx.jsonl + corpus_index.jsonl)")
+
+    parser.add_argument("--output", help="Chemin du fichier JSON de sortie (.jsonl pour --all-slides/--slides)")
+    parser.add_argument("--output-dir", help="Dossier de sortie pour --regenerate-all et --corpus")
+    parser.add_argument("--force", action="store_true",
+                       help="Ignorer le manifeste et tout régénérer avec --regenerate-all")
+    parser.add_argument("--workers", type=int,
+                       help="Nombre de processus pour --regenerate-all et --corpus (défaut: nombre de CPU)")
+    parser.add_argument("--compact", action="store_true",
+                       help="JSON compact (sans indentation) pour --slide-number et --regenerate-all ; "
+                            "les flux JSONL sont toujours compacts")
+    parser.add_argument("--mmap", action="store_true",
+                       help="Lire l'archive par projection mémoire (decks volumineux) ; les workers "
+                            "de --regenerate-all partagent alors le package par fork")
     parser.add_argument("--auto-name", action="store_true",
                        help="Générer automatiquement le nom de fichier selon layout_name")
     parser.add_argument("--debug", action="store_true",
                        help="Affichage des informations de debug détaillées")
+    parser.add_argument("--profile", nargs="?", const="slide_extractor_profile.json",
+                       help="Chronométrer les phases (zip, XML, styles, formes, écriture) et "
+                            "sauvegarder le JSON (défaut: slide_extractor_profile.json)")
+    parser.add_argument("--cprofile", metavar="FICHIER",
+                       help="Envelopper l'exécution dans cProfile et sauvegarder les stats (ex: out.prof)")
 
     args = parser.parse_args()
 
@@ -2671,22 +3989,78 @@ Exemples d'utilisation:
         print(f"[ERROR] Fichier non trouvé : {args.pptx_file}")
         sys.exit(1)
 
+    profiler = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if args.profile:
+        PROFILER.enable()
+
+    try:
+        run_extraction(args)
+
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+            print(f"[PROFILE] Profil cProfile sauvegardé dans {args.cprofile}", file=sys.stderr)
+        if args.profile:
+            write_profile_report(args.profile)
+
+
+def write_profile_report(output_file: str):
+    """
+    Affiche le tableau des phases sur stderr et sauvegarde le JSON du profil.
+
+    Args:
+        output_file: Fichier JSON de sortie du profil
+    """
+    PROFILER.disable()
+    print(f"\n[PROFILE] Temps par phase:", file=sys.stderr)
+    print(PROFILER.summary_table(), file=sys.stderr)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json_backend.dump({'phases': PROFILER.to_dict()}, f)
+    print(f"[PROFILE] Profil JSON sauvegardé dans {output_file}", file=sys.stderr)
+
+
+def run_extraction(args: argparse.Namespace):
+    """
+    Exécute le mode d'extraction demandé en ligne de commande.
+
+    Args:
+        args: Arguments parsés par main()
+    """
     try:
         # Mode régénération de tous les layouts
         if args.regenerate_all:
             output_dir = args.output_dir or "templates/presentation-project/slide-structure"
-            regenerate_all_layouts(args.pptx_file, output_dir, args.debug)
+            regenerate_all_layouts(args.pptx_file, output_dir, args.debug, args.workers, args.force,
+                                   args.compact, args.mmap)
+            return
+
+        # Mode corpus (dossier de decks)
+        if args.corpus:
+            extract_corpus(args.pptx_file, args.output_dir, args.workers, args.debug, args.mmap)
+            return
+
+        # Mode flux JSONL (toutes les slides ou sélection)
+        if args.all_slides or args.slides:
+            slide_numbers = parse_slide_selection(args.slides) if args.slides else None
+            stream_slides_jsonl(args.pptx_file, args.output, slide_numbers, args.debug, args.mmap)
             return
 
         # Mode extraction d'une slide spécifique
         if args.debug:
             print(f"[DEBUG] Ouverture de {args.pptx_file}")
             print(f"[DEBUG] lxml disponible: {LXML_AVAILABLE}")
+            print(f"[DEBUG] Backend JSON: {json_backend.BACKEND}")
 
         package = None
         try:
             # Initialiser le package
-            package = PPTXPackage(args.pptx_file)
+            package = PPTXPackage(args.pptx_file, use_mmap=args.mmap)
 
             # Trouver la partie slide
             slide_part_name = find_slide_part_name(package, args.slide_number)
@@ -2718,11 +4092,12 @@ Exemples d'utilisation:
 
             # Sortie des résultats
             if output_file:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                with PROFILER.phase('output_write'), open(output_file, 'w', encoding='utf-8') as f:
+                    json_backend.dump(metadata, f, pretty=not args.compact)
                 print(f"[SUCCESS] Métadonnées sauvegardées dans {output_file}")
             else:
-                print(json.dumps(metadata, indent=2, ensure_ascii=False))
+                with PROFILER.phase('output_write'):
+                    print(json_backend.dumps(metadata, pretty=not args.compact))
 
             # Affichage du résumé
             print(f"\n[INFO] Slide {args.slide_number} - Layout: {metadata.get('layout_name', 'Unknown')}")
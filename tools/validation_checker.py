@@ -10,7 +10,7 @@ respectent fidèlement leurs schémas de configuration.
 Workflow:
 1. Prend en entrée un chemin d'audience et un numéro de slide
 2. Trouve et parse le config.json associé
-3. Exécute slide_extractor.py sur la présentation générée
+3. Extrait la slide de la présentation générée (API slide_extractor, en processus)
 4. Compare shape par shape chaque configuration
 5. Génère un rapport détaillé des résultats
 
@@ -20,14 +20,14 @@ Usage:
 
 import os
 import sys
-import json
 import argparse
-import subprocess
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+import json_backend
+from slide_extractor import PPTXPackage, extract_slides
+
 
 class PresentationValidator:
     """
@@ -37,13 +37,36 @@ class PresentationValidator:
     de la présentation PowerPoint pour détecter les écarts de conformité.
     """
 
+    # Icônes de statut des rapports Markdown
+    STATUS_ICONS = {
+        "CONFORME": "✅",
+        "PARTIELLEMENT_CONFORME": "⚠️",
+        "NON_CONFORME": "❌",
+        "ERROR": "💥",
+        "WARNING": "⚠️"
+    }
+
+    # Recommandations ajoutées aux rapports non conformes
+    RECOMMENDATIONS = """## 🔧 Recommandations
+- Vérifier la configuration des shapes non conformes dans le schéma JSON
+- S'assurer que les propriétés utilisent les valeurs Premier Tech valides
+- Contrôler que le layout_name correspond au bon template
+- Régénérer la présentation après correction du schéma
+
+"""
+
     def __init__(self):
         """Initialise le validateur avec les chemins de base."""
         self.script_dir = Path(__file__).parent
-        self.slide_extractor_path = self.script_dir / "slide_extractor.py"
 
-        if not self.slide_extractor_path.exists():
-            raise FileNotFoundError(f"slide_extractor.py non trouvé: {self.slide_extractor_path}")
+        # Packages PPTX ouverts, partagés entre les slides d'une même présentation
+        self._packages: Dict[str, Tuple[Tuple[int, int], PPTXPackage]] = {}
+
+    def close(self):
+        """Ferme les packages PPTX ouverts par le validateur."""
+        for _, package in self._packages.values():
+            package.close()
+        self._packages.clear()
 
     def validate_slide(self, audience_path: str, slide_number: int) -> Dict[str, Any]:
         """
@@ -125,6 +148,134 @@ class PresentationValidator:
                 "timestamp": datetime.now().isoformat()
             }
 
+    def validate_presentation(self, audience_path: str) -> Dict[str, Any]:
+        """
+        Valide toutes les slides d'une présentation en une seule passe.
+
+        Le schéma et la présentation ne sont ouverts qu'une fois, toutes les
+        slides sont extraites d'un seul parcours du package, puis un rapport
+        consolidé unique est généré.
+
+        Args:
+            audience_path: Chemin vers le dossier d'audience
+
+        Returns:
+            Dict: Résultats par slide et statistiques globales
+        """
+        try:
+            print(f"[VALIDATION] Démarrage validation complète")
+            print(f"[VALIDATION] Chemin audience: {audience_path}")
+
+            # 1. Charger le schéma une seule fois
+            schema_data = self._load_presentation_schema(audience_path)
+            presentation_name = schema_data.get("presentation_name", "Unknown")
+            output_path = schema_data.get("output_path", "")
+            schema_slides = schema_data.get("slides", [])
+
+            print(f"[SCHEMA] Présentation: {presentation_name}")
+            print(f"[SCHEMA] Slides dans le schéma: {len(schema_slides)}")
+
+            # 2. Trouver la présentation générée
+            presentation_path = self._resolve_presentation_path(audience_path, output_path)
+            if not presentation_path or not os.path.exists(presentation_path):
+                return {
+                    "status": "ERROR",
+                    "message": f"Présentation non trouvée: {presentation_path}",
+                    "timestamp": datetime.now().isoformat()
+                }
+
+            print(f"[PRESENTATION] Fichier trouvé: {presentation_path}")
+
+            # 3. Extraire toutes les slides en un seul parcours
+            package = self._get_package(presentation_path)
+            presentation_slide_count = len(package.get_slide_parts())
+            extracted_slides = extract_slides(package, list(range(1, len(schema_slides) + 1)))
+
+            print(f"[EXTRACTION] {len(extracted_slides)}/{len(schema_slides)} slides extraites "
+                  f"(présentation: {presentation_slide_count} slides)")
+
+            # 4. Comparer slide par slide
+            slide_reports = []
+            for slide_number, schema_slide in enumerate(schema_slides, start=1):
+                extracted_slide = extracted_slides.get(slide_number)
+                if extracted_slide is None:
+                    slide_reports.append({
+                        "status": "ERROR",
+                        "slide_number": slide_number,
+                        "layout_name": schema_slide.get("layout_name", "Unknown"),
+                        "message": f"Impossible d'extraire la slide {slide_number}"
+                    })
+                    continue
+
+                comparison_results = self._compare_configurations(schema_slide, extracted_slide)
+                slide_reports.append({
+                    "status": self._determine_overall_status(comparison_results),
+                    "slide_number": slide_number,
+                    "layout_name": schema_slide.get("layout_name", extracted_slide.get("layout_name", "Unknown")),
+                    "comparison_results": comparison_results,
+                    "summary": self._generate_summary(comparison_results)
+                })
+
+            # 5. Statistiques globales sur l'ensemble des shapes comparées
+            deck_comparison = self._merge_comparisons(
+                [report["comparison_results"] for report in slide_reports if "comparison_results" in report]
+            )
+            status_counts = {}
+            for report in slide_reports:
+                status_counts[report["status"]] = status_counts.get(report["status"], 0) + 1
+
+            overall_status = self._determine_overall_status(deck_comparison)
+            if status_counts.get("ERROR"):
+                overall_status = "ERROR" if len(slide_reports) == status_counts["ERROR"] else "NON_CONFORME"
+
+            report_data = {
+                "status": overall_status,
+                "presentation_name": presentation_name,
+                "audience_path": audience_path,
+                "presentation_path": presentation_path,
+                "timestamp": datetime.now().isoformat(),
+                "schema_slide_count": len(schema_slides),
+                "presentation_slide_count": presentation_slide_count,
+                "status_counts": status_counts,
+                "statistics": deck_comparison["statistics"],
+                "summary": self._generate_summary(deck_comparison),
+                "slides": slide_reports
+            }
+            if overall_status == "ERROR":
+                report_data["message"] = (f"{status_counts.get('ERROR', 0)}/{len(slide_reports)} "
+                                          f"slides en erreur")
+
+            # 6. Sauvegarder le rapport consolidé
+            self._save_presentation_report(report_data, audience_path)
+
+            return report_data
+
+        except Exception as e:
+            return {
+                "status": "ERROR",
+                "message": f"Erreur validation: {e}",
+                "timestamp": datetime.now().isoformat()
+            }
+
+    def _merge_comparisons(self, comparisons: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fusionne les comparaisons de plusieurs slides pour les statistiques globales."""
+        merged = {
+            "shapes_comparison": [],
+            "statistics": {
+                "total_shapes": 0,
+                "conforming_shapes": 0,
+                "non_conforming_shapes": 0,
+                "missing_shapes": 0
+            }
+        }
+
+        for comparison in comparisons:
+            merged["shapes_comparison"].extend(comparison["shapes_comparison"])
+            for key in merged["statistics"]:
+                merged["statistics"][key] += comparison["statistics"][key]
+
+        return merged
+
     def _load_presentation_schema(self, audience_path: str) -> Dict[str, Any]:
         """Charge le fichier config.json."""
         schema_path = os.path.join(audience_path, "config.json")
@@ -133,7 +284,7 @@ class PresentationValidator:
             raise FileNotFoundError(f"Schema non trouvé: {schema_path}")
 
         with open(schema_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return json_backend.load(f)
 
     def _find_slide_in_schema(self, schema_data: Dict[str, Any], slide_number: int) -> Optional[Dict[str, Any]]:
         """Trouve la slide correspondante dans le schéma."""
@@ -168,36 +319,36 @@ class PresentationValidator:
 
         return None
 
-    def _extract_slide_from_presentation(self, presentation_path: str, slide_number: int) -> Optional[Dict[str, Any]]:
-        """Utilise slide_extractor.py pour extraire les métadonnées de la slide."""
-        try:
-            # Créer un fichier temporaire pour la sortie
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                temp_output = temp_file.name
-
-            # Exécuter slide_extractor.py
-            cmd = [
-                sys.executable,
-                str(self.slide_extractor_path),
-                presentation_path,
-                "--slide-number", str(slide_number),
-                "--output", temp_output
-            ]
+    def _get_package(self, presentation_path: str) -> PPTXPackage:
+        """
+        Retourne le package PPTX partagé d'une présentation.
 
-            print(f"[EXTRACTION] Commande: {' '.join(cmd)}")
+        Le package est rouvert si le fichier a changé sur disque (mtime, taille).
+        """
+        key = os.path.abspath(presentation_path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+        cached = self._packages.get(key)
+        if cached is not None:
+            cached_signature, package = cached
+            if cached_signature == signature:
+                return package
+            package.close()
 
-            if result.returncode != 0:
-                print(f"[ERROR] Échec extraction: {result.stderr}")
-                return None
+        package = PPTXPackage(key)
+        self._packages[key] = (signature, package)
+        return package
 
-            # Charger les métadonnées extraites
-            with open(temp_output, 'r', encoding='utf-8') as f:
-                extracted_data = json.load(f)
+    def _extract_slide_from_presentation(self, presentation_path: str, slide_number: int) -> Optional[Dict[str, Any]]:
+        """Utilise l'API de slide_extractor pour extraire les métadonnées de la slide."""
+        try:
+            package = self._get_package(presentation_path)
+            extracted_data = extract_slides(package, [slide_number]).get(slide_number)
 
-            # Nettoyer le fichier temporaire
-            os.unlink(temp_output)
+            if extracted_data is None:
+                print(f"[ERROR] Échec extraction: slide {slide_number} absente de {presentation_path}")
+                return None
 
             print(f"[EXTRACTION] Slide extraite: {extracted_data.get('layout_name', 'Unknown')}")
             print(f"[EXTRACTION] Shapes trouvées: {extracted_data.get('total_shapes', 0)}")
@@ -418,35 +569,20 @@ class PresentationValidator:
 
         print(f"[REPORT] Rapport sauvegardé: {report_path}")
 
-    def _generate_markdown_report(self, report_data: Dict[str, Any]) -> str:
-        """Génère le contenu Markdown du rapport de validation."""
-        status = report_data["status"]
-        summary = report_data["summary"]
-        comparison = report_data["comparison_results"]
-
-        # Déterminer l'icône de statut
-        status_icons = {
-            "CONFORME": "✅",
-            "PARTIELLEMENT_CONFORME": "⚠️",
-            "NON_CONFORME": "❌",
-            "ERROR": "💥",
-            "WARNING": "⚠️"
-        }
-
-        status_icon = status_icons.get(status, "❓")
-
-        content = f"""# Rapport de Validation - {report_data["presentation_name"]} - Slide {report_data["slide_number"]}
-
-## 📊 Résumé Exécutif
-- {status_icon} **Status** : {status}
-- **Layout** : {report_data.get("layout_name", "Unknown")}
-- **Shapes validés** : {comparison["statistics"]["conforming_shapes"]}/{comparison["statistics"]["total_shapes"]} ({summary["shapes_conformity_rate"]:.1%})
-- **Propriétés validées** : {summary["properties_conformity_rate"]:.1%}
-- **Score qualité** : {summary["quality_score"]:.1f}%
+    def _generate_shapes_markdown(self, comparison: Dict[str, Any], heading_level: int = 3) -> str:
+        """
+        Génère les détails Markdown shape par shape d'une comparaison.
 
-## 🔍 Détails par Shape
+        Args:
+            comparison: Résultats de _compare_configurations
+            heading_level: Niveau de titre des shapes (les catégories sont au niveau suivant)
 
-"""
+        Returns:
+            str: Contenu Markdown
+        """
+        shape_heading = "#" * heading_level
+        category_heading = "#" * (heading_level + 1)
+        content = ""
 
         # Détails pour chaque shape
         for shape_comp in comparison["shapes_comparison"]:
@@ -456,7 +592,7 @@ class PresentationValidator:
             conformity_score = shape_comp.get("conformity_score", 0)
 
             if not found:
-                content += f"### Shape {shape_id} - {shape_name}\n"
+                content += f"{shape_heading} Shape {shape_id} - {shape_name}\n"
                 content += f"❌ **Shape manquante** : Non trouvée dans la présentation générée\n\n"
                 continue
 
@@ -468,7 +604,7 @@ class PresentationValidator:
             else:
                 shape_icon = "❌"
 
-            content += f"### Shape {shape_id} - {shape_name}\n"
+            content += f"{shape_heading} Shape {shape_id} - {shape_name}\n"
             content += f"{shape_icon} **Conformité** : {conformity_score:.1%}\n\n"
 
             # Détails des propriétés
@@ -488,7 +624,7 @@ class PresentationValidator:
                 if not category_props:
                     continue
 
-                content += f"#### {category}\n"
+                content += f"{category_heading} {category}\n"
                 for prop_name, prop_data in category_props.items():
                     expected = prop_data["expected"]
                     found = prop_data["found"]
@@ -506,6 +642,32 @@ class PresentationValidator:
 
                 content += "\n"
 
+        return content
+
+    def _generate_markdown_report(self, report_data: Dict[str, Any]) -> str:
+        """Génère le contenu Markdown du rapport de validation."""
+        status = report_data["status"]
+        summary = report_data["summary"]
+        comparison = report_data["comparison_results"]
+
+        # Déterminer l'icône de statut
+        status_icon = self.STATUS_ICONS.get(status, "❓")
+
+        content = f"""# Rapport de Validation - {report_data["presentation_name"]} - Slide {report_data["slide_number"]}
+
+## 📊 Résumé Exécutif
+- {status_icon} **Status** : {status}
+- **Layout** : {report_data.get("layout_name", "Unknown")}
+- **Shapes validés** : {comparison["statistics"]["conforming_shapes"]}/{comparison["statistics"]["total_shapes"]} ({summary["shapes_conformity_rate"]:.1%})
+- **Propriétés validées** : {summary["properties_conformity_rate"]:.1%}
+- **Score qualité** : {summary["quality_score"]:.1f}%
+
+## 🔍 Détails par Shape
+
+"""
+
+        content += self._generate_shapes_markdown(comparison, heading_level=3)
+
         # Métriques de qualité
         content += f"""## 📈 Métriques de Qualité
 - **Fidélité shapes** : {summary["shapes_conformity_rate"]:.1%}
@@ -522,14 +684,85 @@ class PresentationValidator:
 
         # Recommandations si des problèmes sont détectés
         if status != "CONFORME":
-            content += """## 🔧 Recommandations
-- Vérifier la configuration des shapes non conformes dans le schéma JSON
-- S'assurer que les propriétés utilisent les valeurs Premier Tech valides
-- Contrôler que le layout_name correspond au bon template
-- Régénérer la présentation après correction du schéma
+            content += self.RECOMMENDATIONS
+
+        return content
+
+    def _save_presentation_report(self, report_data: Dict[str, Any], audience_path: str):
+        """Sauvegarde le rapport de validation consolidé en format Markdown."""
+        tests_dir = os.path.join(audience_path, "tests")
+        os.makedirs(tests_dir, exist_ok=True)
+
+        presentation_name = report_data["presentation_name"].replace(" ", "_").replace("-", "_")
+        report_path = os.path.join(tests_dir, f"report_{presentation_name}_all.md")
+
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(self._generate_presentation_markdown_report(report_data))
+
+        print(f"[REPORT] Rapport consolidé sauvegardé: {report_path}")
+
+    def _generate_presentation_markdown_report(self, report_data: Dict[str, Any]) -> str:
+        """Génère le contenu Markdown du rapport de validation consolidé."""
+        status = report_data["status"]
+        summary = report_data["summary"]
+        statistics = report_data["statistics"]
+        status_icon = self.STATUS_ICONS.get(status, "❓")
+
+        content = f"""# Rapport de Validation - {report_data["presentation_name"]} - Présentation complète
 
+## 📊 Résumé Exécutif
+- {status_icon} **Status** : {status}
+- **Slides validées** : {len(report_data["slides"])} (schéma: {report_data["schema_slide_count"]}, présentation: {report_data["presentation_slide_count"]})
+- **Shapes validés** : {statistics["conforming_shapes"]}/{statistics["total_shapes"]} ({summary["shapes_conformity_rate"]:.1%})
+- **Propriétés validées** : {summary["properties_conformity_rate"]:.1%}
+- **Score qualité** : {summary["quality_score"]:.1f}%
+
+## 📋 Vue d'ensemble
+
+| Slide | Layout | Status | Shapes | Score |
+|-------|--------|--------|--------|-------|
 """
 
+        for slide in report_data["slides"]:
+            slide_icon = self.STATUS_ICONS.get(slide["status"], "❓")
+            if "summary" in slide:
+                slide_stats = slide["comparison_results"]["statistics"]
+                shapes = f'{slide_stats["conforming_shapes"]}/{slide_stats["total_shapes"]}'
+                score = f'{slide["summary"]["quality_score"]:.1f}%'
+            else:
+                shapes, score = "-", "-"
+            content += f'| {slide["slide_number"]} | {slide["layout_name"]} | {slide_icon} {slide["status"]} | {shapes} | {score} |\n'
+
+        content += "\n## 🔍 Détails par Slide\n\n"
+
+        for slide in report_data["slides"]:
+            slide_icon = self.STATUS_ICONS.get(slide["status"], "❓")
+            content += f'### Slide {slide["slide_number"]} - {slide["layout_name"]}\n'
+            content += f'{slide_icon} **Status** : {slide["status"]}\n\n'
+
+            if "message" in slide:
+                content += f'💥 **Erreur** : {slide["message"]}\n\n'
+                continue
+
+            content += self._generate_shapes_markdown(slide["comparison_results"], heading_level=4)
+
+        content += f"""## 📈 Métriques de Qualité
+- **Fidélité shapes** : {summary["shapes_conformity_rate"]:.1%}
+- **Fidélité propriétés** : {summary["properties_conformity_rate"]:.1%}
+- **Issues totales** : {summary["total_issues"]}
+- **Score global** : {summary["quality_score"]:.1f}%
+- **Slides par status** : {", ".join(f"{name}: {count}" for name, count in sorted(report_data["status_counts"].items()))}
+
+## 🛠️ Informations Techniques
+- **Fichier schéma** : {report_data["audience_path"]}/config.json
+- **Présentation générée** : {report_data["presentation_path"]}
+- **Validation effectuée** : {report_data["timestamp"]}
+
+"""
+
+        if status != "CONFORME":
+            content += self.RECOMMENDATIONS
+
         return content
 
 
@@ -542,18 +775,28 @@ def main():
 Exemples d'utilisation:
   python tools/validation_checker.py "tests\\ia-generative-integration\\technique" 1
   python tools/validation_checker.py "presentations\\mon-sujet\\c-level" 2
+  python tools/validation_checker.py "presentations\\mon-sujet\\c-level" --all
         """
     )
 
     parser.add_argument("audience_path", help="Chemin vers le dossier d'audience")
-    parser.add_argument("slide_number", type=int, help="Numéro de la slide à valider (1-based)")
+    parser.add_argument("slide_number", type=int, nargs="?", help="Numéro de la slide à valider (1-based)")
+    parser.add_argument("--all", action="store_true",
+                        help="Valider toutes les slides et générer un rapport consolidé")
     parser.add_argument("--verbose", action="store_true", help="Affichage détaillé")
 
     args = parser.parse_args()
 
+    if args.all == (args.slide_number is not None):
+        parser.error("indiquer soit un numéro de slide, soit --all")
+
+    validator = None
     try:
         validator = PresentationValidator()
-        results = validator.validate_slide(args.audience_path, args.slide_number)
+        if args.all:
+            results = validator.validate_presentation(args.audience_path)
+        else:
+            results = validator.validate_slide(args.audience_path, args.slide_number)
 
         # Affichage des résultats
         status = results.get("status", "ERROR")
@@ -566,6 +809,9 @@ Exemples d'utilisation:
             print(f"Conformité shapes: {summary['shapes_conformity_rate']:.1%}")
             print(f"Conformité propriétés: {summary['properties_conformity_rate']:.1%}")
 
+        for slide in results.get("slides", []):
+            print(f"  Slide {slide['slide_number']}: {slide['status']} ({slide['layout_name']})")
+
         if status == "ERROR":
             print(f"Erreur: {results.get('message', 'Erreur inconnue')}")
             sys.exit(1)
@@ -574,6 +820,10 @@ Exemples d'utilisation:
         print(f"[ERROR] Erreur validation: {e}")
         sys.exit(1)
 
+    finally:
+        if validator:
+            validator.close()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()